@@ -0,0 +1,134 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-libs-qt notification manager
+"""
+
+import pytest
+
+QtCore = pytest.importorskip('Qt.QtCore')
+
+from tpDcc.libs.qt.core import notifications
+
+
+class _StubMessage(object):
+    """
+    Message widget that implements notification manager interface without creating any Qt widget
+    """
+
+    DEFAULT_CONFIG = {'duration': 60}
+    NOTIFICATION_MAX_VISIBLE = 3
+    FADE_DURATION = 0
+
+    created = 0
+
+    def __init__(self, text):
+        self.text = text
+        self.repeat = 1
+        self.visible = False
+
+    @classmethod
+    def create_notification(cls, text, theme_type, closable, parent):
+        cls.created += 1
+        return cls(text)
+
+    def reset_notification(self, text, closable, parent):
+        self.text = text
+        self.repeat = 1
+
+    def set_repeat_count(self, count):
+        self.repeat = count
+
+    def place(self, parent, index):
+        pass
+
+    def fade_in(self):
+        pass
+
+    def fade_out(self):
+        pass
+
+    def notification_released(self):
+        pass
+
+    def show(self):
+        self.visible = True
+
+    def hide(self):
+        self.visible = False
+
+    def isVisible(self):
+        return self.visible
+
+    def windowFlags(self):
+        return 0
+
+    def setParent(self, parent, flags=None):
+        pass
+
+    def deleteLater(self):
+        pass
+
+
+@pytest.fixture
+def manager():
+    QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    _StubMessage.created = 0
+    notification_manager = notifications.NotificationManager(max_visible=5, max_queued=50, max_pooled=3)
+    yield notification_manager
+    notification_manager.clear()
+
+
+def test_rapid_posts_create_bounded_widgets(manager):
+    parent = object()
+    handles = [manager.post(_StubMessage, 'Message {}'.format(i), parent) for i in range(1000)]
+
+    assert all(handle is not None for handle in handles)
+    assert _StubMessage.created == _StubMessage.NOTIFICATION_MAX_VISIBLE
+    stats = manager.stats()
+    assert stats['visible'] == _StubMessage.NOTIFICATION_MAX_VISIBLE
+    assert stats['queued'] == manager.max_queued
+    assert stats['dropped'] == 1000 - _StubMessage.NOTIFICATION_MAX_VISIBLE - manager.max_queued
+    assert len([handle for handle in handles if handle.is_closed]) == stats['dropped']
+
+
+def test_identical_posts_are_merged(manager):
+    parent = object()
+    handles = [manager.post(_StubMessage, 'Same message', parent) for _ in range(1000)]
+
+    assert _StubMessage.created == 1
+    assert manager.stats()['merged'] == 999
+    assert len(set(handle.widget for handle in handles)) == 1
+    assert handles[0].widget.repeat == 1000
+
+
+def test_released_widgets_are_reused(manager):
+    parent = object()
+    closed = list()
+    for i in range(1000):
+        handle = manager.post(_StubMessage, 'Message {}'.format(i), parent)
+        handle.closed.connect(lambda index=i: closed.append(index))
+        handle.dismiss()
+        manager.tick()
+
+    stats = manager.stats()
+    assert _StubMessage.created <= _StubMessage.NOTIFICATION_MAX_VISIBLE + manager.max_pooled
+    assert stats['alive'] <= _StubMessage.NOTIFICATION_MAX_VISIBLE + manager.max_pooled
+    assert len(closed) == 1000
+
+
+def test_queued_message_can_be_dismissed(manager):
+    parent = object()
+    for i in range(_StubMessage.NOTIFICATION_MAX_VISIBLE):
+        manager.post(_StubMessage, 'Message {}'.format(i), parent)
+    handle = manager.post(_StubMessage, 'Queued message', parent)
+
+    assert handle.widget is None
+    closed = list()
+    handle.closed.connect(lambda: closed.append(True))
+    handle.dismiss()
+
+    assert handle.is_closed
+    assert closed == [True]
+    assert manager.stats()['queued'] == 0
@@ -3,15 +3,20 @@
 
 """
 Initialization module for tpDcc-libs-qt
+Logging configuration and QApplication creation are deferred until they are used for the first time, so importing
+a single widget module does not pay the full library startup cost
 """
 
 from __future__ import print_function, division, absolute_import
 
 import os
 import sys
-import logging.config
+import logging
+import importlib
 
-from Qt.QtWidgets import QApplication
+LIB_ID = 'tpDcc-libs-qt'
+
+_LAZY_SUBMODULES = ('core', 'widgets', 'managers')
 
 
 def create_logger(dev=False):
@@ -19,6 +24,8 @@ def create_logger(dev=False):
     Creates logger for current tpDcc-libs-qt package
     """
 
+    import logging.config
+
     logger_directory = os.path.normpath(os.path.join(os.path.expanduser('~'), 'tpDcc', 'logs', 'libs'))
     if not os.path.isdir(logger_directory):
         os.makedirs(logger_directory)
@@ -26,7 +33,7 @@ def create_logger(dev=False):
     logging_config = os.path.normpath(os.path.join(os.path.dirname(__file__), '__logging__.ini'))
 
     logging.config.fileConfig(logging_config, disable_existing_loggers=False)
-    logger = logging.getLogger('tpDcc-libs-qt')
+    logger = logging.getLogger(LIB_ID)
     dev = os.getenv('TPDCC_DEV', dev)
     if dev:
         logger.setLevel(logging.DEBUG)
@@ -36,6 +43,70 @@ def create_logger(dev=False):
     return logger
 
 
-create_logger()
+class _DeferredLoggerHandler(logging.Handler, object):
+    """
+    Placeholder handler that configures tpDcc-libs-qt logger when the first record is emitted
+    Configuring the logger removes this handler, so the record is dispatched again through the final handlers
+    """
+
+    def emit(self, record):
+        # Logger handlers list is replaced (not modified) because it is being iterated by the logger right now
+        logging.getLogger(LIB_ID).handlers = list()
+        logger = create_logger()
+        if record.levelno >= logger.getEffectiveLevel():
+            logger.handle(record)
+
+
+def install_deferred_logger():
+    """
+    Installs a placeholder handler in tpDcc-libs-qt logger that creates the logger the first time it is used
+    """
+
+    logger = logging.getLogger(LIB_ID)
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(_DeferredLoggerHandler())
+
+    return logger
+
+
+def get_app():
+    """
+    Returns current QApplication instance, creating it if it does not exist yet
+    :return: QApplication
+    """
+
+    from Qt.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    globals()['app'] = app
+
+    return app
+
+
+def __getattr__(name):
+    """
+    Module level attribute access used to load QApplication and sub packages on demand (Python 3.7+)
+    :param name: str
+    :return: object
+    """
+
+    if name == 'app':
+        return get_app()
+    elif name in _LAZY_SUBMODULES:
+        return importlib.import_module('{}.{}'.format(__name__, name))
+
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(list(globals().keys()) + list(_LAZY_SUBMODULES) + ['app']))
+
+
+install_deferred_logger()
 
-app = QApplication.instance() or QApplication(sys.argv)
+# Module level __getattr__ is not supported in old Python versions, so we keep eager QApplication creation there
+if sys.version_info[:2] < (3, 7):
+    app = get_app()
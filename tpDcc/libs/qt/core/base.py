@@ -7,8 +7,8 @@ Module that contains base functionality for Qt widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Property, Signal, Property
-from Qt.QtWidgets import QApplication, QSizePolicy, QWidget, QFrame, QScrollArea, QWhatsThis
+from Qt.QtCore import Qt, Property, Signal, Property, QTimer
+from Qt.QtWidgets import QApplication, QSizePolicy, QWidget, QFrame, QScrollArea, QWhatsThis, QLayout
 
 from tpDcc.libs.resources.core import theme
 from tpDcc.libs.qt.core import qtutils, contexts as qt_contexts
@@ -246,6 +246,154 @@ class ContainerWidget(QWidget, object):
         return cloned
 
 
+class LazyWidget(QWidget, object):
+    """
+    Widget whose contents are built by a factory the first time the widget is shown
+    If an unload timeout is defined, contents are destroyed once the widget stays hidden longer than that timeout
+    and they are built again the next time the widget is shown
+    """
+
+    contentsLoaded = Signal(object)
+    contentsUnloaded = Signal()
+
+    def __init__(self, factory, unload_timeout=None, parent=None):
+        super(LazyWidget, self).__init__(parent)
+
+        self._factory = factory
+        self._contents = None
+        self._unload_timer = None
+
+        self.main_layout = layouts.VerticalLayout(spacing=0, margins=(0, 0, 0, 0))
+        self.setLayout(self.main_layout)
+
+        self.set_unload_timeout(unload_timeout)
+
+    # =================================================================================================================
+    # OVERRIDES
+    # =================================================================================================================
+
+    def showEvent(self, event):
+        if self._unload_timer:
+            self._unload_timer.stop()
+        self.load()
+        super(LazyWidget, self).showEvent(event)
+
+    def hideEvent(self, event):
+        if self._unload_timer and self._contents is not None and not event.spontaneous():
+            self._unload_timer.start()
+        super(LazyWidget, self).hideEvent(event)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def is_loaded(self):
+        """
+        Returns whether contents are already built
+        :return: bool
+        """
+
+        return self._contents is not None
+
+    def contents(self, load=False):
+        """
+        Returns built contents
+        :param load: bool, whether contents should be built if they are not built yet
+        :return: QWidget or QLayout or None
+        """
+
+        if load:
+            self.load()
+
+        return self._contents
+
+    def load(self):
+        """
+        Builds contents using the factory if they are not built yet
+        :return: QWidget or QLayout or None
+        """
+
+        if self._contents is not None:
+            return self._contents
+
+        contents = self._factory()
+        if contents is None:
+            return None
+        if isinstance(contents, QLayout):
+            self.main_layout.addLayout(contents)
+        else:
+            self.main_layout.addWidget(contents)
+        self._contents = contents
+        self.contentsLoaded.emit(contents)
+
+        return contents
+
+    def unload(self):
+        """
+        Destroys built contents. They will be built again the next time the widget is shown
+        """
+
+        if self._contents is None:
+            return
+
+        contents = self._contents
+        self._contents = None
+        if isinstance(contents, QLayout):
+            qtutils.clear_layout(contents)
+            self.main_layout.removeItem(contents)
+        else:
+            self.main_layout.removeWidget(contents)
+        contents.deleteLater()
+        self.updateGeometry()
+        self.contentsUnloaded.emit()
+
+    def set_unload_timeout(self, timeout):
+        """
+        Sets the time (in milliseconds) contents can stay hidden before they are destroyed
+        :param timeout: int or None, if None, contents are never unloaded automatically
+        """
+
+        if timeout is None:
+            if self._unload_timer:
+                self._unload_timer.stop()
+                self._unload_timer.deleteLater()
+                self._unload_timer = None
+            return
+
+        if not self._unload_timer:
+            self._unload_timer = QTimer(self)
+            self._unload_timer.setSingleShot(True)
+            self._unload_timer.timeout.connect(self._on_unload_timeout)
+        self._unload_timer.setInterval(timeout)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_unload_timeout(self):
+        """
+        Internal callback function that is called when contents stayed hidden longer than unload timeout
+        """
+
+        if not self.isVisible():
+            self.unload()
+
+
+def lazy_widget(widget, unload_timeout=None, parent=None):
+    """
+    Returns given widget or, if a callable factory is given, a LazyWidget that builds its contents on demand
+    :param widget: QWidget or callable
+    :param unload_timeout: int or None
+    :param parent: QWidget or None
+    :return: QWidget
+    """
+
+    if callable(widget) and not isinstance(widget, (QWidget, QLayout)):
+        return LazyWidget(widget, unload_timeout=unload_timeout, parent=parent)
+
+    return widget
+
+
 class DirectoryWidget(BaseWidget, object):
     """
     Widget that contains variables to store current working directory
@@ -0,0 +1,267 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a dispatcher used to deliver DCC callbacks to tool functions
+DCC callbacks (selection changed, time changed, etc) can be fired hundreds of times per second. In coalesce mode,
+callbacks of the same type received within the coalesce interval are merged and only the latest payload is delivered
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import timeit
+import logging
+from collections import OrderedDict
+
+from Qt.QtCore import QObject, QTimer
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+# Default time (in milliseconds) used to coalesce callbacks of the same type
+DEFAULT_COALESCE_INTERVAL = 50
+
+
+class DispatchMode(object):
+    """
+    Defines how a CallbackDispatcher delivers callbacks
+    """
+
+    DIRECT = 'direct'           # Callbacks are delivered as soon as they are received
+    COALESCE = 'coalesce'       # Callbacks are merged within an interval and only the latest payload is delivered
+
+
+class CallbackStats(object):
+    """
+    Class that stores delivery statistics of a callback function
+    """
+
+    __slots__ = ('name', 'callback_type', 'received', 'delivered', 'total_time', 'max_time')
+
+    def __init__(self, name, callback_type):
+        self.name = name
+        self.callback_type = callback_type
+        self.received = 0
+        self.delivered = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def average_time(self):
+        return self.total_time / self.delivered if self.delivered else 0.0
+
+    def as_dict(self):
+        """
+        Returns statistics as a dictionary
+        :return: dict
+        """
+
+        return {
+            'name': self.name, 'callback_type': self.callback_type, 'received': self.received,
+            'delivered': self.delivered, 'total_time': self.total_time, 'max_time': self.max_time,
+            'average_time': self.average_time
+        }
+
+
+class CallbackDispatcher(QObject, object):
+    """
+    Delivers DCC callbacks to tool functions, timing each delivery
+    In coalesce mode, delivery is skipped while the given widget is not visible. Pending payloads are kept and
+    delivered once the widget is flushed (usually when it is shown again)
+    """
+
+    def __init__(self, widget=None, mode=DispatchMode.DIRECT, interval=DEFAULT_COALESCE_INTERVAL, parent=None):
+        super(CallbackDispatcher, self).__init__(parent)
+
+        self._widget = widget
+        self._mode = mode
+        self._callbacks = dict()
+        self._wrappers = dict()
+        self._pending = OrderedDict()
+        self._stats = OrderedDict()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        self._mode = value
+        if value == DispatchMode.DIRECT:
+            self.flush(force=True)
+
+    @property
+    def interval(self):
+        return self._timer.interval()
+
+    @interval.setter
+    def interval(self, value):
+        self._timer.setInterval(value)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def wrap(self, callback_type, fn):
+        """
+        Returns a function that dispatches the given callback function through this dispatcher
+        The same function is returned while the callback function is not unwrapped
+        :param callback_type: str
+        :param fn: callable
+        :return: callable
+        """
+
+        key = (callback_type, fn)
+        self._callbacks[key] = fn
+        if key not in self._stats:
+            name = getattr(fn, '__qualname__', None) or getattr(fn, '__name__', None) or str(fn)
+            self._stats[key] = CallbackStats(name, callback_type)
+
+        dispatch_fn = self._wrappers.get(key)
+        if dispatch_fn is None:
+            def _dispatch(*args, **kwargs):
+                self._on_callback(key, args, kwargs)
+            dispatch_fn = self._wrappers[key] = _dispatch
+
+        return dispatch_fn
+
+    def unwrap(self, callback_type, fn):
+        """
+        Removes the given callback function from the dispatcher and discards its pending payload
+        :param callback_type: str
+        :param fn: callable
+        :return: callable or None, function returned by wrap for the given callback function
+        """
+
+        key = (callback_type, fn)
+        self._callbacks.pop(key, None)
+        self._pending.pop(key, None)
+
+        return self._wrappers.pop(key, None)
+
+    def flush(self, force=False):
+        """
+        Delivers all pending callbacks
+        :param force: bool, whether to deliver pending callbacks even if the widget is not visible
+        """
+
+        self._timer.stop()
+        if not self._pending or (not force and not self.can_deliver()):
+            return
+
+        pending = self._pending
+        self._pending = OrderedDict()
+        for key, (args, kwargs) in pending.items():
+            self._deliver(key, args, kwargs, catch_errors=True)
+
+    def clear(self):
+        """
+        Removes all callbacks and discards pending payloads
+        """
+
+        self._timer.stop()
+        self._pending.clear()
+        self._callbacks.clear()
+        self._wrappers.clear()
+
+    def pending_count(self):
+        """
+        Returns the number of callbacks waiting to be delivered
+        :return: int
+        """
+
+        return len(self._pending)
+
+    def can_deliver(self):
+        """
+        Returns whether callbacks can be delivered right now
+        :return: bool
+        """
+
+        if self._widget is None:
+            return True
+
+        return self._widget.isVisible() and not self._widget.window().isMinimized()
+
+    def stats(self):
+        """
+        Returns delivery statistics of each callback function sorted by total delivery time
+        :return: list(dict)
+        """
+
+        return sorted(
+            [stat.as_dict() for stat in self._stats.values()], key=lambda stat: stat['total_time'], reverse=True)
+
+    def reset_stats(self):
+        """
+        Resets delivery statistics
+        """
+
+        for key, stat in list(self._stats.items()):
+            self._stats[key] = CallbackStats(stat.name, stat.callback_type)
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _deliver(self, key, args, kwargs, catch_errors=False):
+        """
+        Internal function that calls the callback function with the given payload and stores its delivery time
+        Errors of direct deliveries are raised to the caller. Deferred deliveries have no caller to raise to, so
+        their errors are logged
+        """
+
+        fn = self._callbacks.get(key)
+        if fn is None:
+            return
+
+        start_time = timeit.default_timer()
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            if not catch_errors:
+                raise
+            LOGGER.exception('Error while delivering "{}" callback'.format(key[0]))
+        finally:
+            elapsed = timeit.default_timer() - start_time
+            stat = self._stats[key]
+            stat.delivered += 1
+            stat.total_time += elapsed
+            stat.max_time = max(stat.max_time, elapsed)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_callback(self, key, args, kwargs):
+        """
+        Internal callback function that is called each time a DCC callback is received
+        """
+
+        if key not in self._callbacks:
+            return
+
+        self._stats[key].received += 1
+        if self._mode == DispatchMode.DIRECT:
+            self._deliver(key, args, kwargs)
+            return
+
+        self._pending.pop(key, None)
+        self._pending[key] = (args, kwargs)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _on_timeout(self):
+        """
+        Internal callback function that is called when coalesce interval ends
+        """
+
+        self.flush()
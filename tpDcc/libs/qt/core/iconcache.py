@@ -0,0 +1,372 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a shared cache of icons and pixmaps
+Icons are keyed by (name, size, color, theme, DPI) and evicted in LRU order once the total amount of cached pixel
+bytes exceeds the cache limit
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from collections import OrderedDict
+
+from Qt.QtCore import Qt, Signal, QObject, QSize
+from Qt.QtWidgets import QWidget
+from Qt.QtGui import QColor, QIcon, QPixmap
+
+from tpDcc.managers import resources
+from tpDcc.libs.resources.core import icon as icon_utils
+
+from tpDcc.libs.qt.core import qtutils
+
+# Default maximum amount of bytes used by cached icons and pixmaps (64 MB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Size used to estimate the memory cost of icons created without an explicit size
+DEFAULT_ICON_SIZE = 64
+
+
+def _hashable(value):
+    """
+    Internal function that converts given value into a hashable object that can be used as cache key
+    :param value: object
+    :return: object
+    """
+
+    if isinstance(value, QColor):
+        return 'color', value.rgba()
+    elif isinstance(value, QIcon):
+        return 'icon', value.cacheKey()
+    elif isinstance(value, QPixmap):
+        return 'pixmap', value.cacheKey()
+    elif isinstance(value, QSize):
+        return value.width(), value.height()
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+
+    return value
+
+
+class IconCache(QObject, object):
+    """
+    Shared cache of icons and pixmaps with LRU eviction by total pixel bytes
+    """
+
+    cacheInvalidated = Signal()
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, parent=None):
+        super(IconCache, self).__init__(parent)
+
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._entries = OrderedDict()
+        self._requests = dict()
+        self._hits = 0
+        self._misses = 0
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def icon(self, name, size=None, color=None, theme=None, **kwargs):
+        """
+        Returns icon with given name, creating it if it is not cached yet
+        :param name: str, name of the icon resource
+        :param size: int or None, if given, icon is rendered to a pixmap with the given size (DPI scaled)
+        :param color: QColor or tuple or None, color used to tint the icon
+        :param theme: str or None, name of the theme icon belongs to
+        :param kwargs: dict, extra arguments passed to resources manager
+        :return: QIcon
+        """
+
+        key = self._key('icon', name, size, color, theme, kwargs)
+        cached_icon = self._get(key)
+        if cached_icon is not None:
+            return cached_icon
+
+        if theme:
+            kwargs['theme'] = theme
+        if color is not None:
+            kwargs['color'] = color
+        new_icon = resources.icon(name, **kwargs)
+        if new_icon is None:
+            return QIcon()
+        if size and not new_icon.isNull():
+            dpi_size = int(qtutils.dpi_scale(size))
+            new_icon = QIcon(new_icon.pixmap(QSize(dpi_size, dpi_size)))
+
+        self._store(key, new_icon, self._icon_bytes(new_icon, size))
+        self._requests[new_icon.cacheKey()] = ('icon', name, size, color, kwargs)
+
+        return new_icon
+
+    def pixmap(self, name, size=None, color=None, theme=None, **kwargs):
+        """
+        Returns pixmap with given name, creating it if it is not cached yet
+        :param name: str, name of the pixmap resource
+        :param size: int or None, if given, pixmap is scaled to the given size (DPI scaled)
+        :param color: QColor or tuple or None, color used to tint the pixmap
+        :param theme: str or None, name of the theme pixmap belongs to
+        :param kwargs: dict, extra arguments passed to resources manager
+        :return: QPixmap
+        """
+
+        key = self._key('pixmap', name, size, color, theme, kwargs)
+        cached_pixmap = self._get(key)
+        if cached_pixmap is not None:
+            return cached_pixmap
+
+        if theme:
+            kwargs['theme'] = theme
+        if color is not None:
+            kwargs['color'] = color
+        new_pixmap = resources.pixmap(name, **kwargs)
+        if new_pixmap is None:
+            return QPixmap()
+        if size and not new_pixmap.isNull():
+            dpi_size = int(qtutils.dpi_scale(size))
+            new_pixmap = new_pixmap.scaled(dpi_size, dpi_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        self._store(key, new_pixmap, self._pixmap_bytes(new_pixmap))
+
+        return new_pixmap
+
+    def colorized_icon(self, icons, size=None, colors=None, tint_color=None, icon_scaling=None,
+                       tint_composition=None, grayscale=False):
+        """
+        Returns a colorized (and optionally layered) version of the given icons
+        Wraps resources colorize_layered_icon function, so tinted variants are only generated once
+        :param icons: str or QIcon or list
+        :param size: int
+        :param colors: list
+        :param tint_color: tuple or None
+        :param icon_scaling: list or None
+        :param tint_composition: QPainter.CompositionMode or None
+        :param grayscale: bool
+        :return: QIcon
+        """
+
+        key = ('colorized', _hashable(icons), size, _hashable(colors), _hashable(tint_color),
+               _hashable(icon_scaling), tint_composition, grayscale, qtutils.dpi_multiplier())
+        cached_icon = self._get(key)
+        if cached_icon is not None:
+            return cached_icon
+
+        colorize_kwargs = dict(
+            size=size, colors=colors, tint_color=tint_color, icon_scaling=icon_scaling,
+            tint_composition=tint_composition)
+        new_icon = icon_utils.colorize_layered_icon(
+            icons=icons, grayscale=grayscale, **{k: v for k, v in colorize_kwargs.items() if v is not None})
+        self._store(key, new_icon, self._icon_bytes(new_icon, size))
+
+        return new_icon
+
+    def prefetch(self, names, size=None, color=None, theme=None, **kwargs):
+        """
+        Loads given icons into the cache
+        :param names: list(str)
+        :param size: int or None
+        :param color: QColor or tuple or None
+        :param theme: str or None
+        :param kwargs: dict
+        :return: list(QIcon)
+        """
+
+        return [self.icon(name, size=size, color=color, theme=theme, **dict(kwargs)) for name in names]
+
+    def invalidate(self, name=None):
+        """
+        Removes cached icons from cache
+        :param name: str or None, if given only the entries of the icon with given name are removed
+        """
+
+        if name is None:
+            self._entries.clear()
+            self._requests.clear()
+            self._total_bytes = 0
+        else:
+            for key in [k for k in self._entries if k[1] == name]:
+                self._total_bytes -= self._entries.pop(key)[1]
+
+        self.cacheInvalidated.emit()
+
+    def reload_theme(self, theme_name, root_widget=None):
+        """
+        Invalidates cached icons and reapplies theme icons to the children of the given widget
+        :param theme_name: str, name of the new theme
+        :param root_widget: QWidget or None
+        """
+
+        requests = dict(self._requests)
+        self.invalidate()
+        if not root_widget:
+            return
+
+        for widget in [root_widget] + root_widget.findChildren(QWidget):
+            if not hasattr(widget, 'icon') or not hasattr(widget, 'setIcon'):
+                continue
+            try:
+                current_icon = widget.icon()
+            except Exception:
+                continue
+            request = requests.get(current_icon.cacheKey()) if isinstance(current_icon, QIcon) else None
+            if not request:
+                continue
+            _, name, size, color, kwargs = request
+            kwargs = dict(kwargs)
+            kwargs.pop('theme', None)
+            kwargs.pop('color', None)
+            new_icon = self.icon(name, size=size, color=color, theme=theme_name, **kwargs)
+            if not new_icon.isNull():
+                widget.setIcon(new_icon)
+
+    def stats(self):
+        """
+        Returns cache usage statistics
+        :return: dict
+        """
+
+        return {
+            'entries': len(self._entries), 'bytes': self._total_bytes, 'max_bytes': self._max_bytes,
+            'hits': self._hits, 'misses': self._misses
+        }
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _key(self, kind, name, size, color, theme, kwargs):
+        """
+        Internal function that returns cache key for the given icon request
+        """
+
+        return kind, name, size, _hashable(color), theme, qtutils.dpi_multiplier(), _hashable(kwargs)
+
+    def _get(self, key):
+        """
+        Internal function that returns cached item with given key and marks it as the most recently used one
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.pop(key)
+        self._entries[key] = entry
+
+        return entry[0]
+
+    def _store(self, key, item, cost):
+        """
+        Internal function that stores given item in cache
+        """
+
+        if key in self._entries:
+            self._total_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (item, cost)
+        self._total_bytes += cost
+        self._evict()
+
+    def _evict(self):
+        """
+        Internal function that removes least recently used items until cache fits its memory limit
+        """
+
+        while self._entries and self._total_bytes > self._max_bytes:
+            key, (item, cost) = self._entries.popitem(last=False)
+            self._total_bytes -= cost
+            if isinstance(item, QIcon):
+                self._requests.pop(item.cacheKey(), None)
+
+    def _icon_bytes(self, icon, size=None):
+        """
+        Internal function that returns an estimation of the memory used by the given icon
+        """
+
+        sizes = icon.availableSizes() if icon else list()
+        if sizes:
+            return sum(s.width() * s.height() * 4 for s in sizes)
+
+        icon_size = int(qtutils.dpi_scale(size or DEFAULT_ICON_SIZE))
+        return icon_size * icon_size * 4
+
+    def _pixmap_bytes(self, pixmap):
+        """
+        Internal function that returns the memory used by the given pixmap
+        """
+
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+
+_ICON_CACHE = None
+
+
+def icon_cache():
+    """
+    Returns global icon cache
+    :return: IconCache
+    """
+
+    global _ICON_CACHE
+    if _ICON_CACHE is None:
+        _ICON_CACHE = IconCache()
+
+    return _ICON_CACHE
+
+
+def icon(name, size=None, color=None, theme=None, **kwargs):
+    """
+    Returns cached icon with given name
+    :return: QIcon
+    """
+
+    return icon_cache().icon(name, size=size, color=color, theme=theme, **kwargs)
+
+
+def pixmap(name, size=None, color=None, theme=None, **kwargs):
+    """
+    Returns cached pixmap with given name
+    :return: QPixmap
+    """
+
+    return icon_cache().pixmap(name, size=size, color=color, theme=theme, **kwargs)
+
+
+def colorized_icon(icons, **kwargs):
+    """
+    Returns cached colorized icon
+    :return: QIcon
+    """
+
+    return icon_cache().colorized_icon(icons, **kwargs)
+
+
+def prefetch(names, size=None, color=None, theme=None, **kwargs):
+    """
+    Loads given icons into global icon cache
+    :return: list(QIcon)
+    """
+
+    return icon_cache().prefetch(names, size=size, color=color, theme=theme, **kwargs)
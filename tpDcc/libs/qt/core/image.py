@@ -12,19 +12,25 @@ import re
 import base64
 import logging
 import traceback
+from collections import OrderedDict
 
 try:
     import urllib2 as urllib
 except ImportError:
     import urllib
 
-from Qt.QtCore import Qt, Signal, QByteArray, QRunnable, QObject, QTimer
-from Qt.QtGui import QImage, QPixmap, QBitmap, QIcon, QColor, QPainter
+from Qt.QtCore import Qt, Signal, QByteArray, QRunnable, QObject, QTimer, QThreadPool, QSize
+from Qt.QtGui import QImage, QImageReader, QPixmap, QBitmap, QIcon, QColor, QPainter
 
 from tpDcc.libs.python import python, path as path_utils
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
 
+# Default maximum amount of bytes used by decoded images cache (128 MB)
+DEFAULT_IMAGE_CACHE_BYTES = 128 * 1024 * 1024
+
+_NATURAL_SORT_REGEX = re.compile('([0-9]+)')
+
 ImageFormats = {
     QImage.Format_Mono: 'L',                            # Mono
     QImage.Format_MonoLSB: 'L',                         # Mono LSB
@@ -215,6 +221,49 @@ def download_image(image_url, target_image_path):
             file_image_url.close()
 
 
+def natural_sort_key(text):
+    """
+    Returns key used to sort strings in natural order (frame_2 before frame_10)
+    :param text: str
+    :return: list
+    """
+
+    return [int(c) if c.isdigit() else c for c in _NATURAL_SORT_REGEX.split(text)]
+
+
+def read_image(image_path, size=None):
+    """
+    Reads image from disk. If a size is given, image is downscaled while it is decoded, so the full resolution image
+    is never kept in memory
+    :param image_path: str
+    :param size: QSize or None, maximum size of the image (aspect ratio is kept)
+    :return: QImage
+    """
+
+    reader = QImageReader(str(image_path))
+    if size is not None:
+        original_size = reader.size()
+        if original_size.isValid():
+            target_size = original_size.scaled(size, Qt.KeepAspectRatio)
+            if target_size.width() < original_size.width() or target_size.height() < original_size.height():
+                reader.setScaledSize(target_size)
+
+    return reader.read()
+
+
+def image_bytes(image):
+    """
+    Returns the amount of memory used by the given image
+    :param image: QImage
+    :return: int
+    """
+
+    if not image or image.isNull():
+        return 0
+
+    return image.width() * image.height() * max(1, image.depth()) // 8
+
+
 class ImageWorker(QRunnable, object):
     """
     Class that loads an image in a thread
@@ -222,11 +271,15 @@ class ImageWorker(QRunnable, object):
 
     class ImageWorkerSignals(QObject, object):
         triggered = Signal(object)
+        loaded = Signal(object, object)
 
     def __init__(self, *args):
         super(ImageWorker, self).__init__(*args)
 
         self._path = None
+        self._size = None
+        self._key = None
+        self._cancelled = False
         self.signals = ImageWorker.ImageWorkerSignals()
 
     def set_path(self, path):
@@ -237,23 +290,337 @@ class ImageWorker(QRunnable, object):
 
         self._path = path
 
+    def set_size(self, size):
+        """
+        Sets the maximum size of the loaded image. Image is downscaled while decoded
+        :param size: QSize or None
+        """
+
+        self._size = size
+
+    def set_key(self, key):
+        """
+        Sets the key emitted with the loaded image
+        :param key: object
+        """
+
+        self._key = key
+
+    def cancel(self):
+        """
+        Cancels the load of the image if it has not been loaded yet
+        """
+
+        self._cancelled = True
+
+    def is_cancelled(self):
+        """
+        Returns whether image load was cancelled
+        :return: bool
+        """
+
+        return self._cancelled
+
     def run(self):
         """
         Overrides base QRunnable run function
         This is the starting point for the thread
         """
 
+        if self._cancelled:
+            return
+
         try:
             if self._path:
-                image = QImage(str(self._path))
+                image = read_image(self._path, self._size)
+                if self._cancelled:
+                    return
                 self.signals.triggered.emit(image)
+                self.signals.loaded.emit(self._key, image)
         except Exception as e:
             LOGGER.error('Cannot load thumbnail image!')
+            self.signals.loaded.emit(self._key, QImage())
+
+
+class ImageCache(object):
+    """
+    Cache of decoded images bounded by the total amount of bytes used by the images
+    """
+
+    def __init__(self, max_bytes=DEFAULT_IMAGE_CACHE_BYTES):
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._images = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._images
+
+    def __len__(self):
+        return len(self._images)
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def keys(self):
+        """
+        Returns the keys of all cached images
+        :return: list
+        """
+
+        return list(self._images.keys())
+
+    def get(self, key):
+        """
+        Returns cached image with given key and marks it as the most recently used one
+        :param key: object
+        :return: QImage or None
+        """
+
+        image = self._images.pop(key, None)
+        if image is not None:
+            self._images[key] = image
+
+        return image
+
+    def add(self, key, image):
+        """
+        Adds given image into the cache, removing least recently used images if cache memory limit is reached
+        :param key: object
+        :param image: QImage
+        """
+
+        self.remove(key)
+        cost = image_bytes(image)
+        if cost > self._max_bytes:
+            return
+        self._images[key] = image
+        self._total_bytes += cost
+        while self._images and self._total_bytes > self._max_bytes:
+            self._total_bytes -= image_bytes(self._images.popitem(last=False)[1])
+
+    def remove(self, key):
+        """
+        Removes image with given key from cache
+        :param key: object
+        """
+
+        image = self._images.pop(key, None)
+        if image is not None:
+            self._total_bytes -= image_bytes(image)
+
+    def clear(self):
+        """
+        Removes all cached images
+        """
+
+        self._images.clear()
+        self._total_bytes = 0
+
+
+class ImageLoader(QObject, object):
+    """
+    Service that loads (and downscales) images in a bounded thread pool
+    Requests of an image that is already being loaded are merged and decoded images are stored in a memory bounded
+    cache. Callbacks are always called in the thread the loader lives in (GUI thread)
+    """
+
+    imageLoaded = Signal(str, object)
+
+    def __init__(self, max_threads=None, max_bytes=DEFAULT_IMAGE_CACHE_BYTES, parent=None):
+        super(ImageLoader, self).__init__(parent)
+
+        self._thread_pool = QThreadPool(self)
+        if max_threads:
+            self._thread_pool.setMaxThreadCount(max_threads)
+        self._cache = ImageCache(max_bytes=max_bytes)
+        self._pending = dict()
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def request(self, image_path, size=None, callback=None):
+        """
+        Requests the load of an image
+        If the image is already cached, callback is called immediately and the image is returned
+        :param image_path: str
+        :param size: QSize or tuple(int, int) or None, maximum size of the image
+        :param callback: callable or None, function called with the loaded QImage
+        :return: QImage or None
+        """
+
+        if not image_path:
+            return None
+
+        size = self._size(size)
+        key = self._key(image_path, size)
+        image = self._cache.get(key)
+        if image is not None:
+            if callback:
+                callback(image)
+            return image
+
+        pending = self._pending.get(key)
+        if pending:
+            if callback:
+                pending[1].append(callback)
+            return None
+
+        worker = ImageWorker()
+        worker.set_path(image_path)
+        worker.set_size(size)
+        worker.set_key(key)
+        worker.signals.loaded.connect(self._on_image_loaded)
+        self._pending[key] = (worker, [callback] if callback else list())
+        self._thread_pool.start(worker)
+
+        return None
+
+    def cancel(self, image_path, size=None, callback=None):
+        """
+        Cancels a pending image request
+        :param image_path: str
+        :param size: QSize or tuple(int, int) or None
+        :param callback: callable or None, if given, only that callback is removed from the request
+        """
+
+        key = self._key(image_path, self._size(size))
+        pending = self._pending.get(key)
+        if not pending:
+            return
+
+        worker, callbacks = pending
+        if callback is not None and callback in callbacks:
+            callbacks.remove(callback)
+            if callbacks:
+                return
+
+        self._pending.pop(key)
+        worker.cancel()
+        if hasattr(self._thread_pool, 'tryTake'):
+            self._thread_pool.tryTake(worker)
+
+    def cancel_all(self):
+        """
+        Cancels all pending image requests
+        """
+
+        for worker, _ in self._pending.values():
+            worker.cancel()
+        self._pending.clear()
+        self._thread_pool.clear()
+
+    def cached_image(self, image_path, size=None):
+        """
+        Returns cached image of the given path or None if the image is not loaded yet
+        :param image_path: str
+        :param size: QSize or tuple(int, int) or None
+        :return: QImage or None
+        """
+
+        return self._cache.get(self._key(image_path, self._size(size)))
+
+    def load(self, image_path, size=None):
+        """
+        Loads an image synchronously, storing it in the cache
+        :param image_path: str
+        :param size: QSize or tuple(int, int) or None
+        :return: QImage
+        """
+
+        size = self._size(size)
+        key = self._key(image_path, size)
+        image = self._cache.get(key)
+        if image is None:
+            image = read_image(image_path, size)
+            if not image.isNull():
+                self._cache.add(key, image)
+
+        return image
+
+    def pending_count(self):
+        """
+        Returns the number of images that are being loaded
+        :return: int
+        """
+
+        return len(self._pending)
+
+    def invalidate(self, image_path=None):
+        """
+        Removes cached images of the given path from cache
+        :param image_path: str or None, if not given, all images are removed
+        """
+
+        if image_path is None:
+            self._cache.clear()
+            return
+
+        image_path = os.path.normpath(image_path)
+        for key in [k for k in self._cache.keys() if k[0] == image_path]:
+            self._cache.remove(key)
+
+    def _size(self, size):
+        """
+        Internal function that converts given size into a QSize
+        """
+
+        if size is None or isinstance(size, QSize):
+            return size
+
+        return QSize(*size)
+
+    def _key(self, image_path, size):
+        """
+        Internal function that returns cache key of an image request
+        """
+
+        return (os.path.normpath(image_path),) + ((size.width(), size.height()) if size is not None else (-1, -1))
+
+    def _on_image_loaded(self, key, image):
+        """
+        Internal callback function that is called when a worker finishes loading an image
+        :param key: tuple
+        :param image: QImage
+        """
+
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+
+        if image is not None and not image.isNull():
+            self._cache.add(key, image)
+        for callback in pending[1]:
+            try:
+                callback(image)
+            except RuntimeError:
+                # Widget that requested the image was deleted while the image was being loaded
+                pass
+        self.imageLoaded.emit(key[0], image)
+
+
+_IMAGE_LOADER = None
+
+
+def image_loader():
+    """
+    Returns global image loader
+    :return: ImageLoader
+    """
+
+    global _IMAGE_LOADER
+    if _IMAGE_LOADER is None:
+        _IMAGE_LOADER = ImageLoader()
+
+    return _IMAGE_LOADER
 
 
 class ImageSequence(QObject, object):
 
     DEFAULT_FPS = 24
+    DEFAULT_PREFETCH_FRAMES = 8
+    DEFAULT_FRAME_CACHE_BYTES = 256 * 1024 * 1024
 
     frameChanged = Signal(int)
 
@@ -266,10 +633,75 @@ class ImageSequence(QObject, object):
         self._frames = list()
         self._dirname = None
         self._paused = False
+        self._display_size = None
+        self._prefetch_count = self.DEFAULT_PREFETCH_FRAMES
+        self._frames_shown = 0
+        self._dropped_frames = 0
+        self._loader = ImageLoader(max_threads=2, max_bytes=self.DEFAULT_FRAME_CACHE_BYTES, parent=self)
 
         if path:
             self.set_dirname(path)
 
+    def display_size(self):
+        """
+        Returns the size frames are decoded to
+        :return: QSize or None
+        """
+
+        return self._display_size
+
+    def set_display_size(self, size):
+        """
+        Sets the maximum size frames are decoded to. Frames are downscaled while they are decoded
+        :param size: QSize or tuple(int, int) or None, if None, frames are decoded with their full resolution
+        """
+
+        if size is not None and not isinstance(size, QSize):
+            size = QSize(*size)
+        self._display_size = size
+        self._loader.cancel_all()
+        self._prefetch(self._frame)
+
+    def set_prefetch_count(self, count):
+        """
+        Sets the number of frames that are decoded ahead of the current frame
+        :param count: int
+        """
+
+        self._prefetch_count = max(0, count)
+
+    def set_cache_size(self, max_bytes):
+        """
+        Sets the maximum amount of memory used by decoded frames
+        :param max_bytes: int
+        """
+
+        self._loader.cancel_all()
+        self._loader.deleteLater()
+        self._loader = ImageLoader(max_threads=2, max_bytes=max_bytes, parent=self)
+
+    def playback_stats(self):
+        """
+        Returns playback statistics
+        dropped_frames are the frames that were not decoded yet when the playhead reached them
+        :return: dict
+        """
+
+        return {
+            'frames_shown': self._frames_shown,
+            'dropped_frames': self._dropped_frames,
+            'cached_frames': len(self._loader.cache),
+            'cache_bytes': self._loader.cache.total_bytes
+        }
+
+    def reset_playback_stats(self):
+        """
+        Resets playback statistics
+        """
+
+        self._frames_shown = 0
+        self._dropped_frames = 0
+
     def set_path(self, path):
         """
         Sets s single frame image sequence
@@ -299,24 +731,16 @@ class ImageSequence(QObject, object):
         :param dirname: str
         """
 
-        def natural_sort_items(items):
-            """
-            Sort the given list in the expected way
-            :param items: list(str)
-            """
-
-            def _convert(text):
-                return int(text) if text.isdigit() else text
-
-            def _alphanum_key(key):
-                return [_convert(c) for c in re.split('([0-9]+)', key)]
-
-            items.sort(key=_alphanum_key)
-
         self._dirname = dirname
+        self._loader.cancel_all()
+        self._loader.invalidate()
         if os.path.isdir(dirname):
-            self._frames = [dirname + '/' + filename for filename in os.listdir(dirname)]
-            natural_sort_items(self._frames)
+            if hasattr(os, 'scandir'):
+                filenames = [entry.name for entry in os.scandir(dirname) if entry.is_file()]
+            else:
+                filenames = [name for name in os.listdir(dirname) if os.path.isfile(os.path.join(dirname, name))]
+            filenames.sort(key=natural_sort_key)
+            self._frames = [dirname + '/' + filename for filename in filenames]
 
     def first_frame(self):
         """
@@ -335,6 +759,7 @@ class ImageSequence(QObject, object):
         """
 
         self.reset()
+        self._prefetch(self._frame)
         if self._timer:
             self._timer.start(1000.0 / self._fps)
 
@@ -364,6 +789,7 @@ class ImageSequence(QObject, object):
 
         if self._timer:
             self._timer.stop()
+        self._loader.cancel_all()
 
     def reset(self):
         """
@@ -427,13 +853,26 @@ class ImageSequence(QObject, object):
         except IndexError:
             pass
 
+    def current_image(self):
+        """
+        Returns the current frame as QImage
+        Frame is taken from the frames cache if it was already decoded, otherwise it is loaded synchronously
+        :return: QImage
+        """
+
+        filename = self.current_filename()
+        if not filename:
+            return QImage()
+
+        return self._loader.load(filename, self._display_size)
+
     def current_icon(self):
         """
         Returns the current frames as QIcon
         :return: QIcon
         """
 
-        return QIcon(self.current_filename())
+        return QIcon(self.current_pixmap())
 
     def current_pixmap(self):
         """
@@ -441,7 +880,7 @@ class ImageSequence(QObject, object):
         :return: QPixmap
         """
 
-        return QPixmap(self.current_filename())
+        return QPixmap.fromImage(self.current_image())
 
     def jump_to_frame(self, frame):
         """
@@ -452,8 +891,22 @@ class ImageSequence(QObject, object):
         if frame >= self.frame_count():
             frame = 0
         self._frame = frame
+        self._prefetch(frame + 1)
         self.frameChanged.emit(frame)
 
+    def _prefetch(self, frame):
+        """
+        Internal function that requests the decoding of the frames that follow the given one
+        :param frame: int
+        """
+
+        frame_count = self.frame_count()
+        if not frame_count:
+            return
+
+        for i in range(min(self._prefetch_count, frame_count)):
+            self._loader.request(self._frames[(frame + i) % frame_count], self._display_size)
+
     def _on_frame_changed(self):
         """
         Internal callback function that is called when the current frame changes
@@ -464,6 +917,11 @@ class ImageSequence(QObject, object):
 
         frame = self._frame
         frame += 1
+        if frame >= self.frame_count():
+            frame = 0
+        self._frames_shown += 1
+        if self._loader.cached_image(self._frames[frame], self._display_size) is None:
+            self._dropped_frames += 1
         self.jump_to_frame(frame)
 
 
@@ -0,0 +1,227 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains an import time profiler used to measure startup cost of tpDcc-libs-qt modules
+This module does not import Qt, so it can be used before any Qt binding is loaded
+
+>>> with ImportProfiler() as profiler:
+>>>     from tpDcc.libs.qt.widgets import buttons
+>>> print(profiler.report())
+
+It can also be executed from command line to enforce a startup budget (in milliseconds):
+    python -m tpDcc.libs.qt.core.importprofiler tpDcc.libs.qt.widgets.buttons --budget 500
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import timeit
+import argparse
+from collections import namedtuple, OrderedDict
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+ImportRecord = namedtuple('ImportRecord', ['name', 'cumulative', 'self_time', 'depth'])
+
+
+class ImportProfiler(object):
+    """
+    Measures the time spent importing each module while the profiler is active
+    Times are stored in seconds. Cumulative time includes the time spent importing its dependencies while self time
+    does not
+    """
+
+    def __init__(self):
+        self._records = OrderedDict()
+        self._stack = list()
+        self._original_import = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def records(self):
+        return list(self._records.values())
+
+    def start(self):
+        """
+        Starts profiling imports
+        """
+
+        if self._original_import is not None:
+            return
+
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._profiled_import
+
+    def stop(self):
+        """
+        Stops profiling imports
+        """
+
+        if self._original_import is None:
+            return
+
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def clear(self):
+        """
+        Removes all stored import records
+        """
+
+        self._records.clear()
+
+    def total_time(self):
+        """
+        Returns the total time spent importing top level modules
+        :return: float
+        """
+
+        return sum(record.cumulative for record in self._records.values() if record.depth == 0)
+
+    def over_budget(self, budget, cumulative=True):
+        """
+        Returns all the records whose time is bigger than the given budget
+        :param budget: float, budget in seconds
+        :param cumulative: bool, Whether to check cumulative or self time
+        :return: list(ImportRecord)
+        """
+
+        return [
+            record for record in self._records.values()
+            if (record.cumulative if cumulative else record.self_time) > budget]
+
+    def report(self, sort_by='cumulative', limit=None, prefix=None):
+        """
+        Returns a string with the import cost of each module
+        :param sort_by: str, 'cumulative', 'self_time' or None to keep import order
+        :param limit: int or None, maximum number of modules to report
+        :param prefix: str or None, if given, only modules starting with the prefix are reported
+        :return: str
+        """
+
+        records = [record for record in self._records.values() if not prefix or record.name.startswith(prefix)]
+        if sort_by:
+            records.sort(key=lambda record: getattr(record, sort_by), reverse=True)
+        if limit:
+            records = records[:limit]
+
+        lines = ['{:>12} {:>12}  {}'.format('self [ms]', 'total [ms]', 'module')]
+        for record in records:
+            indent = '  ' * record.depth if not sort_by else ''
+            lines.append('{:>12.2f} {:>12.2f}  {}{}'.format(
+                record.self_time * 1000.0, record.cumulative * 1000.0, indent, record.name))
+        lines.append('Total import time: {:.2f} ms'.format(self.total_time() * 1000.0))
+
+        return '\n'.join(lines)
+
+    def _resolve_name(self, name, globals_dict, level):
+        """
+        Internal function that returns absolute module name of the import
+        :param name: str
+        :param globals_dict: dict or None
+        :param level: int
+        :return: str or None
+        """
+
+        if level <= 0:
+            return name
+
+        package = (globals_dict or dict()).get('__package__')
+        if not package:
+            return None
+        base = package.rsplit('.', level - 1)[0] if level > 1 else package
+
+        return '{}.{}'.format(base, name) if name else base
+
+    def _timed_import(self, module_name):
+        """
+        Internal function that imports given absolute module name storing the time it took
+        :param module_name: str
+        """
+
+        self._stack.append(0.0)
+        start_time = timeit.default_timer()
+        try:
+            self._original_import(module_name, None, None, None, 0)
+        finally:
+            elapsed = timeit.default_timer() - start_time
+            children_time = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            if module_name in sys.modules:
+                self._records[module_name] = ImportRecord(
+                    module_name, elapsed, max(0.0, elapsed - children_time), len(self._stack))
+
+    def _profiled_import(self, name, globals=None, locals=None, fromlist=None, level=0):
+        """
+        Internal function that replaces builtin __import__ function while profiler is active
+        Parent packages and sub modules imported through fromlist are timed individually
+        """
+
+        module_name = self._resolve_name(name, globals, level)
+        if module_name:
+            parts = module_name.split('.')
+            for i in range(1, len(parts) + 1):
+                partial_name = '.'.join(parts[:i])
+                if partial_name not in sys.modules:
+                    self._timed_import(partial_name)
+            package = sys.modules.get(module_name)
+            if fromlist and package is not None and hasattr(package, '__path__'):
+                for item in fromlist:
+                    sub_module_name = '{}.{}'.format(module_name, item)
+                    if item == '*' or hasattr(package, item) or sub_module_name in sys.modules:
+                        continue
+                    try:
+                        self._timed_import(sub_module_name)
+                    except ImportError:
+                        # Not a sub module (or a broken one): original import will handle it properly
+                        pass
+
+        return self._original_import(name, globals, locals, fromlist, level)
+
+
+def profile_imports(module_names):
+    """
+    Imports given modules and returns the profiler used to measure them
+    :param module_names: list(str)
+    :return: ImportProfiler
+    """
+
+    with ImportProfiler() as profiler:
+        for module_name in module_names:
+            __import__(module_name)
+
+    return profiler
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Reports import time of the given modules')
+    parser.add_argument('modules', nargs='+', help='Modules to import')
+    parser.add_argument('--budget', type=float, default=None, help='Maximum total import time in milliseconds')
+    parser.add_argument('--limit', type=int, default=30, help='Maximum number of modules to report')
+    parser.add_argument('--prefix', default=None, help='Only report modules starting with this prefix')
+    parsed_args = parser.parse_args(args)
+
+    profiler = profile_imports(parsed_args.modules)
+    print(profiler.report(limit=parsed_args.limit, prefix=parsed_args.prefix))
+
+    if parsed_args.budget is not None and profiler.total_time() * 1000.0 > parsed_args.budget:
+        print('Import budget exceeded: {:.2f} ms > {:.2f} ms'.format(
+            profiler.total_time() * 1000.0, parsed_args.budget))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,16 +7,19 @@ Module that contains extended functionality for QMenus
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Signal
+from Qt.QtCore import Qt, Signal, QEvent, QTimer
 from Qt.QtWidgets import QLineEdit, QMenu, QActionGroup, QAction, QWidgetAction
 
 from tpDcc.libs.python import python
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import qtutils, formatters
+from tpDcc.libs.qt.core import mixin, formatters
+
+# Time (in milliseconds) searchable menus wait after the last keystroke before updating their actions
+SEARCH_DEBOUNCE_INTERVAL = 150
 
 
 @theme.mixin
-# @mixin.property_mixin
+@mixin.property_setter_mixin
 class BaseMenu(QMenu, object):
 
     valueChanged = Signal(list)
@@ -46,7 +49,7 @@ class BaseMenu(QMenu, object):
         Sets menu separator character
         :param separator_character: str
         """
-        self.setProperty('separator', separator_character)
+        self.set_property('separator', separator_character)
 
     def set_value(self, data):
         """
@@ -57,7 +60,7 @@ class BaseMenu(QMenu, object):
         assert isinstance(data, (list, str, unicode, int, float))
         if self.property('cascader') and isinstance(data, (str, unicode)):
             data = data.split(self.property('separator'))
-        self.setProperty('value', data)
+        self.set_property('value', data)
 
     def set_data(self, option_list):
         """
@@ -71,7 +74,7 @@ class BaseMenu(QMenu, object):
                 option_list = python.from_list_to_nested_dict(option_list, separator=self.property('separator'))
             if all(isinstance(i, (int, float)) for i in option_list):
                 option_list = [{'value': i, 'label': str(i)} for i in option_list]
-        self.setProperty('data', option_list)
+        self.set_property('data', option_list)
 
     def set_loader(self, fn):
         """
@@ -236,7 +239,134 @@ class Menu(QMenu, object):
                 return action
 
 
+class SearchIndex(object):
+    """
+    Incremental n-gram index used to find the items whose search terms contain a given text
+    All substrings of up to GRAM_SIZE characters of each term are indexed. Short texts are resolved with a single
+    lookup while longer texts only verify the items that contain all their n-grams
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        self._grams = dict()
+        self._terms = dict()
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __contains__(self, item):
+        return item in self._terms
+
+    def entries(self):
+        """
+        Returns all indexed items
+        :return: set
+        """
+
+        return set(self._terms)
+
+    def add(self, item, terms):
+        """
+        Adds given item into the index. If the item is already indexed, its terms are updated
+        :param item: object
+        :param terms: list(str)
+        """
+
+        terms = tuple(terms)
+        if self._terms.get(item) == terms:
+            return
+
+        self.remove(item)
+        self._terms[item] = terms
+        for gram in self._get_grams(terms):
+            self._grams.setdefault(gram, set()).add(item)
+
+    def remove(self, item):
+        """
+        Removes given item from the index
+        :param item: object
+        """
+
+        terms = self._terms.pop(item, None)
+        if terms is None:
+            return
+
+        for gram in self._get_grams(terms):
+            items = self._grams.get(gram)
+            if not items:
+                continue
+            items.discard(item)
+            if not items:
+                self._grams.pop(gram)
+
+    def clear(self):
+        """
+        Removes all items from the index
+        """
+
+        self._grams.clear()
+        self._terms.clear()
+
+    def search(self, text):
+        """
+        Returns the items with a term that contains the given text
+        :param text: str
+        :return: set
+        """
+
+        if not text:
+            return self.entries()
+        if len(text) <= self.GRAM_SIZE:
+            return set(self._grams.get(text, ()))
+
+        grams = [text[i:i + self.GRAM_SIZE] for i in range(len(text) - self.GRAM_SIZE + 1)]
+        posting_sets = list()
+        for gram in grams:
+            items = self._grams.get(gram)
+            if not items:
+                return set()
+            posting_sets.append(items)
+        posting_sets.sort(key=len)
+        candidates = set(posting_sets[0])
+        for items in posting_sets[1:]:
+            candidates &= items
+
+        return set(item for item in candidates if any(text in term for term in self._terms[item]))
+
+    def search_any(self, texts):
+        """
+        Returns the items with a term that contains any of the given texts
+        :param texts: list(str)
+        :return: set
+        """
+
+        found = set()
+        for text in texts:
+            found |= self.search(text)
+
+        return found
+
+    def _get_grams(self, terms):
+        """
+        Internal function that returns all the n-grams of the given terms
+        :param terms: tuple(str)
+        :return: set(str)
+        """
+
+        grams = set()
+        for term in terms:
+            for size in range(1, self.GRAM_SIZE + 1):
+                for i in range(len(term) - size + 1):
+                    grams.add(term[i:i + size])
+
+        return grams
+
+
 class SearchableTaggedAction(QAction, object):
+
+    tagsChanged = Signal()
+
     def __init__(self, label, icon=None, parent=None):
         super(SearchableTaggedAction, self).__init__(label, parent)
 
@@ -252,6 +382,15 @@ class SearchableTaggedAction(QAction, object):
     @tags.setter
     def tags(self, new_tags):
         self._tags = new_tags
+        self.tagsChanged.emit()
+
+    def search_terms(self):
+        """
+        Returns the terms used to find this action: its tags and its label
+        :return: list(str)
+        """
+
+        return sorted(self._tags) + [self.text()]
 
     def has_tag(self, tag):
         """
@@ -284,6 +423,8 @@ class SearchableTaggedAction(QAction, object):
 class SearchableMenu(Menu, object):
     """
     Extends standard QMenu to make it searchable. First action is a QLineEdit used to recursively search on all actions
+    Tagged actions of the menu and its sub menus are stored in a search index that is updated when actions are added,
+    changed or removed, so searching does not need to walk all the actions of the menu
     """
 
     def __init__(self, **kwargs):
@@ -291,11 +432,35 @@ class SearchableMenu(Menu, object):
 
         self._search_action = None
         self._search_edit = None
+        self._search_index = SearchIndex()
+        self._hidden_actions = set()
+        self._action_menus = dict()
+        self._menu_parents = dict()
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_INTERVAL)
+        self._search_timer.timeout.connect(self._on_search_timeout)
 
         self.setObjectName(kwargs.get('objectName'))
         self.setTitle(kwargs.get('title'))
         self._init_search_edit()
 
+    # =================================================================================================================
+    # OVERRIDES
+    # =================================================================================================================
+
+    def actionEvent(self, event):
+        super(SearchableMenu, self).actionEvent(event)
+        self._on_menu_action_event(self, event)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.ActionAdded, QEvent.ActionChanged, QEvent.ActionRemoved) and \
+                obj in self._menu_parents:
+            self._on_menu_action_event(obj, event)
+
+        return super(SearchableMenu, self).eventFilter(obj, event)
+
     def clear(self):
         """
         Extends QMenu clear function
@@ -305,6 +470,10 @@ class SearchableMenu(Menu, object):
 
         self._init_search_edit()
 
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
     def set_search_visible(self, flag):
         """
         Sets the visibility of the search edit
@@ -321,51 +490,53 @@ class SearchableMenu(Menu, object):
 
         return self._search_action.isVisible()
 
+    def search_interval(self):
+        """
+        Returns the time (in milliseconds) search waits after the last keystroke before updating menu actions
+        :return: int
+        """
+
+        return self._search_timer.interval()
+
+    def set_search_interval(self, interval):
+        """
+        Sets the time (in milliseconds) search waits after the last keystroke before updating menu actions
+        :param interval: int
+        """
+
+        self._search_timer.setInterval(interval)
+
     def update_search(self, search_string=None):
         """
         Search all actions for a string tag
+        Only the actions whose visibility changes (and the sub menus that contain them) are updated
         :param str search_string: tag names separated by spaces (for example, "elem1 elem2"
         :return: str
         """
 
-        def _recursive_search(menu, search_str):
-            for action in menu.actions():
-                sub_menu = action.menu()
-                if sub_menu:
-                    _recursive_search(sub_menu, search_str)
-                    continue
-                elif action.isSeparator():
-                    continue
-                elif isinstance(action, SearchableTaggedAction) and not action.has_tag(search_str):
-                    action.setVisible(False)
-
-            menu_vis = any(action.isVisible() for action in menu.actions())
-            menu.menuAction().setVisible(menu_vis)
-
-        def _recursive_search_by_tags(menu, tags):
-            for action in menu.actions():
-                sub_menu = action.menu()
-                if sub_menu:
-                    _recursive_search_by_tags(sub_menu, tags)
-                    continue
-                elif action.isSeparator():
-                    continue
-                elif isinstance(action, SearchableTaggedAction):
-                    action.setVisible(action.has_any_tag(tags))
-
-            menu_vis = any(action.isVisible() for action in menu.actions())
-            menu.menuAction().setVisible(menu_vis)
+        self._search_timer.stop()
 
         search_str = search_string or ''
         split = search_str.split()
-        if not split:
-            qtutils.recursively_set_menu_actions_visibility(menu=self, state=True)
-            return
-        elif len(split) > 1:
-            _recursive_search_by_tags(menu=self, tags=split)
-            return
+        if split:
+            hidden_actions = self._search_index.entries() - self._search_index.search_any(split)
+        else:
+            hidden_actions = set()
 
-        _recursive_search(menu=self, search_str=split[0])
+        actions_to_hide = hidden_actions - self._hidden_actions
+        actions_to_show = self._hidden_actions - hidden_actions
+        self._hidden_actions = hidden_actions
+        for action in actions_to_hide:
+            action.setVisible(False)
+        for action in actions_to_show:
+            action.setVisible(True)
+
+        changed_menus = set(self._action_menus[action] for action in actions_to_hide | actions_to_show)
+        self._update_menus_visibility(changed_menus)
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
 
     def _init_search_edit(self):
         """
@@ -377,13 +548,117 @@ class SearchableMenu(Menu, object):
         self._search_edit = QLineEdit(self)
         self._search_edit.setPlaceholderText('Search ...')
         self._search_edit.textChanged.connect(self._on_update_search)
+        self._search_edit.returnPressed.connect(self._on_search_timeout)
         self._search_action.setDefaultWidget(self._search_edit)
         self.addAction(self._search_action)
         self.addSeparator()
 
+    def _register_action(self, action, menu):
+        """
+        Internal function that adds given action (and the actions of its sub menu) into the search index
+        :param action: QAction
+        :param menu: QMenu, menu that contains the action
+        """
+
+        self._action_menus[action] = menu
+        sub_menu = action.menu()
+        if sub_menu:
+            if sub_menu not in self._menu_parents:
+                self._menu_parents[sub_menu] = menu
+                sub_menu.installEventFilter(self)
+                for sub_action in sub_menu.actions():
+                    self._register_action(sub_action, sub_menu)
+        elif isinstance(action, SearchableTaggedAction):
+            self._search_index.add(action, action.search_terms())
+            action.tagsChanged.connect(self._on_action_tags_changed)
+            if self._search_edit and self._search_edit.text():
+                self._search_timer.start()
+
+    def _unregister_action(self, action):
+        """
+        Internal function that removes given action (and the actions of its sub menu) from the search index
+        :param action: QAction
+        """
+
+        self._action_menus.pop(action, None)
+        self._hidden_actions.discard(action)
+        if action in self._search_index:
+            self._search_index.remove(action)
+            try:
+                action.tagsChanged.disconnect(self._on_action_tags_changed)
+            except Exception:
+                pass
+            return
+
+        try:
+            sub_menu = action.menu()
+        except RuntimeError:
+            sub_menu = None
+        if sub_menu and sub_menu in self._menu_parents:
+            self._menu_parents.pop(sub_menu)
+            sub_menu.removeEventFilter(self)
+            for sub_action in sub_menu.actions():
+                self._unregister_action(sub_action)
+
+    def _update_menus_visibility(self, menus):
+        """
+        Internal function that updates the visibility of the given sub menus and, if it changes, of their parents
+        :param menus: set(QMenu)
+        """
+
+        while menus:
+            menu = menus.pop()
+            parent_menu = self._menu_parents.get(menu)
+            if parent_menu is None:
+                continue
+            menu_vis = any(action.isVisible() for action in menu.actions())
+            menu_action = menu.menuAction()
+            if menu_action.isVisible() != menu_vis:
+                menu_action.setVisible(menu_vis)
+                menus.add(parent_menu)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_menu_action_event(self, menu, event):
+        """
+        Internal callback function that is called when an action is added, changed or removed from this menu or from
+        any of its sub menus
+        :param menu: QMenu
+        :param event: QActionEvent
+        """
+
+        action = event.action()
+        event_type = event.type()
+        if event_type == QEvent.ActionAdded:
+            self._register_action(action, menu)
+        elif event_type == QEvent.ActionRemoved:
+            self._unregister_action(action)
+        elif action in self._search_index:
+            # Action label could have changed. If search terms did not change, index is not modified
+            self._search_index.add(action, action.search_terms())
+
+    def _on_action_tags_changed(self):
+        """
+        Internal callback function that is called when the tags of an indexed action change
+        """
+
+        action = self.sender()
+        if action in self._search_index:
+            self._search_index.add(action, action.search_terms())
+
     def _on_update_search(self, search_string):
         """
         Internal callback function that is called when the user interacts with the search line edit
+        Search is debounced, so menu actions are only updated once the user stops typing
+        """
+
+        self._search_timer.start()
+
+    def _on_search_timeout(self):
+        """
+        Internal callback function that is called when search debounce interval ends
         """
 
-        self.update_search(search_string)
+        self.update_search(self._search_edit.text())
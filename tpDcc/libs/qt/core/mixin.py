@@ -35,6 +35,48 @@ def property_mixin(cls):
     return cls
 
 
+_PROPERTY_SETTERS = dict()
+
+
+def _get_property_setters(cls):
+    """
+    Internal function that returns the table of dynamic property setter functions of the given class
+    Table is computed only once per class
+    :param cls: type
+    :return: dict(str, callable)
+    """
+
+    setters = _PROPERTY_SETTERS.get(cls)
+    if setters is None:
+        setters = _PROPERTY_SETTERS[cls] = {
+            name[len('_set_'):]: getattr(cls, name) for name in dir(cls) if name.startswith('_set_')}
+
+    return setters
+
+
+def property_setter_mixin(cls):
+    """
+    Mixin decorator that adds a set_property function that stores a dynamic property value and calls its setter
+    function (_set_{property_name}) directly using a setter table computed once per class
+    Unlike property_mixin, event function is not overridden, so other events received by the widget do not pay any
+    extra cost
+    :param cls:
+    :return: cls
+    """
+
+    def _set_property(self, name, value):
+        # Qt declared properties already call their own setter
+        if self.setProperty(name, value):
+            return
+        setter = _get_property_setters(type(self)).get(name)
+        if setter:
+            setter(self, value)
+
+    setattr(cls, 'set_property', _set_property)
+
+    return cls
+
+
 # def cursor_mixin(cls):
 #     """
 #     Mixin decorator that changes cursor to Qt.PointingHandCursor when mouse is over an enabled widget and to
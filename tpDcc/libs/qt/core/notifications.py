@@ -0,0 +1,534 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a manager that drives toast and popup messages
+All visible messages are expired, faded and positioned from the global frame scheduler instead of having their own
+timers. Message widgets are reused from a pool, identical messages are merged into a repeat counter and only a limited
+amount of messages is visible at once, the rest are queued
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+from collections import deque, OrderedDict
+
+from Qt.QtCore import Signal, QObject, QElapsedTimer
+
+from tpDcc.libs.qt.core import scheduler
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+# Default maximum amount of messages of the same type visible at once in the same parent
+DEFAULT_MAX_VISIBLE = 5
+
+# Default maximum amount of messages waiting to be visible
+DEFAULT_MAX_QUEUED = 50
+
+# Default maximum amount of hidden widgets kept for reuse of each message type
+DEFAULT_MAX_POOLED = 3
+
+# Default duration (in milliseconds) of message fade animations
+DEFAULT_FADE_DURATION = 300
+
+
+class _Notification(object):
+    """
+    Internal class that stores a posted message
+    """
+
+    __slots__ = (
+        'widget_class', 'text', 'theme_type', 'duration', 'closable', 'parent', 'widget', 'repeat', 'expire_time',
+        'release_time', 'handles')
+
+    def __init__(self, widget_class, text, theme_type, duration, closable, parent):
+        self.widget_class = widget_class
+        self.text = text
+        self.theme_type = theme_type
+        self.duration = duration
+        self.closable = closable
+        self.parent = parent
+        self.widget = None
+        self.repeat = 1
+        self.expire_time = None
+        self.release_time = None
+        self.handles = list()
+
+    @property
+    def key(self):
+        return self.widget_class, self.parent, self.theme_type, self.text
+
+    @property
+    def channel(self):
+        return self.widget_class, self.parent
+
+
+class NotificationHandle(QObject, object):
+    """
+    Handle returned each time a message is posted
+    Unlike message widgets, which are shared by merged messages and reused from a pool, a handle always refers to the
+    message it was returned for. Its closed signal is emitted once, when the message is hidden or discarded
+    """
+
+    closed = Signal()
+
+    def __init__(self, manager, notification):
+        super(NotificationHandle, self).__init__()
+
+        self._manager = manager
+        self._notification = notification
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def widget(self):
+        """
+        Returns the widget showing the message or None if the message is queued or already closed
+        :return: QWidget or None
+        """
+
+        return self._notification.widget if self._notification else None
+
+    @property
+    def is_closed(self):
+        return self._notification is None
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def dismiss(self):
+        """
+        Hides the message, or discards it if it is still queued
+        """
+
+        if self._notification:
+            self._manager.dismiss_notification(self._notification)
+
+    def notification_closed(self):
+        """
+        Function that is called by notification manager when the message is hidden or discarded
+        """
+
+        self._notification = None
+        self.closed.emit()
+
+
+class NotificationManager(QObject, object):
+    """
+    Manages the lifetime of message widgets
+    Message widget classes must implement the following interface:
+        - create_notification(text, theme_type, closable, parent): classmethod that returns a new widget
+        - reset_notification(text, closable, parent): reconfigures a pooled widget before showing it again
+        - set_repeat_count(count): updates the repeat counter of the message
+        - place(parent, index): moves the widget to the given slot of the parent messages stack
+        - fade_in() and fade_out(): starts widget show and hide animations
+        - notification_released(): called when the widget is hidden and returned to the pool
+    Optionally, they can define NOTIFICATION_MAX_VISIBLE and FADE_DURATION class attributes and a
+    NOTIFICATION_HANDLE_CLASS attribute with the NotificationHandle subclass returned when a message is posted
+    """
+
+    def __init__(self, max_visible=DEFAULT_MAX_VISIBLE, max_queued=DEFAULT_MAX_QUEUED,
+                 max_pooled=DEFAULT_MAX_POOLED, parent=None):
+        super(NotificationManager, self).__init__(parent)
+
+        self._max_visible = max_visible
+        self._max_queued = max_queued
+        self._max_pooled = max_pooled
+        self._visible = list()
+        self._queued = deque()
+        self._pools = dict()
+        self._active = False
+        self._stats = OrderedDict(
+            (('posted', 0), ('merged', 0), ('dropped', 0), ('created', 0), ('reused', 0), ('destroyed', 0)))
+
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def max_visible(self):
+        return self._max_visible
+
+    @max_visible.setter
+    def max_visible(self, value):
+        self._max_visible = max(1, value)
+
+    @property
+    def max_queued(self):
+        return self._max_queued
+
+    @max_queued.setter
+    def max_queued(self, value):
+        self._max_queued = max(0, value)
+
+    @property
+    def max_pooled(self):
+        return self._max_pooled
+
+    @max_pooled.setter
+    def max_pooled(self, value):
+        self._max_pooled = max(0, value)
+        for pool in self._pools.values():
+            while len(pool) > self._max_pooled:
+                self._destroy_widget(pool.pop())
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def post(self, widget_class, text, parent, theme_type=None, duration=None, closable=False):
+        """
+        Posts a new message
+        If an identical message is already visible or queued, its repeat counter is increased instead
+        :param widget_class: type, message widget class
+        :param text: str
+        :param parent: QWidget
+        :param theme_type: str
+        :param duration: int or float, time (in seconds) the message is visible
+        :param closable: bool
+        :return: NotificationHandle
+        """
+
+        self._stats['posted'] += 1
+        notification = _Notification(widget_class, text, theme_type, duration, closable, parent)
+        handle_class = getattr(widget_class, 'NOTIFICATION_HANDLE_CLASS', None) or NotificationHandle
+
+        merged = self._merge(notification)
+        if merged:
+            self._stats['merged'] += 1
+            handle = handle_class(self, merged)
+            merged.handles.append(handle)
+            return handle
+
+        handle = handle_class(self, notification)
+        notification.handles.append(handle)
+
+        if self._visible_count(notification.channel) < self._channel_limit(widget_class) and not any(
+                queued.channel == notification.channel for queued in self._queued):
+            self._show(notification)
+        else:
+            self._queued.append(notification)
+            while len(self._queued) > self._max_queued:
+                self._close_handles(self._queued.popleft())
+                self._stats['dropped'] += 1
+
+        self._set_active(True)
+
+        return handle
+
+    def dismiss(self, widget):
+        """
+        Starts the hide animation of the message shown by the given widget
+        :param widget: QWidget
+        """
+
+        for notification in self._visible:
+            if notification.widget is widget:
+                self._fade_out(notification)
+                break
+
+    def dismiss_notification(self, notification):
+        """
+        Starts the hide animation of the given message or discards it if it is queued
+        :param notification: _Notification
+        """
+
+        if notification in self._visible:
+            self._fade_out(notification)
+        elif notification in self._queued:
+            self._queued.remove(notification)
+            self._close_handles(notification)
+
+    def clear(self):
+        """
+        Hides all visible messages and discards queued ones
+        """
+
+        queued = self._queued
+        self._queued = deque()
+        for notification in queued:
+            self._close_handles(notification)
+        for notification in list(self._visible):
+            self._release(notification)
+        self._set_active(False)
+
+    def clear_pool(self):
+        """
+        Deletes all pooled widgets
+        """
+
+        for pool in self._pools.values():
+            for widget in pool:
+                self._destroy_widget(widget)
+        self._pools.clear()
+
+    def visible_widgets(self):
+        """
+        Returns widgets that are showing a message
+        :return: list(QWidget)
+        """
+
+        return [notification.widget for notification in self._visible]
+
+    def stats(self):
+        """
+        Returns manager statistics
+        :return: dict
+        """
+
+        stats = dict(self._stats)
+        stats['visible'] = len(self._visible)
+        stats['queued'] = len(self._queued)
+        stats['pooled'] = sum(len(pool) for pool in self._pools.values())
+        stats['alive'] = stats['created'] - stats['destroyed']
+
+        return stats
+
+    def reset_stats(self):
+        """
+        Resets manager statistics
+        """
+
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def tick(self, delta_seconds=None):
+        """
+        Expires, fades and releases visible messages and shows queued ones
+        Called by the global frame scheduler while there are visible or queued messages
+        :param delta_seconds: float
+        """
+
+        current_time = self._clock.elapsed()
+        for notification in list(self._visible):
+            try:
+                is_visible = notification.widget.isVisible()
+            except RuntimeError:
+                # Underlying Qt object was deleted (usually together with its parent)
+                self._visible.remove(notification)
+                self._close_handles(notification)
+                continue
+            if notification.release_time is not None:
+                if current_time >= notification.release_time:
+                    self._release(notification)
+            elif not is_visible:
+                self._release(notification)
+            elif current_time >= notification.expire_time:
+                self._fade_out(notification)
+
+        self._show_queued()
+        if not self._visible and not self._queued:
+            self._set_active(False)
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _channel_limit(self, widget_class):
+        """
+        Internal function that returns the maximum amount of visible messages of the given widget class
+        """
+
+        return min(self._max_visible, getattr(widget_class, 'NOTIFICATION_MAX_VISIBLE', None) or self._max_visible)
+
+    def _visible_count(self, channel):
+        """
+        Internal function that returns the amount of messages shown in the given channel (including fading ones)
+        """
+
+        return len([notification for notification in self._visible if notification.channel == channel])
+
+    def _merge(self, notification):
+        """
+        Internal function that merges given message into an identical visible or queued message
+        :return: _Notification or None
+        """
+
+        key = notification.key
+        for visible_notification in self._visible:
+            if visible_notification.release_time is None and visible_notification.key == key:
+                visible_notification.repeat += 1
+                visible_notification.duration = notification.duration
+                visible_notification.expire_time = self._expire_time(visible_notification)
+                visible_notification.widget.set_repeat_count(visible_notification.repeat)
+                return visible_notification
+        for queued_notification in self._queued:
+            if queued_notification.key == key:
+                queued_notification.repeat += 1
+                return queued_notification
+
+        return None
+
+    def _expire_time(self, notification):
+        """
+        Internal function that returns the time in which given message starts hiding
+        """
+
+        duration = notification.duration or notification.widget_class.DEFAULT_CONFIG.get('duration', 2)
+        fade_duration = getattr(notification.widget_class, 'FADE_DURATION', DEFAULT_FADE_DURATION)
+
+        return self._clock.elapsed() + max(0, int(duration * 1000) - fade_duration)
+
+    def _acquire_widget(self, notification):
+        """
+        Internal function that returns a pooled widget for the given message or creates a new one
+        """
+
+        pool = self._pools.get((notification.widget_class, notification.theme_type), list())
+        while pool:
+            widget = pool.pop()
+            try:
+                widget.reset_notification(notification.text, notification.closable, notification.parent)
+            except RuntimeError:
+                continue
+            self._stats['reused'] += 1
+            return widget
+
+        self._stats['created'] += 1
+        return notification.widget_class.create_notification(
+            notification.text, notification.theme_type, notification.closable, notification.parent)
+
+    def _show(self, notification):
+        """
+        Internal function that shows the given message
+        """
+
+        notification.widget = self._acquire_widget(notification)
+        notification.expire_time = self._expire_time(notification)
+        self._visible.append(notification)
+        if notification.repeat > 1:
+            notification.widget.set_repeat_count(notification.repeat)
+        self._place(notification.channel)
+        notification.widget.show()
+        notification.widget.fade_in()
+
+    def _show_queued(self):
+        """
+        Internal function that shows queued messages while there are free visible slots
+        """
+
+        if not self._queued:
+            return
+
+        still_queued = deque()
+        for notification in self._queued:
+            if self._visible_count(notification.channel) < self._channel_limit(notification.widget_class):
+                try:
+                    self._show(notification)
+                except RuntimeError:
+                    # Parent of the message was deleted while the message was queued
+                    self._stats['dropped'] += 1
+                    self._close_handles(notification)
+            else:
+                still_queued.append(notification)
+        self._queued = still_queued
+
+    def _fade_out(self, notification):
+        """
+        Internal function that starts the hide animation of the given message
+        """
+
+        if notification.release_time is not None:
+            return
+
+        fade_duration = getattr(notification.widget_class, 'FADE_DURATION', DEFAULT_FADE_DURATION)
+        notification.release_time = self._clock.elapsed() + fade_duration
+        notification.widget.fade_out()
+
+    def _release(self, notification):
+        """
+        Internal function that hides the widget of the given message and returns it to the pool
+        """
+
+        if notification in self._visible:
+            self._visible.remove(notification)
+
+        widget = notification.widget
+        notification.widget = None
+        self._close_handles(notification)
+        try:
+            widget.hide()
+            widget.notification_released()
+            widget.setParent(None, widget.windowFlags())
+        except RuntimeError:
+            return
+
+        pool = self._pools.setdefault((notification.widget_class, notification.theme_type), list())
+        if len(pool) < self._max_pooled:
+            pool.append(widget)
+        else:
+            self._destroy_widget(widget)
+
+        self._place(notification.channel)
+
+    def _place(self, channel):
+        """
+        Internal function that updates the position of the messages shown in the given channel
+        """
+
+        index = 0
+        for notification in self._visible:
+            if notification.channel != channel or notification.release_time is not None:
+                continue
+            try:
+                notification.widget.place(notification.parent, index)
+            except RuntimeError:
+                continue
+            index += 1
+
+    def _close_handles(self, notification):
+        """
+        Internal function that notifies the handles of the given message that it was hidden or discarded
+        """
+
+        handles = notification.handles
+        notification.handles = list()
+        for handle in handles:
+            handle.notification_closed()
+
+    def _destroy_widget(self, widget):
+        """
+        Internal function that deletes given widget
+        """
+
+        self._stats['destroyed'] += 1
+        try:
+            widget.deleteLater()
+        except RuntimeError:
+            pass
+
+    def _set_active(self, flag):
+        """
+        Internal function that registers or unregisters the manager from the global frame scheduler
+        """
+
+        if flag == self._active:
+            return
+
+        self._active = flag
+        if flag:
+            scheduler.frame_scheduler().register(self)
+        else:
+            scheduler.frame_scheduler().unregister(self)
+
+
+_NOTIFICATION_MANAGER = None
+
+
+def notification_manager():
+    """
+    Returns global notification manager
+    :return: NotificationManager
+    """
+
+    global _NOTIFICATION_MANAGER
+    if _NOTIFICATION_MANAGER is None:
+        _NOTIFICATION_MANAGER = NotificationManager()
+
+    return _NOTIFICATION_MANAGER
@@ -0,0 +1,163 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a microbenchmark that compares the cost of dynamic property mixins
+A big form of library widgets (BaseMenu and BaseComboBox) decorated with property_mixin and another one using their
+property_setter_mixin are built. Then, the same amount of events and property changes are sent to both of them.
+
+It can be executed from command line:
+    python -m tpDcc.libs.qt.core.propertybenchmark --widgets 500 --events 200
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import timeit
+import argparse
+
+from Qt.QtCore import Qt, QEvent, QPointF, QCoreApplication
+from Qt.QtWidgets import QApplication, QWidget
+from Qt.QtGui import QMouseEvent, QHoverEvent
+
+from tpDcc.libs.qt.core import mixin, menu
+from tpDcc.libs.qt.widgets import layouts, combobox
+
+# Library widgets that use property_setter_mixin
+BENCHMARK_WIDGET_CLASSES = (menu.BaseMenu, combobox.BaseComboBox)
+
+
+def _event_property_class(widget_class):
+    """
+    Internal function that returns a subclass of the given widget class that uses property_mixin
+    :param widget_class: type
+    :return: type
+    """
+
+    return mixin.property_mixin(type('_EventProperty{}'.format(widget_class.__name__), (widget_class,), {}))
+
+
+def _build_form(widget_classes, total_widgets):
+    """
+    Internal function that creates a form with the given number of widgets
+    :param widget_classes: list(type), widget classes instanced in turns
+    :param total_widgets: int
+    :return: tuple(QWidget, list(QWidget))
+    """
+
+    form = QWidget()
+    form_layout = layouts.VerticalLayout()
+    form.setLayout(form_layout)
+    widgets = list()
+    for i in range(total_widgets):
+        widget = widget_classes[i % len(widget_classes)](parent=form)
+        # Menus are popup windows, so they are not added into the form layout
+        if not isinstance(widget, menu.BaseMenu):
+            form_layout.addWidget(widget)
+        widgets.append(widget)
+
+    return form, widgets
+
+
+def _create_events():
+    """
+    Internal function that returns the events sent to the widgets of the forms
+    Each event is created with the class Qt expects for its type
+    :return: list(QEvent)
+    """
+
+    return [
+        QMouseEvent(QEvent.MouseMove, QPointF(1.0, 1.0), Qt.NoButton, Qt.NoButton, Qt.NoModifier),
+        QHoverEvent(QEvent.HoverMove, QPointF(1.0, 1.0), QPointF(0.0, 0.0)),
+        QEvent(QEvent.UpdateRequest),
+        QEvent(QEvent.LayoutRequest)
+    ]
+
+
+def _time_events(widgets, total_events):
+    """
+    Internal function that returns the time spent sending the given number of events to each widget
+    :param widgets: list(QWidget)
+    :param total_events: int
+    :return: float
+    """
+
+    events = _create_events()
+    start_time = timeit.default_timer()
+    for i in range(total_events):
+        event = events[i % len(events)]
+        for widget in widgets:
+            QCoreApplication.sendEvent(widget, event)
+
+    return timeit.default_timer() - start_time
+
+
+def _time_properties(widgets, total_changes, set_property):
+    """
+    Internal function that returns the time spent changing a dynamic property of each widget
+    :param widgets: list(QWidget)
+    :param total_changes: int
+    :param set_property: callable, function used to set the property
+    :return: float
+    """
+
+    start_time = timeit.default_timer()
+    for i in range(total_changes):
+        for widget in widgets:
+            set_property(widget, str(i))
+
+    return timeit.default_timer() - start_time
+
+
+def run_benchmark(total_widgets=500, total_events=200, total_changes=20):
+    """
+    Runs property mixins benchmark
+    :param total_widgets: int, number of widgets of each form
+    :param total_events: int, number of events sent to each widget
+    :param total_changes: int, number of property changes of each widget
+    :return: dict
+    """
+
+    QApplication.instance() or QApplication(sys.argv)
+
+    results = dict()
+    benchmarks = (
+        ('property_mixin', [_event_property_class(widget_class) for widget_class in BENCHMARK_WIDGET_CLASSES],
+         lambda widget, value: widget.setProperty('value', value)),
+        ('property_setter_mixin', BENCHMARK_WIDGET_CLASSES,
+         lambda widget, value: widget.set_property('value', value))
+    )
+    for name, widget_classes, set_property in benchmarks:
+        form, widgets = _build_form(widget_classes, total_widgets)
+        total_sent = total_events * total_widgets
+        events_time = _time_events(widgets, total_events)
+        properties_time = _time_properties(widgets, total_changes, set_property)
+        results[name] = {
+            'events_time': events_time,
+            'events_per_second': total_sent / events_time if events_time else 0.0,
+            'properties_time': properties_time
+        }
+        form.deleteLater()
+
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Compares event throughput of dynamic property mixins')
+    parser.add_argument('--widgets', type=int, default=500, help='Number of widgets of each form')
+    parser.add_argument('--events', type=int, default=200, help='Number of events sent to each widget')
+    parser.add_argument('--changes', type=int, default=20, help='Number of property changes of each widget')
+    parsed_args = parser.parse_args(args)
+
+    results = run_benchmark(
+        total_widgets=parsed_args.widgets, total_events=parsed_args.events, total_changes=parsed_args.changes)
+    print('{:>24} {:>16} {:>16} {:>16}'.format('mixin', 'events [ms]', 'events/s', 'properties [ms]'))
+    for name, result in results.items():
+        print('{:>24} {:>16.2f} {:>16.0f} {:>16.2f}'.format(
+            name, result['events_time'] * 1000.0, result['events_per_second'], result['properties_time'] * 1000.0))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -249,20 +249,32 @@ def ui_path(cls):
 def load_widget_ui(widget, path=None):
     """
     Loads UI of the given widget
+    If possible, compiled version of the UI file is used, so process current working directory is not modified.
+    If the UI cannot be loaded, the error is logged and widget ui attribute is not set
     :param widget: QWidget or QDialog
     :param path: str
     """
 
+    from tpDcc.libs.qt.core import uicache
+
     if not path:
         path = ui_path(widget.__class__)
 
+    compiled_ui = uicache.ui_cache().get(path)
+    if compiled_ui:
+        # Setup can fail after populating part of the widget, so loading the UI file again would duplicate its children
+        try:
+            widget.ui = compiled_ui.setup(widget)
+        except Exception:
+            LOGGER.exception('Impossible to setup compiled UI "{}"'.format(path))
+        return
+
     cwd = os.getcwd()
     try:
         os.chdir(os.path.dirname(path))
         widget.ui = QtCompat.loadUi(path, widget)
-    except Exception as e:
-        pass
-        # tpPyUtils.logger.debug('{} | {}'.format(e, traceback.format_exc()))
+    except Exception:
+        LOGGER.exception('Impossible to load UI "{}"'.format(path))
     finally:
         os.chdir(cwd)
 
@@ -275,9 +287,19 @@ def compat_ui_loader(ui_file, widget=None):
     :param widget: parent widget
     """
 
+    from tpDcc.libs.qt.core import uicache
+
     if not ui_file:
         ui_file = ui_path(widget.__class__)
 
+    compiled_ui = uicache.ui_cache().get(ui_file)
+    if compiled_ui:
+        ui = compiled_ui.create()
+        if widget:
+            for name in vars(ui).keys():
+                setattr(widget, name, getattr(ui, name))
+        return ui
+
     ui = QtCompat.loadUi(ui_file)
     if not widget:
         return ui
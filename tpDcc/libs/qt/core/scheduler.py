@@ -0,0 +1,259 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a frame scheduler that ticks windows and functions from a single QTimer
+Instead of each tool running its own polling timer, tools register into the global scheduler and they are ticked
+with the time elapsed since their previous tick. Each frame has a time budget, once it is consumed the remaining
+targets are ticked during the next frame
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+
+from Qt.QtCore import QObject, QTimer, QElapsedTimer
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+# Default amount of frames per second
+DEFAULT_FPS = 30
+
+# Default time budget (in milliseconds) of each frame
+DEFAULT_FRAME_BUDGET = 8.0
+
+
+class _TickTarget(object):
+    """
+    Internal class that stores a registered tick target
+    """
+
+    __slots__ = ('target', 'fn', 'last_time', 'ticks', 'total_time', 'max_time')
+
+    def __init__(self, target, fn, current_time):
+        self.target = target
+        self.fn = fn
+        self.last_time = current_time
+        self.ticks = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class FrameScheduler(QObject, object):
+    """
+    Ticks registered targets from a single QTimer
+    Targets can be objects with a tick(delta_seconds) function (such as MainWindow instances) or callables that
+    receive delta seconds. Widget targets are skipped while they are hidden
+    """
+
+    def __init__(self, fps=DEFAULT_FPS, frame_budget=DEFAULT_FRAME_BUDGET, parent=None):
+        super(FrameScheduler, self).__init__(parent)
+
+        self._frame_budget = frame_budget
+        self._targets = list()
+        self._next_index = 0
+        self._frames = 0
+        self._overruns = 0
+        self._deferred = 0
+        self._max_frame_time = 0.0
+
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / fps))
+        self._timer.timeout.connect(self._on_frame)
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def fps(self):
+        return 1000.0 / max(1, self._timer.interval())
+
+    @fps.setter
+    def fps(self, value):
+        self._timer.setInterval(int(1000 / value))
+
+    @property
+    def frame_budget(self):
+        return self._frame_budget
+
+    @frame_budget.setter
+    def frame_budget(self, value):
+        self._frame_budget = value
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def register(self, target):
+        """
+        Registers given target into the scheduler
+        :param target: object with a tick function or callable
+        """
+
+        if self.is_registered(target):
+            return
+
+        fn = getattr(target, 'tick', None) or target
+        if not callable(fn):
+            LOGGER.warning('Impossible to register "{}" into frame scheduler: it is not tickable'.format(target))
+            return
+
+        self._targets.append(_TickTarget(target, fn, self._elapsed()))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, target):
+        """
+        Removes given target from the scheduler
+        :param target: object with a tick function or callable
+        """
+
+        self._targets = [tick_target for tick_target in self._targets if tick_target.target is not target]
+        if not self._targets:
+            self._timer.stop()
+
+    def is_registered(self, target):
+        """
+        Returns whether given target is registered in the scheduler
+        :param target: object with a tick function or callable
+        :return: bool
+        """
+
+        return any(tick_target.target is target for tick_target in self._targets)
+
+    def clear(self):
+        """
+        Removes all registered targets
+        """
+
+        self._targets = list()
+        self._timer.stop()
+
+    def stats(self):
+        """
+        Returns scheduler statistics and the tick time of each target sorted by total tick time
+        :return: dict
+        """
+
+        targets = [{
+            'target': str(tick_target.target), 'ticks': tick_target.ticks, 'total_time': tick_target.total_time,
+            'max_time': tick_target.max_time} for tick_target in self._targets]
+
+        return {
+            'frames': self._frames, 'overruns': self._overruns, 'deferred': self._deferred,
+            'max_frame_time': self._max_frame_time,
+            'targets': sorted(targets, key=lambda target: target['total_time'], reverse=True)
+        }
+
+    def reset_stats(self):
+        """
+        Resets scheduler statistics
+        """
+
+        self._frames = 0
+        self._overruns = 0
+        self._deferred = 0
+        self._max_frame_time = 0.0
+        for tick_target in self._targets:
+            tick_target.ticks = 0
+            tick_target.total_time = 0.0
+            tick_target.max_time = 0.0
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _elapsed(self):
+        """
+        Internal function that returns the time (in milliseconds) elapsed since the scheduler was created
+        Nanoseconds precision is used so short ticks are not measured as zero
+        :return: float
+        """
+
+        return self._clock.nsecsElapsed() / 1e6
+
+    def _is_active(self, tick_target):
+        """
+        Internal function that returns whether given target should be ticked
+        Raises RuntimeError if the target widget was already deleted
+        """
+
+        is_visible = getattr(tick_target.target, 'isVisible', None)
+        return is_visible() if is_visible else True
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_frame(self):
+        """
+        Internal callback function that is called each frame
+        Targets are ticked in round robin order, starting where the previous frame stopped, until frame budget is
+        consumed
+        """
+
+        frame_start = self._elapsed()
+        targets = list(self._targets)
+        total_targets = len(targets)
+        start_index = self._next_index % total_targets if total_targets else 0
+        self._next_index = 0
+        self._frames += 1
+
+        invalid_targets = list()
+        for i in range(total_targets):
+            index = (start_index + i) % total_targets
+            tick_target = targets[index]
+            current_time = self._elapsed()
+            if i > 0 and current_time - frame_start > self._frame_budget:
+                self._next_index = index
+                self._deferred += total_targets - i
+                break
+            try:
+                is_active = self._is_active(tick_target)
+            except RuntimeError:
+                # Underlying Qt object was deleted
+                invalid_targets.append(tick_target)
+                continue
+            if not is_active:
+                # Hidden targets get a regular delta when they are ticked again
+                tick_target.last_time = current_time
+                continue
+            delta_seconds = (current_time - tick_target.last_time) / 1000.0
+            tick_target.last_time = current_time
+            try:
+                tick_target.fn(delta_seconds)
+            except Exception:
+                LOGGER.exception('Error while ticking "{}"'.format(tick_target.target))
+            tick_time = (self._elapsed() - current_time) / 1000.0
+            tick_target.ticks += 1
+            tick_target.total_time += tick_time
+            tick_target.max_time = max(tick_target.max_time, tick_time)
+
+        frame_time = self._elapsed() - frame_start
+        self._max_frame_time = max(self._max_frame_time, frame_time / 1000.0)
+        if frame_time > self._frame_budget:
+            self._overruns += 1
+            LOGGER.debug('Frame scheduler budget exceeded: {:.2f} ms > {} ms'.format(frame_time, self._frame_budget))
+
+        for tick_target in invalid_targets:
+            self.unregister(tick_target.target)
+
+
+_FRAME_SCHEDULER = None
+
+
+def frame_scheduler():
+    """
+    Returns global frame scheduler
+    :return: FrameScheduler
+    """
+
+    global _FRAME_SCHEDULER
+    if _FRAME_SCHEDULER is None:
+        _FRAME_SCHEDULER = FrameScheduler()
+
+    return _FRAME_SCHEDULER
@@ -9,6 +9,9 @@ from __future__ import print_function, division, absolute_import
 
 from Qt.QtCore import Signal, QObject, QTimer
 
+# Default interval (in milliseconds) used to rate limit live value updates (one update per frame at 60 FPS)
+DEFAULT_THROTTLE_INTERVAL = 16
+
 
 class ClickTimer(QObject, object):
     executed = Signal()
@@ -45,6 +48,169 @@ class ClickTimer(QObject, object):
         self.remove_timer()
 
 
+class EmitPolicy(object):
+    """
+    Defines how a ValueThrottle emits live values
+    """
+
+    IMMEDIATE = 'immediate'     # All live values are emitted
+    THROTTLE = 'throttle'       # Live values are emitted at most once per interval
+    COMMIT = 'commit'           # Live values are not emitted, only the final value is emitted when committed
+
+
+class ValueThrottle(QObject, object):
+    """
+    Rate limits the values emitted by a widget while the user is interacting with it (dragging a slider, etc)
+    Live values are emitted through valueChanged signal following the emit policy while the final value is emitted
+    through both valueChanged (if it was not emitted yet) and valueCommitted signals when the interaction ends
+    """
+
+    valueChanged = Signal(object)
+    valueCommitted = Signal(object)
+
+    def __init__(self, interval=DEFAULT_THROTTLE_INTERVAL, policy=EmitPolicy.THROTTLE, trailing=True, parent=None):
+        super(ValueThrottle, self).__init__(parent)
+
+        self._policy = policy
+        self._trailing = trailing
+        self._value = None
+        self._pending = False
+        self._received = 0
+        self._emitted = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @policy.setter
+    def policy(self, value):
+        self._policy = value
+        if value == EmitPolicy.IMMEDIATE:
+            self.flush()
+
+    @property
+    def interval(self):
+        return self._timer.interval()
+
+    @interval.setter
+    def interval(self, value):
+        self._timer.setInterval(value)
+
+    @property
+    def trailing(self):
+        return self._trailing
+
+    @trailing.setter
+    def trailing(self, flag):
+        self._trailing = flag
+
+    @property
+    def value(self):
+        return self._value
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def push(self, value):
+        """
+        Pushes a new live value
+        If trailing is enabled, the last value pushed during an interval is emitted once the interval ends. Otherwise
+        that value is only emitted when the interaction is committed
+        :param value: object
+        """
+
+        self._value = value
+        self._pending = True
+        self._received += 1
+
+        if self._policy == EmitPolicy.IMMEDIATE:
+            self._emit()
+        elif self._policy == EmitPolicy.THROTTLE and not self._timer.isActive():
+            self._emit()
+            self._timer.start()
+
+    def flush(self):
+        """
+        Emits the last pushed value if it was not emitted yet
+        """
+
+        self._timer.stop()
+        if self._pending:
+            self._emit()
+
+    def commit(self, value=None):
+        """
+        Ends current interaction emitting its final value
+        :param value: object or None, final value. If not given, last pushed value is used
+        """
+
+        if value is not None and value != self._value:
+            self._value = value
+            self._pending = True
+        self.flush()
+        self.valueCommitted.emit(self._value)
+
+    def cancel(self):
+        """
+        Discards the pending value without emitting it
+        """
+
+        self._timer.stop()
+        self._pending = False
+
+    def stats(self):
+        """
+        Returns the number of received and emitted values
+        :return: dict
+        """
+
+        return {'received': self._received, 'emitted': self._emitted}
+
+    def reset_stats(self):
+        """
+        Resets received and emitted values counters
+        """
+
+        self._received = 0
+        self._emitted = 0
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _emit(self):
+        """
+        Internal function that emits current value
+        """
+
+        self._pending = False
+        self._emitted += 1
+        self.valueChanged.emit(self._value)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_timeout(self):
+        """
+        Internal callback function that is called when throttle interval ends
+        """
+
+        if self._pending and self._trailing and self._policy == EmitPolicy.THROTTLE:
+            self._emit()
+            self._timer.start()
+
+
 def defer(delay, fn, default_delay=1):
     """
     Append artificial delay to `func`
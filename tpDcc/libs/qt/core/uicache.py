@@ -0,0 +1,226 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a cache of compiled .ui files
+Each .ui file is compiled into Python code only once (per file modification time) and the resulting setup class is
+reused every time a widget is built from that file
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import logging
+import threading
+from xml.etree import ElementTree
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from Qt import QtCore, QtGui, QtWidgets
+from Qt import __binding__
+
+from tpDcc.libs.python import python
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+# Regex used to remove the Qt binding import lines from the compiled code, we inject our own Qt modules
+_BINDING_IMPORT_REGEX = re.compile(r'^from (PySide2|PySide|PyQt5|PyQt4) import .*$', re.MULTILINE)
+
+
+def _get_ui_compiler():
+    """
+    Internal function that returns compileUi function of the current Qt binding
+    :return: callable or None
+    """
+
+    try:
+        if __binding__ == 'PySide2':
+            from pyside2uic import compileUi
+        elif __binding__ == 'PySide':
+            from pysideuic import compileUi
+        elif __binding__ == 'PyQt5':
+            from PyQt5.uic import compileUi
+        elif __binding__ == 'PyQt4':
+            from PyQt4.uic import compileUi
+        else:
+            return None
+    except ImportError:
+        return None
+
+    return compileUi
+
+
+class _ResourcesGuiModule(object):
+    """
+    Proxy of QtGui module that resolves relative image paths of a .ui file from the .ui file directory
+    This allows to use compiled .ui files without changing the current working directory of the process
+    """
+
+    def __init__(self, ui_directory):
+        self._ui_directory = ui_directory
+
+        def _resolve(args):
+            if args and python.is_string(args[0]) and args[0] and not args[0].startswith(':'):
+                if not os.path.isabs(args[0]):
+                    args = (os.path.join(ui_directory, args[0]),) + tuple(args[1:])
+            return args
+
+        class _Pixmap(QtGui.QPixmap):
+            def __init__(self, *args):
+                super(_Pixmap, self).__init__(*_resolve(args))
+
+        class _Icon(QtGui.QIcon):
+            def __init__(self, *args):
+                super(_Icon, self).__init__(*_resolve(args))
+
+        self.QPixmap = _Pixmap
+        self.QIcon = _Icon
+
+    def __getattr__(self, name):
+        return getattr(QtGui, name)
+
+
+class CompiledUi(object):
+    """
+    Class that stores the compiled setup class of a .ui file
+    """
+
+    def __init__(self, ui_file, form_class, base_class_name):
+        self.ui_file = ui_file
+        self.form_class = form_class
+        self.base_class_name = base_class_name
+
+    def setup(self, widget):
+        """
+        Setups given widget with the .ui contents and copies form members into it
+        :param widget: QWidget
+        :return: QWidget
+        """
+
+        form = self.form_class()
+        form.setupUi(widget)
+        for name, value in vars(form).items():
+            setattr(widget, name, value)
+
+        return widget
+
+    def create(self, parent=None):
+        """
+        Creates a new widget from the .ui file
+        :param parent: QWidget
+        :return: QWidget
+        """
+
+        base_class = getattr(QtWidgets, self.base_class_name, None) or getattr(QtGui, self.base_class_name, None)
+        if base_class is None:
+            base_class = QtWidgets.QWidget
+
+        return self.setup(base_class(parent))
+
+
+class UiCache(object):
+    """
+    Cache of compiled .ui files keyed by .ui file path and modification time
+    """
+
+    def __init__(self):
+        self._cache = dict()
+        self._lock = threading.Lock()
+        self._compiler = _get_ui_compiler()
+
+    def is_available(self):
+        """
+        Returns whether .ui files can be compiled with current Qt binding
+        :return: bool
+        """
+
+        return self._compiler is not None
+
+    def clear(self):
+        """
+        Removes all the compiled .ui files from cache
+        """
+
+        with self._lock:
+            self._cache.clear()
+
+    def get(self, ui_file):
+        """
+        Returns the compiled version of the given .ui file, compiling it if necessary
+        :param ui_file: str
+        :return: CompiledUi or None
+        """
+
+        if not self._compiler or not ui_file or not os.path.isfile(ui_file):
+            return None
+
+        ui_file = os.path.normpath(os.path.abspath(ui_file))
+        key = (ui_file, os.path.getmtime(ui_file))
+        if key in self._cache:
+            return self._cache[key]
+
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+            try:
+                compiled_ui = self._compile(ui_file)
+            except Exception as exc:
+                LOGGER.debug('Impossible to compile UI file "{}": {}'.format(ui_file, exc))
+                compiled_ui = None
+            for cached_key in [k for k in self._cache if k[0] == ui_file]:
+                self._cache.pop(cached_key)
+            self._cache[key] = compiled_ui
+
+        return compiled_ui
+
+    def _compile(self, ui_file):
+        """
+        Internal function that compiles given .ui file into a setup class
+        :param ui_file: str
+        :return: CompiledUi or None
+        """
+
+        code_stream = StringIO()
+        self._compiler(ui_file, code_stream)
+        code = _BINDING_IMPORT_REGEX.sub('', code_stream.getvalue())
+
+        namespace = {
+            '__name__': 'ui_{}'.format(os.path.splitext(os.path.basename(ui_file))[0]),
+            'QtCore': QtCore,
+            'QtGui': _ResourcesGuiModule(os.path.dirname(ui_file)),
+            'QtWidgets': QtWidgets
+        }
+        exec(compile(code, ui_file, 'exec'), namespace)
+
+        form_class = None
+        for name, value in namespace.items():
+            if name.startswith('Ui_') and isinstance(value, type):
+                form_class = value
+                break
+        if not form_class:
+            return None
+
+        root_widget = ElementTree.parse(ui_file).getroot().find('widget')
+        base_class_name = root_widget.get('class') if root_widget is not None else 'QWidget'
+
+        return CompiledUi(ui_file, form_class, base_class_name)
+
+
+_UI_CACHE = None
+
+
+def ui_cache():
+    """
+    Returns global .ui files cache
+    :return: UiCache
+    """
+
+    global _UI_CACHE
+    if _UI_CACHE is None:
+        _UI_CACHE = UiCache()
+
+    return _UI_CACHE
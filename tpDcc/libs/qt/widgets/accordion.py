@@ -15,6 +15,7 @@ from Qt.QtGui import QCursor, QColor, QPixmap, QPalette, QPen, QBrush, QPainter,
 
 from tpDcc import dcc
 from tpDcc.libs.resources.core import theme
+from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
@@ -363,6 +364,7 @@ class AccordionWidget(QScrollArea, object):
         self._scroll_init_y = 0
         self._scroll_init_val = 0
         self._item_class = AccordionItem
+        self._unload_timeout = None
 
         self.setFrameShape(QScrollArea.NoFrame)
         self.setAutoFillBackground(False)
@@ -398,9 +400,19 @@ class AccordionWidget(QScrollArea, object):
     def set_item_class(self, item_class):
         self._item_class = item_class
 
+    def get_unload_timeout(self):
+        return self._unload_timeout
+
+    def set_unload_timeout(self, timeout):
+        self._unload_timeout = timeout
+        for item in self.findChildren(AccordionItem):
+            if isinstance(item.widget, base.LazyWidget):
+                item.widget.set_unload_timeout(timeout)
+
     drag_drop_mode = property(get_drag_drop_mode, set_drag_drop_mode)
     rollout_style = property(get_rollout_style, set_rollout_style)
     item_class = property(get_item_class, set_item_class)
+    unload_timeout = property(get_unload_timeout, set_unload_timeout)
 
     def eventFilter(self, object, event):
         if event.type() == QEvent.MouseButtonPress:
@@ -460,8 +472,19 @@ class AccordionWidget(QScrollArea, object):
         self.widget().layout().setSpacing(space_int)
 
     def add_item(self, title, widget, collapsed=False, icon=None):
+        """
+        Adds a new item into the accordion
+        :param title: str
+        :param widget: QWidget or callable, if a callable is given, it is used to build the item contents the first
+            time the item is expanded
+        :param collapsed: bool
+        :param icon: QIcon or None
+        :return: AccordionItem
+        """
+
         self.setUpdatesEnabled(False)
         try:
+            widget = base.lazy_widget(widget, unload_timeout=self._unload_timeout)
             item = self._item_class(self, title, widget, icon=icon)
             item.rollout_style = self.rollout_style
             item.drag_drop_mode = self.drag_drop_mode
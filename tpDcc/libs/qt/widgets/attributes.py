@@ -8,8 +8,9 @@ Module that contains classes to create attribute editors
 from __future__ import print_function, division, absolute_import
 
 import logging
+from collections import OrderedDict
 
-from Qt.QtCore import Qt, Signal, QPoint, QPointF, QSize, QRegExp
+from Qt.QtCore import Qt, Signal, QPoint, QPointF, QSize, QRegExp, QTimer
 from Qt.QtWidgets import QWidget, QGroupBox, QScrollArea, QLineEdit, QCheckBox, QSlider, QColorDialog
 from Qt.QtGui import QColor, QPalette
 
@@ -21,12 +22,28 @@ LOGGER = logging.getLogger('tpDcc-libs-qt')
 
 
 class AttributeEditor(base.BaseWidget, object):
+    """
+    Widget that shows an editor for each attribute of the current objects
+    Editors are reused between rebuilds when the attribute type matches and values changed by the user in the same
+    event loop turn are emitted together through valuesChanged signal
+    """
+
+    valuesChanged = Signal(dict)
+
     def __init__(self, name='AttributeEditor', label='Attribute Editor', parent=None):
         self._label = label
         self._objects = list()
+        self._editors = OrderedDict()
+        self._pending_values = OrderedDict()
         super(AttributeEditor, self).__init__(parent=parent)
         self.setObjectName(name)
 
+        # Single shot timer with no interval, times out once the event loop processes pending events
+        self._values_timer = QTimer(self)
+        self._values_timer.setSingleShot(True)
+        self._values_timer.setInterval(0)
+        self._values_timer.timeout.connect(self.flush_values)
+
     def get_objects(self):
         return self._objects
 
@@ -73,16 +90,132 @@ class AttributeEditor(base.BaseWidget, object):
         Clears main layout and resetes editor title
         """
 
+        self._editors.clear()
+        self._pending_values.clear()
         qtutils.clear_layout(self._main_group_layout)
         if reset_title:
             self._main_group.setTitle('')
 
+    def editor(self, name):
+        """
+        Returns the editor of the attribute with given name
+        :param name: str
+        :return: BaseEditor or None
+        """
+
+        return self._editors.get(name)
+
+    def editors(self):
+        """
+        Returns all attribute editors
+        :return: list(BaseEditor)
+        """
+
+        return list(self._editors.values())
+
+    def set_attributes(self, attributes, values=None):
+        """
+        Updates attribute editors to show the given attributes
+        Editors of attributes that are shown again with the same type are kept, and editors of removed attributes are
+        reused by new attributes with the same editor class. Only editors that cannot be reused are created or deleted
+        :param attributes: list(tuple(str, str)), list of attribute names and types
+        :param values: dict or None, attribute values indexed by attribute name
+        """
+
+        new_editors = OrderedDict()
+        spare_editors = dict()
+        attribute_types = OrderedDict(attributes)
+        for name, editor in self._editors.items():
+            editor_class = get_editor_class(attribute_types.get(name, ''))
+            if editor_class is not None and type(editor) is editor_class:
+                new_editors[name] = editor
+            else:
+                spare_editors.setdefault(type(editor), list()).append(editor)
+
+        for name, attr_type in attribute_types.items():
+            if name in new_editors:
+                continue
+            editor_class = get_editor_class(attr_type)
+            if editor_class is None:
+                LOGGER.warning('Invalid Editor Class: "{0}" ("{1}")'.format(attr_type, name))
+                continue
+            reused_editors = spare_editors.get(editor_class)
+            if reused_editors:
+                editor = reused_editors.pop()
+                editor.name = name
+                editor.set_value(get_default_value(attr_type))
+            else:
+                editor = editor_class(parent=self._main_group, name=name)
+                editor.valueChanged.connect(self._on_editor_value_changed)
+            new_editors[name] = editor
+
+        for editors in spare_editors.values():
+            for editor in editors:
+                self._main_group_layout.removeWidget(editor)
+                editor.deleteLater()
+
+        for name in list(self._pending_values.keys()):
+            if name not in new_editors:
+                self._pending_values.pop(name)
+
+        # Editors are inserted in attributes order without destroying them
+        for editor in new_editors.values():
+            self._main_group_layout.removeWidget(editor)
+        for editor in new_editors.values():
+            self._main_group_layout.addWidget(editor)
+            editor.show()
+
+        self._editors = new_editors
+        if values:
+            self.set_values(values)
+
+    def set_values(self, values):
+        """
+        Pushes given attribute values into their editors without emitting valuesChanged signal
+        :param values: dict, attribute values indexed by attribute name
+        """
+
+        for name, value in values.items():
+            editor = self._editors.get(name)
+            if editor is None:
+                continue
+            editor.blockSignals(True)
+            try:
+                editor.set_value(value)
+            finally:
+                editor.blockSignals(False)
+
+    def flush_values(self):
+        """
+        Emits the values changed by the user since last emission
+        """
+
+        self._values_timer.stop()
+        if not self._pending_values:
+            return
+
+        values = dict(self._pending_values)
+        self._pending_values.clear()
+        self.valuesChanged.emit(values)
+
     def _build_layout(self):
         pass
 
     def _on_create_context_menu(self):
         pass
 
+    def _on_editor_value_changed(self, editor):
+        """
+        Internal callback function that is called each time an editor value changes
+        Values are coalesced and emitted once per event loop turn
+        :param editor: BaseEditor
+        """
+
+        self._pending_values.pop(editor.name, None)
+        self._pending_values[editor.name] = editor.value
+        if not self._values_timer.isActive():
+            self._values_timer.start()
+
 
 class BaseEditor(QWidget, object):
     attr_type = 'None'
@@ -91,11 +224,18 @@ class BaseEditor(QWidget, object):
     def __init__(self, parent=None, **kwargs):
         super(BaseEditor, self).__init__(parent=parent)
 
+        self._name = kwargs.get('name', '')
         self._default_value = 0.0
         self._current_value = None
 
         self.main_layout = layouts.HorizontalLayout(spacing=3, margins=(1, 1, 1, 1), parent=self)
 
+    def get_name(self):
+        return self._name
+
+    def set_name(self, name):
+        self._name = name
+
     def get_default_value(self):
         return self._default_value
 
@@ -109,6 +249,7 @@ class BaseEditor(QWidget, object):
     def set_value(self, value):
         pass
 
+    name = property(get_name, set_name)
     default_value = property(get_default_value, set_default_value)
     value = property(get_value)
 
@@ -133,9 +274,17 @@ class FloatEditor(BaseEditor, object):
         self.value_line = lineedit.FloatLineEdit(self)
         self.main_layout.addWidget(self.value_line)
 
+        self.value_line.valueChanged.connect(self.OnValueUpdated)
+
     def get_value(self):
         return self.value_line.value
 
+    def set_value(self, value):
+        self.value_line.blockSignals(True)
+        self.value_line.setText(str(self.default_value if value is None else value))
+        self.value_line.blockSignals(False)
+        self._current_value = self.value
+
     value = property(get_value)
 
     def initialize_editor(self):
@@ -154,7 +303,6 @@ class FloatEditor(BaseEditor, object):
                 self.value_line.blockSignals(True)
                 self.value_line.setText(str(editor_value))
                 self.value_line.blockSignals(False)
-                self.value_line.valueChanged.connect(self.OnValueUpdated)
 
     def set_connected(self, conn):
         if conn != self._connection:
@@ -178,9 +326,22 @@ class Float2Editor(BaseEditor, object):
         self.main_layout.addWidget(self.value1_line)
         self.main_layout.addWidget(self.value2_line)
 
+        self.value1_line.valueChanged.connect(self.OnValueUpdated)
+        self.value2_line.valueChanged.connect(self.OnValueUpdated)
+
     def get_value(self):
         return self.value1_line.value, self.value2_line.value
 
+    def set_value(self, value):
+        value = self.default_value if value is None else value
+        if type(value) in [QPoint, QPointF]:
+            value = (value.x(), value.y())
+        for value_line, component in zip((self.value1_line, self.value2_line), value):
+            value_line.blockSignals(True)
+            value_line.setText(str(component))
+            value_line.blockSignals(False)
+        self._current_value = self.value
+
     value = property(get_value)
 
     def initialize_editor(self):
@@ -205,8 +366,6 @@ class Float2Editor(BaseEditor, object):
                     self.value2_line.setText(str(editor_value[1]))
                 self.value1_line.blockSignals(False)
                 self.value2_line.blockSignals(False)
-                self.value1_line.valueChanged.connect(self.OnValueUpdated)
-                self.value2_line.valueChanged.connect(self.OnValueUpdated)
 
     def set_connected(self, conn):
         if conn != self._connection:
@@ -234,8 +393,20 @@ class Float3Editor(BaseEditor, object):
         self.main_layout.addWidget(self.value2_line)
         self.main_layout.addWidget(self.value3_line)
 
+        self.value1_line.valueChanged.connect(self.OnValueUpdated)
+        self.value2_line.valueChanged.connect(self.OnValueUpdated)
+        self.value3_line.valueChanged.connect(self.OnValueUpdated)
+
     def get_value(self):
-        return self.value1_line.value(), self.value2_line.value(), self.value3_line.value()
+        return self.value1_line.value, self.value2_line.value, self.value3_line.value
+
+    def set_value(self, value):
+        value = self.default_value if value is None else value
+        for value_line, component in zip((self.value1_line, self.value2_line, self.value3_line), value):
+            value_line.blockSignals(True)
+            value_line.setText(str(component))
+            value_line.blockSignals(False)
+        self._current_value = self.value
 
     value = property(get_value)
 
@@ -259,9 +430,6 @@ class Float3Editor(BaseEditor, object):
                 self.value1_line.blockSignals(False)
                 self.value2line.blockSignals(False)
                 self.value3line.blockSignals(False)
-                self.value1_line.valueChanged.connect(self.OnValueUpdated)
-                self.value2_line.valueChanged.connect(self.OnValueUpdated)
-                self.value3_line.valueChanged.connect(self.OnValueUpdated)
 
     def set_connected(self, conn):
         if conn != self._connection:
@@ -296,6 +464,12 @@ class StringEditor(BaseEditor, object):
     def get_value(self):
         return str(self.value_line.text())
 
+    def set_value(self, value):
+        self.value_line.blockSignals(True)
+        self.value_line.setText(str(self.default_value if value is None else value))
+        self.value_line.blockSignals(False)
+        self._current_value = self.value
+
     value = property(get_value)
 
     def initialize_editor(self):
@@ -353,6 +527,14 @@ class BoolEditor(BaseEditor, object):
     def get_value(self):
         return self.cbx.isChecked()
 
+    def set_value(self, value):
+        self.cbx.blockSignals(True)
+        self.cbx.setChecked(bool(value))
+        self.cbx.blockSignals(False)
+        self._current_value = self.value
+
+    value = property(get_value)
+
     def initialize_editor(self):
         editor_value = self.default_value
 
@@ -465,6 +647,12 @@ class ColorPicker(BaseEditor, object):
     def get_value(self):
         return self.color_swatch.color
 
+    def set_value(self, value):
+        self.color_swatch.set_color(self.default_value if value is None else value)
+        self._current_value = self.value
+
+    value = property(get_value)
+
     def initialize_editor(self):
         editor_value = self.default_value
 
@@ -529,8 +717,24 @@ class FileEditor(BaseEditor, object):
     def __init__(self, parent=None, **kwargs):
         super(FileEditor, self).__init__(parent=parent, **kwargs)
 
-        line_widget = directory.SelectFile()
-        self.main_layout.addWidget(line_widget)
+        self._default_value = ''
+
+        self.file_widget = directory.SelectFile()
+        self.main_layout.addWidget(self.file_widget)
+
+        self.file_widget.directoryChanged.connect(self.OnValueUpdated)
+        self.file_widget.file_line.editingFinished.connect(self.OnValueUpdated)
+
+    def get_value(self):
+        return str(self.file_widget.file_line.text())
+
+    def set_value(self, value):
+        self.file_widget.file_line.blockSignals(True)
+        self.file_widget.file_line.setText(str(self.default_value if value is None else value))
+        self.file_widget.file_line.blockSignals(False)
+        self._current_value = self.value
+
+    value = property(get_value)
 
 
 # ===============================================================================
@@ -556,6 +760,34 @@ WIDGET_MAPPER = dict(
 )
 
 
+def get_editor_class(attr_type):
+    """
+    Returns the editor class used by the given attribute type
+    :param attr_type: str
+    :return: type or None
+    """
+
+    widget_type = attr_type.replace(' ', '').lower()
+    if widget_type not in WIDGET_MAPPER:
+        return None
+
+    return WIDGET_MAPPER[widget_type][0]
+
+
+def get_default_value(attr_type):
+    """
+    Returns the default value of the given attribute type
+    :param attr_type: str
+    :return: object
+    """
+
+    widget_type = attr_type.replace(' ', '').lower()
+    if widget_type not in WIDGET_MAPPER:
+        return None
+
+    return WIDGET_MAPPER[widget_type][1]
+
+
 def map_widget(attr_type, name, parent=None):
     """
     Map the widget to the attribute type
@@ -565,10 +797,9 @@ def map_widget(attr_type, name, parent=None):
     :return:
     """
 
-    widget_type = attr_type.replace(' ', '').lower()
-    if widget_type not in WIDGET_MAPPER:
+    cls = get_editor_class(attr_type)
+    if cls is None:
         LOGGER.warning('Invalid Editor Class: "{0}" ("{1}")'.format(attr_type, name))
-    else:
-        cls = WIDGET_MAPPER.get(widget_type)[0]
-        return cls(parent=parent, name=name)
-    return
+        return
+
+    return cls(parent=parent, name=name)
@@ -7,12 +7,13 @@ Module that contains implementation for avatar/user widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Property
+from Qt.QtCore import Qt, Property, QSize
 from Qt.QtWidgets import QLabel
 from Qt.QtGui import QPixmap
 
 from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
+from tpDcc.libs.qt.core import image as qt_image
 
 
 @theme.mixin
@@ -26,6 +27,7 @@ class Avatar(QLabel, object):
 
         self._default_pixmap = resources.pixmap('user')
         self._pixmap = self._default_pixmap
+        self._image_path = None
         self._size = 0
         self._set_size(self.theme_default_size())
 
@@ -80,6 +82,18 @@ class Avatar(QLabel, object):
     # BASE
     # =================================================================================================================
 
+    def set_image_path(self, image_path):
+        """
+        Loads avatar image from disk in a background thread. Image is downscaled to avatar size while it is decoded
+        :param image_path: str
+        """
+
+        loader = qt_image.image_loader()
+        if self._image_path and self._image_path != image_path:
+            loader.cancel(self._image_path, QSize(self._size, self._size), self._on_image_loaded)
+        self._image_path = image_path
+        loader.request(image_path, QSize(self._size, self._size), self._on_image_loaded)
+
     @classmethod
     def tiny(cls, image=None, parent=None):
         """
@@ -164,3 +178,16 @@ class Avatar(QLabel, object):
         avatar_widget.image = image
 
         return avatar_widget
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_image_loaded(self, loaded_image):
+        """
+        Internal callback function that is called when avatar image is loaded
+        :param loaded_image: QImage
+        """
+
+        if loaded_image is not None and not loaded_image.isNull():
+            self._set_image(QPixmap.fromImage(loaded_image))
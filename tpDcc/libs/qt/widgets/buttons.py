@@ -18,8 +18,7 @@ from tpDcc import dcc
 from tpDcc.managers import resources
 from tpDcc.libs.python import python
 from tpDcc.libs.resources.core import icon, theme
-from tpDcc.libs.qt.core import consts, animation, qtutils, menu
-from tpDcc.libs.qt.widgets import tooltips
+from tpDcc.libs.qt.core import consts, animation, qtutils, menu, iconcache
 
 # ===================================================================
 
@@ -275,9 +274,9 @@ class BaseToolButton(QToolButton, object):
             if theme:
                 accent_color = theme.accent_color
                 if self._image_theme:
-                    self.setIcon(resources.icon(self._image, theme=self._image_theme, color=accent_color))
+                    self.setIcon(iconcache.icon(self._image, theme=self._image_theme, color=accent_color))
                 else:
-                    self.setIcon(resources.icon(self._image, color=accent_color))
+                    self.setIcon(iconcache.icon(self._image, color=accent_color))
         return super(BaseToolButton, self).enterEvent(event)
 
     def leaveEvent(self, event):
@@ -290,9 +289,9 @@ class BaseToolButton(QToolButton, object):
             if image_theme:
                 kwargs['theme'] = image_theme
             if self.isCheckable() and self.isChecked():
-                self.setIcon(resources.icon(self._image, **kwargs))
+                self.setIcon(iconcache.icon(self._image, **kwargs))
             else:
-                self.setIcon(resources.icon(self._image, **kwargs))
+                self.setIcon(iconcache.icon(self._image, **kwargs))
 
     # =================================================================================================================
     # BASE
@@ -867,12 +866,12 @@ class ButtonIcons(QAbstractButton):
 
         hover_color = (255, 255, 255, self.highlightOffset)
 
-        self.idleIcon = icon.colorize_layered_icon(
+        self.idleIcon = iconcache.colorized_icon(
             icons=self.icon, size=self.iconSize().width(), icon_scaling=self.iconScaling,
             tint_composition=self.tintComposition, colors=self.iconColors, grayscale=self.grayscale
         )
 
-        self.hoverIcon = icon.colorize_layered_icon(
+        self.hoverIcon = iconcache.colorized_icon(
             icons=self.icon, size=self.iconSize().width(), icon_scaling=self.iconScaling,
             tint_composition=self.tintComposition, tint_color=hover_color, grayscale=self.grayscale
         )
@@ -898,6 +897,8 @@ class BaseMenuButton(QPushButton, ButtonIcons):
 
         def keyPressEvent(self, event):
             if event.key() == self._tt_key:
+                # Imported here to avoid loading tooltips module (and its dependencies) when buttons are imported
+                from tpDcc.libs.qt.widgets import tooltips
                 pos = self.mapFromGlobal(QCursor.pos())
                 action = self.actionAt(pos)
                 if tooltips.has_expanded_tooltips(action):
@@ -22,7 +22,7 @@ from tpDcc.dcc import dialog
 from tpDcc.managers import resources
 from tpDcc.libs.python import python
 from tpDcc.libs.resources.core import color as core_color
-from tpDcc.libs.qt.core import base, utils, qtutils, contexts as qt_contexts
+from tpDcc.libs.qt.core import base, utils, qtutils, timers, contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, buttons, label, spinbox, dividers, panel, sliders
 
 
@@ -419,9 +419,11 @@ class Color2DSlider(QWidget, object):
     """
     Widget that allow to select 2 HSV color components at the same time
     https://gitlab.com/mattia.basaglia/Qt-Color-Widgets
+    While dragging, colorChanged signal is rate limited and colorCommitted signal is emitted once the drag ends
     """
 
     colorChanged = Signal(QColor)
+    colorCommitted = Signal(QColor)
     componentXChanged = Signal(int)
     componentYChanged = Signal(int)
 
@@ -443,6 +445,10 @@ class Color2DSlider(QWidget, object):
 
         super(Color2DSlider, self).__init__(parent=parent)
 
+        self._color_throttle = timers.ValueThrottle(parent=self)
+        self._color_throttle.valueChanged.connect(self.colorChanged.emit)
+        self._color_throttle.valueCommitted.connect(self.colorCommitted.emit)
+
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
     def sizeHint(self):
@@ -462,19 +468,23 @@ class Color2DSlider(QWidget, object):
 
     def mousePressEvent(self, event):
         self._set_color_from_pos(event.pos(), self.size())
-        self.colorChanged.emit(self.color())
+        self._color_throttle.push(self.color())
         self.update()
 
     def mouseMoveEvent(self, event):
         self._set_color_from_pos(event.pos(), self.size())
-        self.colorChanged.emit(self.color())
+        self._color_throttle.push(self.color())
         self.update()
 
     def mouseReleaseEvent(self, event):
         self._set_color_from_pos(event.pos(), self.size())
-        self.colorChanged.emit(self.color())
+        self._color_throttle.commit(self.color())
         self.update()
 
+    @property
+    def color_throttle(self):
+        return self._color_throttle
+
     def hue(self):
         return self._hue
 
@@ -1550,6 +1560,7 @@ class GradientSlider(QSlider, object):
 class HueSlider(GradientSlider, object):
     """
     Special gradient slider to select a hue
+    While dragging, colorChanged signal is rate limited and colorCommitted signal is emitted once the drag ends
     """
 
     colorSaturationChanged = Signal(float)
@@ -1557,6 +1568,7 @@ class HueSlider(GradientSlider, object):
     colorHueChanged = Signal(float)
     colorAlphaChanged = Signal(float)
     colorChanged = Signal(QColor)
+    colorCommitted = Signal(QColor)
 
     def __init__(self, orientation=Qt.Horizontal, parent=None):
         super(HueSlider, self).__init__(orientation=orientation, parent=parent)
@@ -1565,10 +1577,19 @@ class HueSlider(GradientSlider, object):
         self._value = 1
         self._alpha = 1
 
+        self._color_throttle = timers.ValueThrottle(parent=self)
+        self._color_throttle.valueChanged.connect(self.colorChanged.emit)
+        self._color_throttle.valueCommitted.connect(self.colorCommitted.emit)
+
         self.setRange(0, 359)
         self.valueChanged.connect(self._on_value_changed)
+        self.sliderReleased.connect(self._on_slider_released)
         self._update_gradient()
 
+    @property
+    def color_throttle(self):
+        return self._color_throttle
+
     def color(self):
         return QColor.fromHsvF(self.color_hue(), self._saturation, self._value, self._alpha)
 
@@ -1634,7 +1655,13 @@ class HueSlider(GradientSlider, object):
 
     def _on_value_changed(self):
         self.colorHueChanged.emit(self.color_hue())
-        self.colorChanged.emit(self.color())
+        if self.isSliderDown():
+            self._color_throttle.push(self.color())
+        else:
+            self.colorChanged.emit(self.color())
+
+    def _on_slider_released(self):
+        self._color_throttle.commit(self.color())
 
 
 class ColorDialogWidget(base.BaseWidget, object):
@@ -2189,9 +2216,11 @@ class ColorRgbGradientSlider(sliders.DoubleSlider, object):
 class ColorRgbSliders(base.BaseWidget, object):
     """
     Custom slider to choose a color by its components
+    While dragging, colorChanged signal is rate limited and colorCommitted signal is emitted once the drag ends
     """
 
     colorChanged = Signal(tuple)
+    colorCommitted = Signal(tuple)
 
     def __init__(self, parent=None, start_color=None, slider_type='float', alpha=False, height=50, *args):
 
@@ -2201,6 +2230,7 @@ class ColorRgbSliders(base.BaseWidget, object):
         self._default_color = start_color or 0, 0, 0, 255
         self._height = height
         self._color = self._default_color
+        self._color_throttle = None
         self._style_str = "QPushButton{ background-color: rgba(%f,%f,%f,%f);border-color: black;" \
                           "border-radius: 2px;border-style: outset;border-width: 1px;}" \
                           "\nQPushButton:pressed{ border-style: inset;border-color: beige}"
@@ -2234,6 +2264,10 @@ class ColorRgbSliders(base.BaseWidget, object):
         self._menu = QMenu(self)
         self._action_reset = self._menu.addAction('Reset Value')
 
+        self._color_throttle = timers.ValueThrottle(parent=self)
+        self._color_throttle.valueChanged.connect(self.colorChanged.emit)
+        self._color_throttle.valueCommitted.connect(self.colorCommitted.emit)
+
         self._red_dragger = sliders.DraggerSlider(slider_type=self._type)
         self._green_dragger = sliders.DraggerSlider(slider_type=self._type)
         self._blue_dragger = sliders.DraggerSlider(slider_type=self._type)
@@ -2298,6 +2332,9 @@ class ColorRgbSliders(base.BaseWidget, object):
 
         for slider in [self._red_slider, self._green_slider, self._blue_slider, self._alpha_slider]:
             slider.doubleValueChanged.connect(self._on_color_changed)
+        for widget in [self._red_slider, self._green_slider, self._blue_slider, self._alpha_slider,
+                       self._red_dragger, self._green_dragger, self._blue_dragger, self._alpha_dragger]:
+            widget.valueCommitted.connect(self._on_color_committed)
 
         for layout in layouts_list:
             self._sliders_layout.addLayout(layout)
@@ -2314,6 +2351,20 @@ class ColorRgbSliders(base.BaseWidget, object):
     def contextMenuEvent(self, event):
         self._menu.exec_(event.globalPos())
 
+    @property
+    def color_throttle(self):
+        return self._color_throttle
+
+    def is_dragging(self):
+        """
+        Returns whether the user is dragging any of the color component sliders
+        :return: bool
+        """
+
+        return any(widget.is_dragging() for widget in [
+            self._red_slider, self._green_slider, self._blue_slider, self._alpha_slider,
+            self._red_dragger, self._green_dragger, self._blue_dragger, self._alpha_dragger])
+
     def set_color(self, new_color):
         self._red_slider.set_mapped_value(new_color[0])
         self._green_slider.set_mapped_value(new_color[1])
@@ -2333,7 +2384,13 @@ class ColorRgbSliders(base.BaseWidget, object):
         if self._type == 'int':
             value_list = [utils.clamp(int(i), 0, 255) for i in value_list]
         self._color = python.force_tuple(value_list)
-        self.colorChanged.emit(self._color)
+        if self.is_dragging():
+            self._color_throttle.push(self._color)
+        else:
+            self.colorChanged.emit(self._color)
+
+    def _on_color_committed(self, value=None):
+        self._color_throttle.commit(self._color)
 
     def _on_show_color_dialog(self):
         if self._alpha:
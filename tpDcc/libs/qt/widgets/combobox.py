@@ -11,12 +11,12 @@ from Qt.QtCore import Signal, Property, QPoint, QEvent
 from Qt.QtWidgets import QSizePolicy, QComboBox
 
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import formatters
+from tpDcc.libs.qt.core import mixin, formatters
 
 
 @theme.mixin
 # @mixin.cursor_mixin
-# @mixin.property_mixin
+@mixin.property_setter_mixin
 class BaseComboBox(QComboBox, object):
 
     valueChanged = Signal(list)
@@ -131,7 +131,7 @@ class BaseComboBox(QComboBox, object):
         :param value:
         """
 
-        self.setProperty('value', value)
+        self.set_property('value', value)
 
     def set_menu(self, menu):
         """
@@ -8,14 +8,56 @@ Module that contains console widgets
 from __future__ import print_function, division, absolute_import
 
 import logging
+import threading
 from io import StringIO
+from collections import deque
 
-from Qt.QtCore import Qt, QSize, QStringListModel
+try:
+    from html import escape
+except ImportError:
+    from cgi import escape
+
+from Qt.QtCore import Qt, Signal, QObject, QSize, QTimer, QStringListModel
 from Qt.QtWidgets import QSizePolicy, QLineEdit, QTextEdit, QCompleter, QAction
 from Qt.QtGui import QFont, QTextCursor
 
 from tpDcc.libs.python import python
 
+# Default maximum number of lines kept in console document
+DEFAULT_MAX_LINES = 5000
+
+# Default maximum number of messages waiting to be written into the console
+DEFAULT_MAX_PENDING = 10000
+
+# Interval (in milliseconds) used to write pending messages into the console (one flush per frame)
+FLUSH_INTERVAL = 16
+
+
+class ConsoleMessageTypes(object):
+    DEFAULT = 'default'
+    OK = 'ok'
+    WARNING = 'warning'
+    ERROR = 'error'
+
+
+_MESSAGE_FORMATS = {
+    ConsoleMessageTypes.OK: '<font color="Lime"> {}</font>',
+    ConsoleMessageTypes.WARNING: '<font color="Yellow"> {}</font>',
+    ConsoleMessageTypes.ERROR: '<font color="Red">ERROR: {}</font>'
+}
+
+# Formats used by the lines of multiline messages after the first one
+_CONTINUATION_FORMATS = {
+    ConsoleMessageTypes.OK: '<font color="Lime"> {}</font>',
+    ConsoleMessageTypes.WARNING: '<font color="Yellow"> {}</font>',
+    ConsoleMessageTypes.ERROR: '<font color="Red">{}</font>'
+}
+
+# Prefix added to error messages written into console buffer
+_BUFFER_PREFIXES = {
+    ConsoleMessageTypes.ERROR: 'ERROR: '
+}
+
 
 class ConsoleInput(QLineEdit, object):
     def __init__(self, commands=[], parent=None):
@@ -33,11 +75,195 @@ class ConsoleInput(QLineEdit, object):
         self.setFont(QFont('Arial', 9, QFont.Bold, False))
 
 
+class ConsoleSink(QObject, object):
+    """
+    Thread safe sink that collects console messages from any thread and writes them into the console document in
+    batches, using one edit block per frame
+    Console keeps a maximum number of lines (each line of a multiline message is a document block). Older lines are
+    removed from the document and, optionally, they are appended to a spill file. If messages are posted faster than
+    they can be written, the oldest pending ones are dropped and a summary line is written instead
+    """
+
+    _messagesPosted = Signal()
+
+    def __init__(self, console, max_lines=DEFAULT_MAX_LINES, max_pending=DEFAULT_MAX_PENDING, spill_file=None):
+        super(ConsoleSink, self).__init__(console)
+
+        self._console = console
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._max_pending = max_pending
+        self._lines = deque(maxlen=max_lines)
+        self._spill_file = spill_file
+        self._dropped = 0
+        self._total_dropped = 0
+        self._total_spilled = 0
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+
+        # Signal is emitted from the posting thread, so the timer is always started from the console thread
+        self._messagesPosted.connect(self._on_messages_posted, Qt.QueuedConnection)
+
+        self._console.document().setMaximumBlockCount(max_lines)
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def max_lines(self):
+        return self._lines.maxlen
+
+    @max_lines.setter
+    def max_lines(self, value):
+        self._lines = deque(self._lines, maxlen=value)
+        self._console.document().setMaximumBlockCount(value)
+
+    @property
+    def spill_file(self):
+        return self._spill_file
+
+    @spill_file.setter
+    def spill_file(self, file_path):
+        self._spill_file = file_path
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def post(self, msg, message_type=ConsoleMessageTypes.DEFAULT):
+        """
+        Adds a new message to be written into the console. Can be called from any thread
+        :param msg: str
+        :param message_type: str, ConsoleMessageTypes
+        """
+
+        with self._lock:
+            was_empty = not self._pending
+            self._pending.append((message_type, msg))
+            if len(self._pending) > self._max_pending:
+                self._pending.popleft()
+                self._dropped += 1
+        if was_empty:
+            self._messagesPosted.emit()
+
+    def flush(self):
+        """
+        Writes all pending messages into the console using a single edit block
+        """
+
+        self._flush_timer.stop()
+        with self._lock:
+            pending = self._pending
+            dropped = self._dropped
+            self._pending = deque()
+            self._dropped = 0
+        if dropped:
+            self._total_dropped += dropped
+            pending.appendleft(
+                (ConsoleMessageTypes.WARNING, '{} messages were dropped because console was too busy'.format(dropped)))
+        if not pending:
+            return
+
+        document = self._console.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        spilled = list()
+        for message_type, msg in pending:
+            # Each line is written in its own block, so lines ring buffer matches document maximum block count
+            for i, line in enumerate(msg.splitlines() or ['']):
+                if document.characterCount() > 1:
+                    cursor.insertBlock()
+                line_format = (_MESSAGE_FORMATS if i == 0 else _CONTINUATION_FORMATS).get(message_type)
+                if line_format:
+                    cursor.insertHtml(line_format.format(escape(line)))
+                else:
+                    cursor.insertText(line)
+                if len(self._lines) == self._lines.maxlen:
+                    spilled.append(self._lines[0])
+                self._lines.append(line)
+            self._console.write_buffer(_BUFFER_PREFIXES.get(message_type, '') + msg)
+        cursor.endEditBlock()
+        self._console.moveCursor(QTextCursor.End)
+
+        if spilled:
+            self._spill(spilled)
+
+    def clear(self):
+        """
+        Removes all pending and retained messages
+        """
+
+        with self._lock:
+            self._pending.clear()
+            self._dropped = 0
+        self._lines.clear()
+
+    def lines(self):
+        """
+        Returns the lines currently kept in the console
+        :return: list(str)
+        """
+
+        return list(self._lines)
+
+    def stats(self):
+        """
+        Returns sink statistics
+        :return: dict
+        """
+
+        with self._lock:
+            pending = len(self._pending)
+
+        return {
+            'pending': pending, 'lines': len(self._lines), 'dropped': self._total_dropped,
+            'spilled': self._total_spilled
+        }
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _spill(self, lines):
+        """
+        Internal function that appends the lines removed from the console into the spill file
+        :param lines: list(str)
+        """
+
+        self._total_spilled += len(lines)
+        if not self._spill_file:
+            return
+
+        try:
+            with open(self._spill_file, 'a') as spill_file:
+                spill_file.write('\n'.join(lines) + '\n')
+        except (IOError, OSError):
+            self._spill_file = None
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_messages_posted(self):
+        """
+        Internal callback function that is called in console thread when new messages are posted
+        """
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+
 class Console(QTextEdit, object):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_lines=DEFAULT_MAX_LINES, spill_file=None):
         super(Console, self).__init__(parent=parent)
 
         self._buffer = StringIO()
+        self._sink = ConsoleSink(self, max_lines=max_lines, spill_file=spill_file)
 
         size_policy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         size_policy.setHorizontalStretch(0)
@@ -62,6 +288,26 @@ class Console(QTextEdit, object):
     def enterEvent(self, event):
         self.setFocus()
 
+    def clear(self):
+        self._sink.clear()
+        super(Console, self).clear()
+
+    def sink(self):
+        """
+        Returns sink used to write messages into this console from any thread
+        :return: ConsoleSink
+        """
+
+        return self._sink
+
+    def write_buffer(self, msg):
+        """
+        Adds message to the console buffer without writing it into the console output
+        :param msg: str
+        """
+
+        self._buffer.write(unicode(msg) if python.is_python2() else str(msg))
+
     def write(self, msg):
         """
         Add message to the console's output, on a new line
@@ -161,15 +407,22 @@ class ConsoleLoggerHandler(logging.Handler):
         self.setFormatter(formatter)
 
     def emit(self, record):
+        """
+        Posts record into console sink. Records can be emitted from any thread, they are written into the console
+        in batches from the console thread
+        :param record: logging.LogRecord
+        """
+
         msg = self.format(record)
         if '|INFO|' in msg:
-            self.widget.write_ok(msg)
+            message_type = ConsoleMessageTypes.OK
         elif '|WARNING|' in msg:
-            self.widget.write_warning(msg)
+            message_type = ConsoleMessageTypes.WARNING
         elif '|ERROR|' in msg:
-            self.widget.write_error(msg)
+            message_type = ConsoleMessageTypes.ERROR
         else:
-            self.widget.write(msg)
+            message_type = ConsoleMessageTypes.DEFAULT
+        self.widget.sink().post(msg, message_type)
 
 
 class ConsoleFormatter(logging.Formatter):
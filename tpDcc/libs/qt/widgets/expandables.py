@@ -132,8 +132,18 @@ class ExpandablePanel(base.BaseWidget, object):
         self.update_icon()
         self.update_size()
 
-    def add_widget(self, widget):
+    def add_widget(self, widget, unload_timeout=None):
+        """
+        Adds a new widget into the panel
+        :param widget: QWidget or callable, if a callable is given, it is used to build the widget the first time
+            the panel is opened
+        :param unload_timeout: int or None, time (in milliseconds) lazy contents can stay closed before being destroyed
+        :return: QWidget
+        """
+
+        widget = base.lazy_widget(widget, unload_timeout=unload_timeout)
         self._widget_layout.addWidget(widget)
+        return widget
 
     def add_layout(self, layout):
         self._widget_layout.addLayout(layout)
@@ -183,6 +193,8 @@ class ExpandableLine(QWidget, object):
             arrow_type = Qt.DownArrow if checked else Qt.RightArrow
             direction = QAbstractAnimation.Forward if checked else QAbstractAnimation.Backward
             self.expand_btn.setArrowType(arrow_type)
+            if checked:
+                self._update_animation()
             self.toggle_anim.setDirection(direction)
             self.toggle_anim.start()
 
@@ -194,8 +206,20 @@ class ExpandableLine(QWidget, object):
     def set_content_layout(self, content_layout):
         self.content_area.destroy()
         self.content_area.setLayout(content_layout)
+        self._update_animation()
+
+    def _update_animation(self):
+        """
+        Internal function that updates animation ranges using the current size hint of the contents
+        Contents can change while the line is collapsed, so ranges are computed again every time the line is expanded
+        """
+
+        content_layout = self.content_area.layout()
+        if self.toggle_anim.state() == QAbstractAnimation.Running:
+            self.toggle_anim.stop()
         collapsed_height = self.sizeHint().height() - self.content_area.maximumHeight()
-        content_height = content_layout.sizeHint().height() + 300
+        content_height = content_layout.sizeHint().height() if content_layout else 0
+        content_height += self.content_area.frameWidth() * 2
         for i in range(self.toggle_anim.animationCount() - 1):
             expand_anim = self.toggle_anim.animationAt(i)
             expand_anim.setDuration(self._animation_duration)
@@ -245,8 +269,19 @@ class ExpandableFrame(base.BaseFrame, object):
         self._title_frame.clicked.connect(self._on_toggle_collapsed)
         self._icon_button.clicked.connect(self._on_toggle_collapsed)
 
-    def addWidget(self, widget):
+    def addWidget(self, widget, unload_timeout=None):
+        """
+        Adds a new widget into the frame contents
+        :param widget: QWidget or callable, if a callable is given, it is used to build the widget the first time
+            the frame is expanded
+        :param unload_timeout: int or None, time (in milliseconds) lazy contents can stay collapsed before being
+            destroyed
+        :return: QWidget
+        """
+
+        widget = base.lazy_widget(widget, unload_timeout=unload_timeout)
         self._content_layout.addWidget(widget)
+        return widget
 
     def addLayout(self, layout):
         self._content_layout.addLayout(layout)
@@ -699,6 +734,7 @@ class ExpanderWidget(QScrollArea, object):
         self._scrollInitY = 0
         self._scrollInitVal = 0
         self._itemClass = ExpanderItem
+        self._unloadTimeout = None
 
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setFrameShape(QScrollArea.NoFrame)
@@ -714,7 +750,17 @@ class ExpanderWidget(QScrollArea, object):
     # ====================================================================================
 
     def addItem(self, title, widget, collapsed=False):
+        """
+        Adds a new item into the expander
+        :param title: str
+        :param widget: QWidget or callable, if a callable is given, it is used to build the item contents the first
+            time the item is expanded
+        :param collapsed: bool
+        :return: ExpanderItem
+        """
+
         self.setUpdatesEnabled(False)
+        widget = base.lazy_widget(widget, unload_timeout=self._unloadTimeout)
         item = self.itemClass()(self, title, widget)
         item.setRolloutStyle(self.rolloutStyle())
         item.setDragDropMode(self.dragDropMode())
@@ -806,6 +852,20 @@ class ExpanderWidget(QScrollArea, object):
     def setItemClass(self, itemClass):
         self._itemClass = itemClass
 
+    def unloadTimeout(self):
+        return self._unloadTimeout
+
+    def setUnloadTimeout(self, timeout):
+        """
+        Sets the time (in milliseconds) the lazy contents of collapsed items are kept alive before being destroyed
+        :param timeout: int or None, if None, lazy contents are never destroyed
+        """
+
+        self._unloadTimeout = timeout
+        for item in self.findChildren(ExpanderItem):
+            if isinstance(item.widget(), base.LazyWidget):
+                item.widget().set_unload_timeout(timeout)
+
     def canScroll(self):
         return self.verticalScrollBar().maximum() > 0
 
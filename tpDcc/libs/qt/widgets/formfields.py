@@ -32,6 +32,9 @@ class FieldWidget(QFrame, object):
 
     DEFAULT_LAYOUT = 'horizontal'
 
+    # Whether the widget can be reused by virtualized forms to show other fields of the same type
+    RECYCLABLE = True
+
     def __init__(self, parent=None, data=None, form_widget=None):
         super(FieldWidget, self).__init__(parent)
 
@@ -298,6 +301,35 @@ class FieldWidget(QFrame, object):
             self._data.update(data)
             self.refresh()
 
+    def rebind_data(self, data):
+        """
+        Replaces the data of the field widget with the given one
+        Used by virtualized forms to reuse the same widget to show different fields of the same type
+        State that set_data only applies when its key is present is reset first, so no state of the previous field
+        is kept
+        :param data: dict
+        """
+
+        previous_data = self._data
+        self._data = data
+        self._default = None
+        self.setToolTip(data.get('toolTip') or '')
+        self.setStatusTip(data.get('toolTip') or '')
+        self.setStyleSheet(data.get('style') or '')
+        self._data['error'] = self._data.get('error') or ''
+        self.set_required(False)
+        self.setEnabled(True)
+        self._label.setEnabled(True)
+        self._label.setText('')
+        self.label().setVisible(True)
+        if self._menu_button:
+            self._menu_button.setText('')
+            self._menu_button.setVisible(False)
+        if previous_data.get('items') is not None and data.get('items') is None:
+            with qt_contexts.block_signals(self):
+                self.set_items(list())
+        self.set_data(data)
+
     def has_error(self):
         """
         Returns whether or not this field contains any error
@@ -587,6 +619,17 @@ class BoolFieldWidget(FieldWidget, object):
         else:
             super(BoolFieldWidget, self).set_text(text)
 
+    def rebind_data(self, data):
+        """
+        Overrides FieldWidget rebind_data function
+        Removes inline text of the previous field
+        :param data: dict
+        """
+
+        self.widget().setText('')
+
+        super(BoolFieldWidget, self).rebind_data(data)
+
     def value(self):
         """
         Implements FieldWidget value function
@@ -615,6 +658,8 @@ class EnumFieldWidget(FieldWidget, object):
         widget.currentIndexChanged.connect(self._on_emit_value_changed)
         self.set_widget(widget)
 
+        self._default_editable = widget.isEditable()
+
     # =================================================================================================================
     # OVERRIDES
     # =================================================================================================================
@@ -658,6 +703,18 @@ class EnumFieldWidget(FieldWidget, object):
         if editable is not None:
             self.widget().setEditable(editable)
 
+    def rebind_data(self, data):
+        """
+        Overrides FieldWidget rebind_data function
+        Restores the editable state of the combo box
+        :param data: dict
+        """
+
+        if self.widget().isEditable() != self._default_editable:
+            self.widget().setEditable(self._default_editable)
+
+        super(EnumFieldWidget, self).rebind_data(data)
+
     # =================================================================================================================
     # BASE
     # =================================================================================================================
@@ -881,6 +938,10 @@ class PathFieldWidget(StringFieldWidget, object):
 
 
 class SeparatorFieldWidget(FieldWidget, object):
+
+    # Widget contents are built from field data when the widget is created
+    RECYCLABLE = False
+
     def __init__(self, *args, **kwargs):
         super(SeparatorFieldWidget, self).__init__(*args, **kwargs)
 
@@ -1176,6 +1237,10 @@ class RangeFieldWidget(FieldWidget, object):
 
 
 class ColorFieldWidget(FieldWidget, object):
+
+    # Colors of the picker cannot be restored once they are set by a field
+    RECYCLABLE = False
+
     def __init__(self, *args, **kwargs):
         super(ColorFieldWidget, self).__init__(*args, **kwargs)
 
@@ -1245,6 +1310,10 @@ class ColorFieldWidget(FieldWidget, object):
 
 
 class IconPickerFieldWidget(FieldWidget, object):
+
+    # Icons of the picker cannot be restored once they are set by a field
+    RECYCLABLE = False
+
     def __init__(self, *args, **kwargs):
         super(IconPickerFieldWidget, self).__init__(*args, **kwargs)
 
@@ -1314,6 +1383,10 @@ class IconPickerFieldWidget(FieldWidget, object):
 
 
 class GroupFieldWidget(FieldWidget, object):
+
+    # Widget contents are built from field data when the widget is created
+    RECYCLABLE = False
+
     def __init__(self, *args, **kwargs):
         super(GroupFieldWidget, self).__init__(*args, **kwargs)
 
@@ -1376,6 +1449,10 @@ class GroupFieldWidget(FieldWidget, object):
 
 
 class ButtonGroupFieldWidget(FieldWidget, object):
+
+    # Widget contents are built from field data when the widget is created
+    RECYCLABLE = False
+
     def __init__(self, *args, **kwargs):
         super(ButtonGroupFieldWidget, self).__init__(*args, **kwargs)
 
@@ -7,11 +7,13 @@ Module that contains form widgets for library
 
 from __future__ import print_function, division, absolute_import
 
+import bisect
 import logging
 from functools import partial
+from collections import OrderedDict
 
-from Qt.QtCore import Signal
-from Qt.QtWidgets import QSizePolicy, QFrame, QSpacerItem
+from Qt.QtCore import Signal, QEvent, QTimer
+from Qt.QtWidgets import QSizePolicy, QFrame, QSpacerItem, QWidget, QScrollArea
 
 from tpDcc.libs.qt.core import contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, label, buttons, formfields
@@ -20,6 +22,18 @@ from tpDcc.tools.datalibrary.core import settings
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
 
+# Time (in milliseconds) form waits after the last field change before validating changed fields
+VALIDATE_DEBOUNCE_INTERVAL = 150
+
+# Schemas with this amount of fields (or more) are virtualized if virtualization is not explicitly set
+VIRTUALIZATION_THRESHOLD = 500
+
+# Extra space (in pixels) above and below the viewport of a virtualized form in which field widgets are created
+VIRTUAL_OVERSCAN = 200
+
+# Maximum amount of hidden field widgets of each type kept for reuse by a virtualized form
+MAX_POOLED_FIELD_WIDGETS = 32
+
 
 class FormDialog(QFrame, object):
 
@@ -104,7 +118,7 @@ class FormDialog(QFrame, object):
             self._description.setText(description)
         validator = settings.get("validator")
         if validator is not None:
-            self._form_widget.set_validator(validator)
+            self._form_widget.set_validator(validator, incremental=settings.get('incrementalValidation', False))
         layout = settings.get("layout")
         schema = settings.get("schema")
         if schema is not None:
@@ -115,6 +129,7 @@ class FormDialog(QFrame, object):
         Function called when the dialog is accepted
         """
 
+        self._form_widget.validate_changes()
         callback = self._settings.get('accepted')
         if callback:
             callback(**self._form_widget.values())
@@ -154,7 +169,78 @@ class FormDialog(QFrame, object):
         self._accept_btn.setEnabled(not self._form_widget.has_errors())
 
 
+class _FormRow(object):
+    """
+    Internal class that stores a form field
+    Field widget is only set while the field is materialized. Otherwise, field value is stored in the field data
+    """
+
+    __slots__ = ('field_class', 'data', 'widget', 'default', 'height', 'hidden')
+
+    def __init__(self, field_class, data, widget=None, height=0):
+        self.field_class = field_class
+        self.data = data
+        self.widget = widget
+        default = data.get('default')
+        self.default = default if default is not None else data.get('value')
+        self.height = height
+        self.hidden = False
+
+    @property
+    def name(self):
+        return self.data.get('name')
+
+    @property
+    def pool_key(self):
+        return self.field_class, self.data.get('layout', self.field_class.DEFAULT_LAYOUT)
+
+    def value(self):
+        return self.widget.value() if self.widget else self.data.get('value')
+
+    def set_value(self, value):
+        if self.widget:
+            self.widget.set_value(value)
+        else:
+            self.data['value'] = value
+
+    def get_default(self):
+        return self.widget.default() if self.widget else self.default
+
+    def set_data(self, data):
+        if self.widget:
+            self.widget.set_data(data)
+            return
+
+        default = data.get('default')
+        value = data.get('value')
+        if default is not None:
+            self.default = default
+        elif value is not None:
+            self.default = value
+        self.data.update(data)
+
+    def set_error(self, message):
+        if self.widget:
+            self.widget.set_error(message)
+        else:
+            self.data['error'] = message
+
+    def state(self):
+        return {'name': self.data['name'], 'value': self.value()}
+
+    def reset(self):
+        if self.widget:
+            self.widget.reset()
+        else:
+            self.data['value'] = self.default
+
+
 class FormWidget(QFrame, object):
+    """
+    Widget that shows a form built from a schema of fields
+    In virtualized mode, fields are stored in lightweight rows and field widgets are only created for the rows that
+    are in or near the viewport. Widgets of rows that leave the viewport are reused for other rows of the same type
+    """
 
     accepted = Signal(object)
     stateChanged = Signal()
@@ -164,8 +250,28 @@ class FormWidget(QFrame, object):
         super(FormWidget, self).__init__(*args, **kwargs)
 
         self._schema = dict()
-        self._widgets = list()
+        self._rows = list()
+        self._rows_by_name = dict()
+        self._dependents = dict()
         self._validator = None
+        self._incremental_validation = False
+        self._validated_values = dict()
+        self._changed_fields = OrderedDict()
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DEBOUNCE_INTERVAL)
+        self._validate_timer.timeout.connect(self.validate_changes)
+
+        self._virtualized = None
+        self._virtual_area = None
+        self._virtual_contents = None
+        self._row_offsets = list()
+        self._bound_rows = set()
+        self._widget_pools = dict()
+        self._default_data = dict()
+        self._blank_values = dict()
+        self._row_heights = dict()
 
         main_layout = layouts.VerticalLayout(spacing=0, margins=(0, 0, 0, 0))
         self.setLayout(main_layout)
@@ -192,6 +298,12 @@ class FormWidget(QFrame, object):
         self.save_persistent_values()
         super(FormWidget, self).closeEvent(event)
 
+    def eventFilter(self, obj, event):
+        if self._virtual_area and obj == self._virtual_area.viewport() and event.type() == QEvent.Resize:
+            self._update_virtual_rows()
+
+        return super(FormWidget, self).eventFilter(obj, event)
+
     # =================================================================================================================
     # BASE
     # =================================================================================================================
@@ -238,16 +350,33 @@ class FormWidget(QFrame, object):
 
         self.title_widget().setVisible(flag)
 
+    def is_virtualized(self):
+        """
+        Returns whether form only creates field widgets for the fields that are in or near the viewport
+        :return: bool
+        """
+
+        return self._virtual_area is not None
+
+    def set_virtualized(self, flag):
+        """
+        Sets whether form should only create field widgets for the fields that are in or near the viewport
+        Must be set before setting the schema
+        :param flag: bool or None, if None, forms are virtualized if their schema is bigger than the threshold
+        """
+
+        self._virtualized = flag
+
     def widget(self, name):
         """
         Returns the widget for the given widget name
         :param name: str
-        :return: FieldWidget
+        :return: FieldWidget or None, None if the field does not exist or if it is not visible in a virtualized form
         """
 
-        for widget in self._widgets:
-            if widget.data().get('name') == name:
-                return widget
+        row = self._rows_by_name.get(name)
+
+        return row.widget if row else None
 
     def value(self, name):
         """
@@ -256,11 +385,11 @@ class FormWidget(QFrame, object):
         :return: object
         """
 
-        widget = self.widget(name)
-        if not widget:
+        row = self._rows_by_name.get(name)
+        if not row:
             return None
 
-        return widget.value()
+        return row.value()
 
     def set_value(self, name, value):
         """
@@ -269,8 +398,10 @@ class FormWidget(QFrame, object):
         :param value: variant
         """
 
-        widget = self.widget(name)
-        widget.set_value(value)
+        row = self._rows_by_name[name]
+        row.set_value(value)
+        if not row.widget:
+            self._field_changed(name)
 
     def values(self):
         """
@@ -279,10 +410,10 @@ class FormWidget(QFrame, object):
         """
 
         values = dict()
-        for widget in self._widgets:
-            name = widget.data().get('name')
+        for row in self._rows:
+            name = row.name
             if name:
-                values[name] = widget.value()
+                values[name] = row.value()
 
         return values
 
@@ -305,10 +436,10 @@ class FormWidget(QFrame, object):
         """
 
         values = dict()
-        for widget in self._widgets:
-            name = widget.data().get('name')
+        for row in self._rows:
+            name = row.name
             if name:
-                values[name] = widget.default()
+                values[name] = row.get_default()
 
         return values
 
@@ -319,10 +450,12 @@ class FormWidget(QFrame, object):
         :param data: dict
         """
 
-        widget = self.widget(name)
-        if not widget:
+        row = self._rows_by_name.get(name)
+        if not row:
             return
-        widget.set_data(data)
+        row.set_data(data)
+        if self._virtual_area:
+            self._update_virtual_layout()
 
     def fields(self):
         """
@@ -331,18 +464,19 @@ class FormWidget(QFrame, object):
         """
 
         options = list()
-        for widget in self._widgets:
-            options.append(widget.data())
+        for row in self._rows:
+            options.append(row.data)
 
         return options
 
     def field_widgets(self):
         """
         Returns all field widgets
+        In virtualized forms, only the widgets of the fields that are in or near the viewport are returned
         :return: list(FieleWidget)
         """
 
-        return self._widgets
+        return [row.widget for row in self._rows if row.widget]
 
     def state(self):
         """
@@ -351,8 +485,8 @@ class FormWidget(QFrame, object):
         """
 
         fields = list()
-        for widget in self._widgets:
-            fields.append(widget.state())
+        for row in self._rows:
+            fields.append(row.state())
 
         state = {
             'fields': fields,
@@ -397,6 +531,12 @@ class FormWidget(QFrame, object):
         if not self._schema:
             return
 
+        virtualized = self._virtualized
+        if virtualized is None:
+            virtualized = len(schema) >= VIRTUALIZATION_THRESHOLD
+        if virtualized:
+            self._init_virtual_area()
+
         for field in schema:
             cls = formfields.FIELD_WIDGET_REGISTRY.get(field.get('type', 'label'))
             if not cls:
@@ -411,26 +551,36 @@ class FormWidget(QFrame, object):
             error_visible = field.get('errorVisible')
             field['errorVisible'] = error_visible if error_visible is not None else errors_visible
 
-            widget = cls(data=field, parent=self._fields_frame, form_widget=self)
-            data = widget.default_data()
-            data.update(field)
+            if virtualized:
+                row = self._create_virtual_row(cls, field)
+            else:
+                widget = self._create_field_widget(cls, field, self._fields_frame)
+                data = widget.default_data()
+                data.update(field)
 
-            widget.set_data(data)
+                widget.set_data(data)
 
-            value = field.get('value')
-            default = field.get('default')
-            if value is None and default is not None:
-                widget.set_value(default)
+                value = field.get('value')
+                default = field.get('default')
+                if value is None and default is not None:
+                    widget.set_value(default)
 
-            if not enabled or read_only:
-                widget.setEnabled(False)
+                if not enabled or read_only:
+                    widget.setEnabled(False)
 
-            self._widgets.append(widget)
+                self._connect_field_widget(widget)
+                self._fields_frame.layout().addWidget(widget)
+                row = _FormRow(cls, widget.data(), widget=widget)
 
-            callback = partial(self._on_field_changed, widget)
-            widget.valueChanged.connect(callback)
+            self._rows.append(row)
+            name = row.name
+            if name:
+                self._rows_by_name[name] = row
+                for dependency in row.data.get('dependencies', list()):
+                    self._dependents.setdefault(dependency, list()).append(name)
 
-            self._fields_frame.layout().addWidget(widget)
+        if virtualized:
+            self._update_virtual_layout()
 
         self.load_persistent_values()
 
@@ -442,39 +592,56 @@ class FormWidget(QFrame, object):
 
         return self._validator
 
-    def set_validator(self, validator):
+    def set_validator(self, validator, incremental=False):
         """
         Sets the validator for the options
         :param validator: fn
+        :param incremental: bool, if True, when fields change, validator only receives the values of the changed fields
+            and of the fields that depend on them (fields that list them in their "dependencies" schema key)
         """
 
         self._validator = validator
+        self._incremental_validation = incremental
+
+    def is_incremental_validation(self):
+        """
+        Returns whether validator only receives the values of changed fields
+        :return: bool
+        """
+
+        return self._incremental_validation
 
     def reset(self):
         """
         Reset all option widget back to the ir default values
         """
 
-        for widget in self._widgets:
-            widget.reset()
+        for row in self._rows:
+            row.reset()
+        if self._virtual_area:
+            self._update_virtual_layout()
         self.validate()
 
-    def validate(self, widget=None):
+    def validate(self, widget=None, field_name=None):
         """
         Validates the current options using the validator
+        :param widget: FieldWidget or None, changed field widget
+        :param field_name: str or None, name of the changed field. Used when the field has no widget (virtualized forms)
         """
 
+        self._validate_timer.stop()
+        self._changed_fields.clear()
+
         if not self._validator:
             return
 
-        values = dict()
-        for name, value in self.values().items():
-            data = self.widget(name).data()
-            if data.get('validate', True):
-                values[name] = value
+        values = self._get_validate_values(list(self._rows_by_name.keys()))
+        self._validated_values = dict(values)
 
         if widget:
             values['fieldChanged'] = widget.name()
+        elif field_name:
+            values['fieldChanged'] = field_name
 
         fields = self._validator(**values)
         if fields is not None:
@@ -482,6 +649,40 @@ class FormWidget(QFrame, object):
 
         self.validated.emit()
 
+    def validate_changes(self):
+        """
+        Validates the fields changed since the last validation
+        If incremental validation is enabled, only the changed fields and the fields that depend on them are validated;
+        otherwise all the form is validated
+        """
+
+        self._validate_timer.stop()
+        changed_names = list(self._changed_fields.keys())
+        self._changed_fields.clear()
+        if not self._validator or not changed_names:
+            return
+
+        if not self._incremental_validation:
+            self.validate(field_name=changed_names[-1])
+            return
+
+        changed_names = [name for name in changed_names if self._has_changed(name)]
+        if not changed_names:
+            return
+
+        names = self._get_dependent_names(changed_names)
+        values = self._get_validate_values(names)
+        if not values:
+            return
+        self._validated_values.update(values)
+        values['fieldChanged'] = changed_names[-1]
+
+        fields = self._validator(**values)
+        if fields is not None:
+            self._set_state(fields, names=names)
+
+        self.validated.emit()
+
     def errors(self):
         """
         Returns all form errors
@@ -489,8 +690,8 @@ class FormWidget(QFrame, object):
         """
 
         errors = list()
-        for widget in self._widgets:
-            error = widget.data().get('error')
+        for row in self._rows:
+            error = row.data.get('error')
             if error:
                 errors.append(error)
 
@@ -512,13 +713,13 @@ class FormWidget(QFrame, object):
 
         data = dict()
 
-        for widget in self._widgets:
-            name = widget.data().get('name')
-            if name and widget.data().get('persistent'):
+        for row in self._rows:
+            name = row.name
+            if name and row.data.get('persistent'):
                 key = self.objectName() or 'FormWidget'
-                key = widget.data().get('persistentKey', key)
+                key = row.data.get('persistentKey', key)
                 data.setdefault(key, dict())
-                data[key][name] = widget.value()
+                data[key][name] = row.value()
 
         for key in data:
             settings.set(key, data[key])
@@ -573,27 +774,299 @@ class FormWidget(QFrame, object):
 
         return sorted(schema, key=_key)
 
-    def _set_state(self, fields):
+    def _has_changed(self, name):
         """
-        Internal function that sets fields state
-        :param fields: list(dict)
+        Internal function that returns whether the value of the field with given name changed since it was validated
+        :param name: str
+        :return: bool
+        """
+
+        if name not in self._validated_values:
+            return True
+
+        return self._validated_values[name] != self.value(name)
+
+    def _get_validate_values(self, names):
+        """
+        Internal function that returns the values of the given fields that should be validated
+        :param names: list(str)
+        :return: dict
         """
 
-        for widget in self._widgets:
+        values = dict()
+        for name in names:
+            row = self._rows_by_name.get(name)
+            if row and row.data.get('validate', True):
+                values[name] = row.value()
+
+        return values
+
+    def _get_dependent_names(self, names):
+        """
+        Internal function that returns given field names and the names of all the fields that depend on them
+        :param names: list(str)
+        :return: list(str)
+        """
+
+        found = list()
+        visited = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop(0)
+            if name in visited:
+                continue
+            visited.add(name)
+            found.append(name)
+            pending.extend(self._dependents.get(name, list()))
+
+        return found
+
+    def _set_state(self, fields, names=None):
+        """
+        Internal function that sets fields state
+        :param fields: list(dict)
+        :param names: list(str) or None, names of the fields whose errors are cleared. If None, errors of all fields
+            are cleared
+        """
+
+        if names is None:
+            reset_rows = list(self._rows)
+        else:
+            reset_rows = [self._rows_by_name[name] for name in names if name in self._rows_by_name]
+        field_rows = list()
+        for field in fields:
+            row = self._rows_by_name.get(field.get('name'))
+            if row:
+                field_rows.append((row, field))
+        widgets = set(row.widget for row in reset_rows if row.widget)
+        widgets.update(row.widget for row, _ in field_rows if row.widget)
+
+        for widget in widgets:
             widget.blockSignals(True)
 
         try:
-            for widget in self._widgets:
-                widget.set_error('')
-                for field in fields:
-                    if field.get('name') == widget.data().get('name'):
-                        widget.set_data(field)
+            for row in reset_rows:
+                row.set_error('')
+            for row, field in field_rows:
+                row.set_data(field)
+                if 'value' in field and row.name in self._validated_values:
+                    self._validated_values[row.name] = row.value()
         finally:
-            for widget in self._widgets:
+            for widget in widgets:
                 widget.blockSignals(False)
 
+        if self._virtual_area:
+            self._update_virtual_layout()
+
         self.stateChanged.emit()
 
+    def _create_field_widget(self, field_class, data, parent):
+        """
+        Internal function that creates a new field widget
+        :param field_class: type
+        :param data: dict
+        :param parent: QWidget
+        :return: FieldWidget
+        """
+
+        return field_class(data=data, parent=parent, form_widget=self)
+
+    def _connect_field_widget(self, widget):
+        """
+        Internal function that connects the value changes of the given field widget with the form
+        Must be called once the widget is initialized, so its initial value does not trigger a validation
+        :param widget: FieldWidget
+        """
+
+        widget.valueChanged.connect(partial(self._on_field_changed, widget))
+
+    def _init_virtual_area(self):
+        """
+        Internal function that creates the scroll area used by virtualized forms
+        """
+
+        if self._virtual_area:
+            return
+
+        self._virtual_area = QScrollArea(self._fields_frame)
+        self._virtual_area.setObjectName('virtualArea')
+        self._virtual_area.setWidgetResizable(True)
+        self._virtual_area.setFrameShape(QFrame.NoFrame)
+        self._virtual_contents = QWidget()
+        self._virtual_area.setWidget(self._virtual_contents)
+        self._virtual_area.viewport().installEventFilter(self)
+        self._virtual_area.verticalScrollBar().valueChanged.connect(self._on_virtual_scrolled)
+        self._fields_frame.layout().addWidget(self._virtual_area)
+
+    def _create_virtual_row(self, field_class, field):
+        """
+        Internal function that creates a row for the given field without materializing its widget
+        The first field of each type is used to create a prototype widget that provides the default data, the size and
+        the empty value of the fields of that type
+        :param field_class: type
+        :param field: dict
+        :return: _FormRow
+        """
+
+        key = (field_class, field.get('layout', field_class.DEFAULT_LAYOUT))
+        if key not in self._default_data:
+            prototype = self._create_field_widget(field_class, dict(field), self._virtual_contents)
+            self._connect_field_widget(prototype)
+            prototype.hide()
+            try:
+                self._blank_values[key] = prototype.value()
+            except Exception:
+                self._blank_values[key] = None
+            self._default_data[key] = prototype.default_data()
+            self._row_heights[key] = max(prototype.sizeHint().height(), prototype.minimumSizeHint().height())
+            self._release_widget(key, prototype)
+
+        data = dict(self._default_data[key])
+        data.update(field)
+        if data.get('value') is None and data.get('default') is not None:
+            data['value'] = data['default']
+        field.update(data)
+
+        return _FormRow(field_class, field, height=self._row_heights[key])
+
+    def _acquire_widget(self, row):
+        """
+        Internal function that returns a field widget for the given row, reusing a pooled one if possible
+        :param row: _FormRow
+        :return: FieldWidget
+        """
+
+        pool = self._widget_pools.get(row.pool_key)
+        if pool:
+            widget = pool.pop()
+            if row.data.get('value') is None:
+                with qt_contexts.block_signals(widget):
+                    widget.set_value(self._blank_values.get(row.pool_key))
+            widget.rebind_data(row.data)
+        else:
+            widget = self._create_field_widget(row.field_class, row.data, self._virtual_contents)
+            widget.set_data(row.data)
+            self._connect_field_widget(widget)
+        widget.set_default(row.default)
+        widget.set_collapsed(False)
+        widget.setEnabled(row.data.get('enabled', True) and not row.data.get('readOnly', False))
+
+        return widget
+
+    def _release_widget(self, key, widget):
+        """
+        Internal function that hides given field widget and keeps it for reuse
+        :param key: tuple(type, str)
+        :param widget: FieldWidget
+        """
+
+        widget.hide()
+        pool = self._widget_pools.setdefault(key, list())
+        if key[0].RECYCLABLE and len(pool) < MAX_POOLED_FIELD_WIDGETS:
+            pool.append(widget)
+        else:
+            widget.deleteLater()
+
+    def _bind_row(self, index):
+        """
+        Internal function that materializes the widget of the row with given index
+        :param index: int
+        :return: bool, True if the height of the row changed; False otherwise
+        """
+
+        row = self._rows[index]
+        row.widget = self._acquire_widget(row)
+        self._bound_rows.add(index)
+        height = max(row.widget.sizeHint().height(), row.widget.minimumSizeHint().height())
+        if height == row.height:
+            return False
+        row.height = height
+
+        return True
+
+    def _unbind_row(self, index):
+        """
+        Internal function that stores the value of the row with given index and releases its widget
+        :param index: int
+        """
+
+        row = self._rows[index]
+        self._bound_rows.discard(index)
+        widget = row.widget
+        if not widget:
+            return
+        row.data['value'] = widget.value()
+        row.default = widget.default()
+        row.widget = None
+        self._release_widget(row.pool_key, widget)
+
+    def _update_virtual_layout(self):
+        """
+        Internal function that updates the position of all the rows of a virtualized form
+        Rows after a collapsed group are hidden
+        """
+
+        offset = 0
+        self._row_offsets = list()
+        group_expanded = True
+        for row in self._rows:
+            if row.field_class is formfields.GroupFieldWidget:
+                group_expanded = bool(row.value())
+                row.hidden = bool(row.data.get('hidden'))
+            else:
+                row.hidden = not group_expanded or bool(row.data.get('hidden')) or row.data.get('visible') is False
+            self._row_offsets.append(offset)
+            if not row.hidden:
+                offset += row.height
+
+        self._virtual_contents.setMinimumHeight(offset)
+        self._update_virtual_rows()
+
+    def _update_virtual_rows(self):
+        """
+        Internal function that materializes the rows that are in or near the viewport and releases the other ones
+        """
+
+        if not self._virtual_area or not self._rows:
+            return
+
+        scroll_value = self._virtual_area.verticalScrollBar().value()
+        top = scroll_value - VIRTUAL_OVERSCAN
+        bottom = scroll_value + self._virtual_area.viewport().height() + VIRTUAL_OVERSCAN
+
+        visible_rows = list()
+        start_index = max(0, bisect.bisect_right(self._row_offsets, top) - 1)
+        for index in range(start_index, len(self._rows)):
+            if self._row_offsets[index] >= bottom:
+                break
+            if not self._rows[index].hidden:
+                visible_rows.append(index)
+
+        visible_set = set(visible_rows)
+        for index in list(self._bound_rows):
+            if index not in visible_set:
+                self._unbind_row(index)
+
+        height_changed = False
+        for index in visible_rows:
+            if index not in self._bound_rows:
+                height_changed = self._bind_row(index) or height_changed
+
+        if height_changed:
+            # Row offsets are updated with the real size of the materialized rows
+            offset = 0
+            for index, row in enumerate(self._rows):
+                self._row_offsets[index] = offset
+                if not row.hidden:
+                    offset += row.height
+            self._virtual_contents.setMinimumHeight(offset)
+
+        width = self._virtual_contents.width()
+        for index in visible_rows:
+            row = self._rows[index]
+            row.widget.setGeometry(0, self._row_offsets[index], width, row.height)
+            row.widget.show()
+
     # ============================================================================================================
     # CALLBACKS
     # ============================================================================================================
@@ -612,4 +1085,25 @@ class FormWidget(QFrame, object):
         :param widget: FieldWidget
         """
 
-        self.validate(widget=widget)
+        if self._virtual_area and isinstance(widget, formfields.GroupFieldWidget):
+            self._update_virtual_layout()
+
+        self._field_changed(widget.data().get('name'))
+
+    def _field_changed(self, name):
+        """
+        Internal function that schedules the validation of the field with given name
+        :param name: str
+        """
+
+        self._changed_fields.pop(name, None)
+        self._changed_fields[name] = True
+        self._validate_timer.start()
+
+    def _on_virtual_scrolled(self, value):
+        """
+        Internal callback function that is triggered when a virtualized form is scrolled
+        :param value: int
+        """
+
+        self._update_virtual_rows()
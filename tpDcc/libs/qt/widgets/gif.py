@@ -2,36 +2,335 @@
 # -*- coding: utf-8 -*-
 
 """
-Module that contains implementation for custom PySide/PyQt windows
+Module that contains implementation for GIF widgets
 """
 
 from __future__ import print_function, division, absolute_import
 
 import os
+import weakref
 
-from Qt.QtCore import Qt, QSize
+from Qt.QtCore import Qt, Signal, QObject, QSize
 from Qt.QtWidgets import QLabel
-from Qt.QtGui import QMovie
+from Qt.QtGui import QMovie, QPixmap, QImageReader
+
+from tpDcc.libs.qt.core import scheduler
+
+# Maximum amount of bytes of decoded frames kept in memory for each GIF file and size (8 MB)
+DEFAULT_MAX_STREAM_BYTES = 8 * 1024 * 1024
+
+# Delay (in milliseconds) used for frames that do not define their own delay
+DEFAULT_FRAME_DELAY = 100
+
+_GIF_STREAMS = weakref.WeakValueDictionary()
+
+
+class GifPlaybackModes(object):
+    MOVIE = 'movie'         # QMovie that keeps all the frames decoded at full resolution
+    STREAM = 'stream'       # Frames decoded at displayed size shared between labels and paused while hidden
+
+
+class GifStream(QObject, object):
+    """
+    Decodes the frames of a GIF file at a given size and plays them from the global frame scheduler
+    Decoded frames are cached while they fit into the memory limit, otherwise they are decoded again on each loop.
+    Streams are shared between all the labels that play the same file at the same size and they are only played
+    while at least one of those labels is visible
+    """
+
+    frameChanged = Signal()
+
+    def __init__(self, gif_file, size=None, max_bytes=DEFAULT_MAX_STREAM_BYTES, parent=None):
+        super(GifStream, self).__init__(parent)
+
+        self._file = gif_file
+        self._size = size
+        self._max_bytes = max_bytes
+        self._reader = None
+        self._frames = list()
+        self._bytes = 0
+        self._complete = False
+        self._overflow = False
+        self._index = -1
+        self._pixmap = QPixmap()
+        self._delay = DEFAULT_FRAME_DELAY
+        self._time_to_next = 0
+        self._visible_labels = weakref.WeakSet()
+
+        self._next_frame()
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def file(self):
+        return self._file
+
+    @property
+    def cached_bytes(self):
+        return self._bytes
+
+    @property
+    def is_playing(self):
+        return bool(self._visible_labels)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def current_pixmap(self):
+        """
+        Returns current frame pixmap
+        :return: QPixmap
+        """
+
+        return self._pixmap
+
+    def set_label_visible(self, label, flag):
+        """
+        Sets whether given label is visible. Stream is only played while any of its labels is visible
+        :param label: GifLabel
+        :param flag: bool
+        """
+
+        if flag:
+            self._visible_labels.add(label)
+        else:
+            self._visible_labels.discard(label)
+
+        # Complete streams with a single frame are not animated
+        if self._visible_labels and not (self._complete and len(self._frames) <= 1):
+            scheduler.frame_scheduler().register(self)
+        else:
+            scheduler.frame_scheduler().unregister(self)
+
+    def tick(self, delta_seconds):
+        """
+        Advances stream frames
+        Called by the global frame scheduler while the stream is playing
+        :param delta_seconds: float
+        """
+
+        if not self._visible_labels:
+            # All visible labels were deleted without being hidden
+            scheduler.frame_scheduler().unregister(self)
+            return
+
+        self._time_to_next -= delta_seconds * 1000
+        if self._time_to_next > 0:
+            return
+
+        # Only one frame is advanced each tick, stream never tries to catch up missed frames
+        if self._next_frame():
+            self.frameChanged.emit()
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _create_reader(self):
+        """
+        Internal function that creates the image reader used to decode GIF frames
+        :return: QImageReader
+        """
+
+        reader = QImageReader(self._file)
+        if self._size and self._size.isValid():
+            reader.setScaledSize(self._size)
+
+        return reader
+
+    def _next_frame(self):
+        """
+        Internal function that moves stream to its next frame
+        :return: bool, True if the current frame changed; False otherwise
+        """
+
+        next_index = self._index + 1
+        if self._complete:
+            if not self._frames:
+                return False
+            next_index %= len(self._frames)
+            self._pixmap, self._delay = self._frames[next_index]
+        else:
+            if self._reader is None:
+                self._reader = self._create_reader()
+            image = self._reader.read()
+            if image.isNull():
+                if next_index == 0:
+                    # Invalid file
+                    self._complete = True
+                    self._reader = None
+                    return False
+                if self._overflow:
+                    self._reader = self._create_reader()
+                    image = self._reader.read()
+                else:
+                    self._complete = True
+                    self._reader = None
+                next_index = 0
+                if self._complete:
+                    self._pixmap, self._delay = self._frames[0]
+            if not image.isNull():
+                self._pixmap = QPixmap.fromImage(image)
+                self._delay = self._reader.nextImageDelay() or DEFAULT_FRAME_DELAY
+                if not self._overflow:
+                    self._cache_frame(self._pixmap, self._delay)
+
+        self._index = next_index
+        self._time_to_next = self._delay
+
+        return True
+
+    def _cache_frame(self, pixmap, delay):
+        """
+        Internal function that stores given frame. If the stream frames do not fit into memory limit, cache is
+        discarded and frames are decoded again on each loop
+        """
+
+        self._bytes += pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+        if self._bytes > self._max_bytes:
+            self._overflow = True
+            self._frames = list()
+            self._bytes = 0
+            return
+
+        self._frames.append((pixmap, delay))
+
+
+def gif_stream(gif_file, size=None):
+    """
+    Returns shared stream that plays given GIF file at given size
+    :param gif_file: str
+    :param size: QSize or None
+    :return: GifStream
+    """
+
+    gif_file = os.path.normpath(os.path.abspath(gif_file))
+    key = (gif_file, os.path.getmtime(gif_file), (size.width(), size.height()) if size else None)
+    stream = _GIF_STREAMS.get(key)
+    if stream is None:
+        stream = GifStream(gif_file, size=size)
+        _GIF_STREAMS[key] = stream
+
+    return stream
+
+
+def gif_stats():
+    """
+    Returns the number of shared GIF streams alive and the amount of bytes of decoded frames they keep in memory
+    :return: dict
+    """
+
+    streams = list(_GIF_STREAMS.values())
+
+    return {
+        'streams': len(streams), 'playing': len([stream for stream in streams if stream.is_playing]),
+        'bytes': sum(stream.cached_bytes for stream in streams)
+    }
 
 
 class GifLabel(QLabel, object):
-    def __init__(self, gif_file=None, parent=None):
+
+    DEFAULT_PLAYBACK_MODE = GifPlaybackModes.STREAM
+
+    def __init__(self, gif_file=None, parent=None, playback_mode=None, size=None):
         super(GifLabel, self).__init__('Name', parent)
 
-        self._movie = QMovie(self)
-        self._movie.setCacheMode(QMovie.CacheAll)
-        self._movie.setSpeed(100)
+        self._playback_mode = playback_mode or self.DEFAULT_PLAYBACK_MODE
+        self._file = None
+        self._size = size
+        self._stream = None
+        self._movie = None
+
+        if self._playback_mode == GifPlaybackModes.MOVIE:
+            self._movie = QMovie(self)
+            self._movie.setCacheMode(QMovie.CacheAll)
+            self._movie.setSpeed(100)
+            if self._size:
+                self._movie.setScaledSize(self._size)
         self.set_file(gif_file)
         self.setAlignment(Qt.AlignCenter)
-        self.setMovie(self._movie)
-        self._movie.start()
+        if self._movie:
+            self.setMovie(self._movie)
+            self._movie.start()
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def playback_mode(self):
+        return self._playback_mode
+
+    # =================================================================================================================
+    # OVERRIDES
+    # =================================================================================================================
+
+    def showEvent(self, event):
+        if self._stream:
+            self._stream.set_label_visible(self, True)
+            self.setPixmap(self._stream.current_pixmap())
+        super(GifLabel, self).showEvent(event)
+
+    def hideEvent(self, event):
+        if self._stream:
+            self._stream.set_label_visible(self, False)
+        super(GifLabel, self).hideEvent(event)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
 
     def set_file(self, gif_file):
         if not gif_file or not os.path.isfile(gif_file):
             return
 
-        self._movie.setFileName(gif_file)
-        self._movie.start()
+        self._file = gif_file
+        if self._movie:
+            self._movie.setFileName(gif_file)
+            self._movie.start()
+        else:
+            self._update_stream()
 
     def set_size(self, width, height):
-        self._movie.setScaledSize(QSize(width, height))
+        self._size = QSize(width, height)
+        if self._movie:
+            self._movie.setScaledSize(self._size)
+        else:
+            self._update_stream()
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _update_stream(self):
+        """
+        Internal function that connects the label to the shared stream of its current file and size
+        """
+
+        if self._stream:
+            self._stream.set_label_visible(self, False)
+            self._stream.frameChanged.disconnect(self._on_stream_frame_changed)
+            self._stream = None
+        if not self._file:
+            return
+
+        self._stream = gif_stream(self._file, size=self._size)
+        self._stream.frameChanged.connect(self._on_stream_frame_changed)
+        self.setPixmap(self._stream.current_pixmap())
+        if self.isVisible():
+            self._stream.set_label_visible(self, True)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_stream_frame_changed(self):
+        """
+        Internal callback function that is called each time shared stream frame changes
+        """
+
+        if self.isVisible():
+            self.setPixmap(self._stream.current_pixmap())
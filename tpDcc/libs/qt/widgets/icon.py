@@ -13,7 +13,7 @@ from Qt.QtCore import Signal, QSize
 from Qt.QtWidgets import QSizePolicy, QToolButton, QMenu
 
 from tpDcc.managers import resources
-from tpDcc.libs.qt.core import base
+from tpDcc.libs.qt.core import base, iconcache
 from tpDcc.libs.qt.widgets import layouts, buttons
 
 
@@ -45,7 +45,7 @@ class IconPickerButton(QToolButton):
         self._icon_path = icon_path
         self.setToolTip(icon_path)
         self.setStatusTip(icon_path)
-        icon = resources.icon(icon_path)
+        icon = iconcache.icon(icon_path)
         self.setIcon(icon)
 
 
@@ -7,13 +7,56 @@ Module that contains classes to create different kind of labels
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Signal, Property, QRect, QSize, QPropertyAnimation
+from collections import OrderedDict
+
+from Qt.QtCore import Qt, Signal, Property, QEvent, QRect, QSize, QPropertyAnimation
 from Qt.QtWidgets import QSizePolicy, QLabel, QLineEdit, QStyleOption
-from Qt.QtGui import QFontMetrics, QTextCursor, QTextDocument, QPainter
+from Qt.QtGui import QFontMetrics, QTextCursor, QTextDocument, QPainter, QPixmap
 
-from tpDcc.libs.qt.core import qtutils
+from tpDcc.libs.qt.core import qtutils, image
 from tpDcc.libs.qt.widgets import graphicseffects
 
+# Maximum number of elided texts and width hints kept in memory
+MAX_CACHED_TEXT_METRICS = 4096
+
+_TEXT_METRICS_CACHE = OrderedDict()
+
+
+def cached_text_metric(key):
+    """
+    Returns the cached text metric stored with the given key
+    :param key: tuple
+    :return: object or None
+    """
+
+    value = _TEXT_METRICS_CACHE.pop(key, None)
+    if value is not None:
+        _TEXT_METRICS_CACHE[key] = value
+
+    return value
+
+
+def store_text_metric(key, value):
+    """
+    Stores given text metric in the shared cache, discarding least recently used ones if the cache is full
+    :param key: tuple
+    :param value: object
+    """
+
+    _TEXT_METRICS_CACHE.pop(key, None)
+    _TEXT_METRICS_CACHE[key] = value
+    while len(_TEXT_METRICS_CACHE) > MAX_CACHED_TEXT_METRICS:
+        _TEXT_METRICS_CACHE.popitem(last=False)
+
+
+def clear_text_metrics_cache():
+    """
+    Removes all cached text metrics
+    Should be called if text rendering changes without changing fonts or device pixel ratio
+    """
+
+    _TEXT_METRICS_CACHE.clear()
+
 
 class BaseLabel(QLabel, object):
 
@@ -470,6 +513,7 @@ class ElidedLabel(BaseLabel, object):
         self._actual_text = ""
         self._line_width = 0
         self._ideal_width = None
+        self._elided_key = None
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
@@ -484,21 +528,36 @@ class ElidedLabel(BaseLabel, object):
 
         if not self._ideal_width:
 
-            doc = QTextDocument()
-            try:
-                # add the extra space to buffer the width a bit
-                doc.setHtml(self._actual_text + "&nbsp;")
-                doc.setDefaultFont(self.font())
-                width = doc.idealWidth()
-            except Exception:
-                width = self.width()
-            finally:
-                qtutils.safe_delete_later(doc)
+            key = ('width_hint', self._actual_text) + self._get_metrics_key()
+            width = cached_text_metric(key)
+            if width is None:
+                doc = QTextDocument()
+                try:
+                    # add the extra space to buffer the width a bit
+                    doc.setHtml(self._actual_text + "&nbsp;")
+                    doc.setDefaultFont(self.font())
+                    width = doc.idealWidth()
+                    store_text_metric(key, width)
+                except Exception:
+                    width = self.width()
+                finally:
+                    qtutils.safe_delete_later(doc)
 
             self._ideal_width = width
 
         return self._ideal_width
 
+    def _get_metrics_key(self):
+        """
+        Internal function that returns the part of text metrics cache keys that depends on label font and screen
+        :return: tuple(str, float)
+        """
+
+        device_pixel_ratio = getattr(self, 'devicePixelRatioF', None)
+        device_pixel_ratio = device_pixel_ratio() if device_pixel_ratio else self.devicePixelRatio()
+
+        return self.font().key(), device_pixel_ratio
+
     def _get_elide_mode(self):
         """
         Returns current elide mode
@@ -548,17 +607,41 @@ class ElidedLabel(BaseLabel, object):
 
         self._update_elided_text()
 
+    def changeEvent(self, event):
+        """
+        Overridden base method called when the widget state changes.
+        Font and screen changes invalidate cached text metrics of the label
+        """
+
+        # Labels whose elided text was not computed yet have nothing to invalidate
+        if getattr(self, '_elided_key', None) is not None and event.type() in (
+                QEvent.FontChange, getattr(QEvent, 'ScreenChangeInternal', QEvent.FontChange)):
+            self._ideal_width = None
+            self._elided_key = None
+            self._update_elided_text()
+            self.updateGeometry()
+
+        super(ElidedLabel, self).changeEvent(event)
+
     def _update_elided_text(self):
         """
         Update the elided text on the label
+        Elided text is only computed again when the text, width, elide mode, font or screen of the label change
         """
 
+        elided_key = (self._actual_text, self.width(), self._elide_mode) + self._get_metrics_key()
+        if elided_key == self._elided_key:
+            return
+
+        self._elided_key = elided_key
         text = self._elide_text(self._actual_text, self._elide_mode)
         QLabel.setText(self, text)
 
     def _elide_text(self, text, elide_mode):
         """
         Elide the specified text using the specified mode
+        The width of each text is cached independently of the label width, so texts are only laid out again when
+        they need to be elided. Elided texts are stored in a cache shared by all the labels
         :param text:        The text to elide
         :param elide_mode:  The elide mode to use
         :returns:           The elided text.
@@ -567,6 +650,53 @@ class ElidedLabel(BaseLabel, object):
         # target width is the label width:
         target_width = self.width()
 
+        metrics_key = self._get_metrics_key()
+        line_width = self._get_ideal_width(text, metrics_key)
+        if line_width <= target_width:
+            self._line_width = line_width
+            return text
+
+        key = ('elided', text, target_width, elide_mode) + metrics_key
+        cached = cached_text_metric(key)
+        if cached is None:
+            cached = self._compute_elided_text(text, elide_mode, target_width)
+            store_text_metric(key, cached)
+
+        elided_text, self._line_width = cached
+
+        return elided_text
+
+    def _get_ideal_width(self, text, metrics_key):
+        """
+        Internal function that returns the width of the given text without eliding it
+        :param text: str
+        :param metrics_key: tuple(str, float)
+        :return: float
+        """
+
+        key = ('ideal_width', text) + metrics_key
+        width = cached_text_metric(key)
+        if width is None:
+            doc = QTextDocument()
+            try:
+                doc.setHtml(text)
+                doc.setDefaultFont(self.font())
+                width = doc.idealWidth()
+            finally:
+                qtutils.safe_delete_later(doc)
+            store_text_metric(key, width)
+
+        return width
+
+    def _compute_elided_text(self, text, elide_mode, target_width):
+        """
+        Internal function that elides the specified text using the specified mode
+        :param text:            The text to elide
+        :param elide_mode:      The elide mode to use
+        :param target_width:    The maximum width of the text
+        :returns:               tuple(str, int), the elided text and its width
+        """
+
         # Use a QTextDocument to measure html/richtext width
         doc = QTextDocument()
         try:
@@ -576,8 +706,7 @@ class ElidedLabel(BaseLabel, object):
             # if line width is already less than the target width then great!
             line_width = doc.idealWidth()
             if line_width <= target_width:
-                self._line_width = line_width
-                return text
+                return text, line_width
 
             # depending on the elide mode, insert ellipses in the correct place
             cursor = QTextCursor(doc)
@@ -602,8 +731,7 @@ class ElidedLabel(BaseLabel, object):
                 # an empty string
                 char_count = doc.characterCount()
                 if char_count <= ellipses_len:
-                    self._line_width = 0
-                    return ""
+                    return "", 0
 
                 # calculate the number of characters to remove - should always remove at least 1
                 # to be sure the text gets shorter!
@@ -631,8 +759,7 @@ class ElidedLabel(BaseLabel, object):
                 if line_width == start_line_width:
                     break
 
-            self._line_width = line_width
-            return doc.toHtml()
+            return doc.toHtml(), line_width
         finally:
             qtutils.safe_delete_later(doc)
 
@@ -645,14 +772,47 @@ class ElidedLabel(BaseLabel, object):
 
 
 class ThumbnailLabel(QLabel, object):
+
+    THUMBNAIL_SIZE = QSize(80, 55)
+
     def __init__(self, parent=None):
         super(ThumbnailLabel, self).__init__(parent=parent)
 
+        self._image_path = None
+
     def setPixmap(self, pixmap):
-        if pixmap.height() > 55 or pixmap.width() > 80:
-            pixmap = pixmap.scaled(QSize(80, 55), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if pixmap.height() > self.THUMBNAIL_SIZE.height() or pixmap.width() > self.THUMBNAIL_SIZE.width():
+            pixmap = pixmap.scaled(self.THUMBNAIL_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         super(ThumbnailLabel, self).setPixmap(pixmap)
 
+    def image_path(self):
+        """
+        Returns path of the image loaded in the thumbnail
+        :return: str or None
+        """
+
+        return self._image_path
+
+    def set_image_path(self, image_path):
+        """
+        Loads thumbnail image from disk in a background thread. Image is downscaled while it is decoded
+        :param image_path: str
+        """
+
+        if self._image_path and self._image_path != image_path:
+            image.image_loader().cancel(self._image_path, self.THUMBNAIL_SIZE, self._on_image_loaded)
+        self._image_path = image_path
+        image.image_loader().request(image_path, self.THUMBNAIL_SIZE, self._on_image_loaded)
+
+    def _on_image_loaded(self, loaded_image):
+        """
+        Internal callback function that is called when thumbnail image is loaded
+        :param loaded_image: QImage
+        """
+
+        if loaded_image is not None and not loaded_image.isNull():
+            self.setPixmap(QPixmap.fromImage(loaded_image))
+
 
 class AnimatedLabel(QLabel, object):
     def __init__(self, text='', duration=800, parent=None):
@@ -112,6 +112,10 @@ class FlowLayout(QLayout, object):
         self._item_list = list()
         self._overflow = None
         self._size_hint_layout = self.minimumSize()
+        self._item_hints = None
+        self._height_for_width = dict()
+        self._geometries = None
+        self._cache_generation = 0
 
         self.set_spacing_x(spacing_x)
         self.set_spacing_y(spacing_y)
@@ -131,6 +135,16 @@ class FlowLayout(QLayout, object):
     def items_list(self):
         return self._item_list
 
+    @property
+    def cache_generation(self):
+        """
+        Returns a number that changes every time layout cached data is discarded
+        Can be used by other widgets to know when their own data computed from layout items is outdated
+        :return: int
+        """
+
+        return self._cache_generation
+
     def addItem(self, item):
         """
         Overrides base QLayout addItem function
@@ -138,6 +152,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._item_list.append(item)
+        self._clear_cache(geometries=True)
 
     def count(self):
         """
@@ -167,6 +182,7 @@ class FlowLayout(QLayout, object):
         """
 
         if 0 <= index < len(self._item_list):
+            self._clear_cache(geometries=True)
             return self._item_list.pop(index)
 
         return None
@@ -198,7 +214,10 @@ class FlowLayout(QLayout, object):
         :return: int
         """
 
-        height = self._generate_layout(QRect(0, 0, width, 0), True)
+        height = self._height_for_width.get(width)
+        if height is None:
+            height = self._generate_layout(QRect(0, 0, width, 0), True)
+            self._height_for_width[width] = height
         self._size_hint_layout = QSize(width, height)
 
         return height
@@ -212,6 +231,15 @@ class FlowLayout(QLayout, object):
         super(FlowLayout, self).setGeometry(rect)
         self._generate_layout(rect, False)
 
+    def invalidate(self):
+        """
+        Overrides base QLayout invalidate function
+        Cached item size hints and computed heights are discarded
+        """
+
+        self._clear_cache()
+        super(FlowLayout, self).invalidate()
+
     def sizeHint(self):
         """
         Returns the preferred size of this layout
@@ -241,12 +269,11 @@ class FlowLayout(QLayout, object):
         :return: list
         """
 
-        remove = list()
-        for item in self._item_list:
-            if not qtutils.is_valid_widget(item):
-                remove.append(item)
+        valid_items = [item for item in self._item_list if qtutils.is_valid_widget(item)]
+        if len(valid_items) != len(self._item_list):
+            self._item_list[:] = valid_items
+            self._clear_cache(geometries=True)
 
-        [self._item_list.remove(r) for r in remove]
         return self._item_list
 
     def set_spacing_x(self, spacing):
@@ -256,6 +283,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._spacing_x = qtutils.dpi_scale(spacing)
+        self._clear_cache()
 
     def set_spacing_y(self, spacing):
         """
@@ -264,6 +292,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._spacing_y = qtutils.dpi_scale(spacing)
+        self._clear_cache()
 
     def clear(self):
         """
@@ -292,6 +321,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._orientation = orientation
+        self._clear_cache()
 
     def add_spacing(self, spacing):
         """
@@ -314,6 +344,7 @@ class FlowLayout(QLayout, object):
 
         item = QWidgetItem(widget)
         self._item_list.insert(index, item)
+        self._clear_cache(geometries=True)
 
     def remove_at(self, index):
         """
@@ -339,6 +370,30 @@ class FlowLayout(QLayout, object):
         """
 
         self._overflow = flag
+        self._clear_cache()
+
+    def _clear_cache(self, geometries=False):
+        """
+        Internal function that clears cached size hints and computed heights
+        :param geometries: bool, whether to forget the geometries applied to the items (needed when items change)
+        """
+
+        self._item_hints = None
+        self._height_for_width.clear()
+        self._cache_generation += 1
+        if geometries:
+            self._geometries = None
+
+    def _get_item_hints(self):
+        """
+        Internal function that returns the size hints of all items. Size hints are cached until layout is invalidated
+        :return: list(QSize)
+        """
+
+        if self._item_hints is None or len(self._item_hints) != len(self._item_list):
+            self._item_hints = [item.sizeHint() for item in self._item_list]
+
+        return self._item_hints
 
     def _generate_layout(self, rect, test_only=True):
         """
@@ -352,41 +407,63 @@ class FlowLayout(QLayout, object):
         y = rect.y()
         line_height = 0
         orientation = self.orientation()
+        space_x = self._spacing_x
+        space_y = self._spacing_y
+        geometries = list()
 
-        for item in self._item_list:
+        for item, hint in zip(self._item_list, self._get_item_hints()):
             widget = item.widget()
-            if widget.isHidden():
+            if widget and widget.isHidden():
+                geometries.append(None)
                 continue
 
-            space_x = self._spacing_x
-            space_y = self._spacing_y
-
             if orientation == Qt.Horizontal:
-                next_x = x + item.sizeHint().width() + space_x
+                next_x = x + hint.width() + space_x
                 if next_x - space_x > rect.right() and line_height > 0:
                     if not self._overflow:
                         x = rect.x()
                         y = y + line_height + (space_y * 2)
-                        next_x = x + item.sizeHint().width() + space_x
+                        next_x = x + hint.width() + space_x
                         line_height = 0
-                if not test_only:
-                    item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                geometries.append(QRect(QPoint(x, y), hint))
                 x = next_x
-                line_height = max(line_height, item.sizeHint().height())
+                line_height = max(line_height, hint.height())
             else:
-                next_y = y + item.sizeHint().height() + space_y
+                next_y = y + hint.height() + space_y
                 if next_y - space_y > rect.bottom() and line_height > 0:
                     if not self._overflow:
                         y = rect.y()
                         x = x + line_height + (space_x * 2)
-                        next_y = y + item.sizeHint().height() + space_y
+                        next_y = y + hint.height() + space_y
                         line_height = 0
-                if not test_only:
-                    item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-                x = next_y
-                line_height = max(line_height, item.sizeHint().height())
+                geometries.append(QRect(QPoint(x, y), hint))
+                y = next_y
+                line_height = max(line_height, hint.width())
+
+        if not test_only:
+            self._apply_geometries(geometries)
 
         if orientation == Qt.Horizontal:
             return y + line_height - rect.y()
         else:
             return x + line_height - rect.x()
+
+    def _apply_geometries(self, geometries):
+        """
+        Internal function that applies given geometries to layout items
+        Only the items whose geometry changed since the last layout pass are updated
+        :param geometries: list(QRect or None)
+        """
+
+        previous_geometries = self._geometries
+        if previous_geometries is not None and len(previous_geometries) != len(geometries):
+            previous_geometries = None
+
+        for i, geometry in enumerate(geometries):
+            if geometry is None:
+                continue
+            if previous_geometries is not None and previous_geometries[i] == geometry:
+                continue
+            self._item_list[i].setGeometry(geometry)
+
+        self._geometries = geometries
@@ -7,12 +7,127 @@ Module that contains implementation for loading widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Property, QSize, QPropertyAnimation
-from Qt.QtGui import QPainter
+import weakref
+from collections import OrderedDict
+
+from Qt.QtCore import Qt, Property, QObject, QSize, QPointF, QElapsedTimer
+from Qt.QtGui import QPainter, QPixmap
 
-from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import base
+from tpDcc.libs.qt.core import base, scheduler, iconcache
+
+# Number of pre-rendered frames of a full loading rotation
+FRAME_COUNT = 36
+
+# Maximum number of pre-rendered frame sets (one per size and color) kept in memory
+MAX_CACHED_FRAME_SETS = 16
+
+_FRAME_CACHE = OrderedDict()
+
+
+def loading_frames(pixmap, size):
+    """
+    Returns the pre-rendered rotation frames of the given pixmap
+    Frames are rendered only once per pixmap and size and shared between all loading widgets
+    :param pixmap: QPixmap
+    :param size: int
+    :return: list(QPixmap)
+    """
+
+    key = (pixmap.cacheKey(), size)
+    frames = _FRAME_CACHE.pop(key, None)
+    if frames is None:
+        frames = list()
+        source = pixmap.scaledToWidth(size, Qt.SmoothTransformation)
+        for i in range(FRAME_COUNT):
+            frame = QPixmap(size, size)
+            frame.fill(Qt.transparent)
+            painter = QPainter(frame)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.translate(size / 2, size / 2)
+            painter.rotate(360.0 * i / FRAME_COUNT)
+            painter.drawPixmap(QPointF(-source.width() / 2, -source.height() / 2), source)
+            painter.end()
+            frames.append(frame)
+    _FRAME_CACHE[key] = frames
+    while len(_FRAME_CACHE) > MAX_CACHED_FRAME_SETS:
+        _FRAME_CACHE.popitem(last=False)
+
+    return frames
+
+
+class LoadingClock(QObject, object):
+    """
+    Advances the frames of all visible loading widgets from the global frame scheduler
+    All widgets share the same time reference, so loading widgets with the same speed rotate in sync
+    """
+
+    def __init__(self, parent=None):
+        super(LoadingClock, self).__init__(parent)
+
+        self._widgets = weakref.WeakSet()
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+    def register(self, widget):
+        """
+        Starts animating given loading widget
+        :param widget: CircleLoading
+        """
+
+        self._widgets.add(widget)
+        scheduler.frame_scheduler().register(self)
+
+    def unregister(self, widget):
+        """
+        Stops animating given loading widget
+        :param widget: CircleLoading
+        """
+
+        self._widgets.discard(widget)
+        if not self._widgets:
+            scheduler.frame_scheduler().unregister(self)
+
+    def elapsed(self):
+        """
+        Returns the time (in milliseconds) elapsed since the clock started
+        :return: int
+        """
+
+        return self._clock.elapsed()
+
+    def tick(self, delta_seconds=None):
+        """
+        Updates the frame of all the visible loading widgets
+        :param delta_seconds: float
+        """
+
+        elapsed = self._clock.elapsed()
+        for widget in list(self._widgets):
+            try:
+                if not widget.isVisible() or widget.width() <= 0 or widget.height() <= 0:
+                    continue
+                widget.advance(elapsed)
+            except RuntimeError:
+                self._widgets.discard(widget)
+        if not self._widgets:
+            scheduler.frame_scheduler().unregister(self)
+
+
+_LOADING_CLOCK = None
+
+
+def loading_clock():
+    """
+    Returns global loading clock
+    :return: LoadingClock
+    """
+
+    global _LOADING_CLOCK
+    if _LOADING_CLOCK is None:
+        _LOADING_CLOCK = LoadingClock()
+
+    return _LOADING_CLOCK
 
 
 @theme.mixin
@@ -23,28 +138,24 @@ class CircleLoading(base.BaseWidget, object):
         size = size or self.theme_default_size()
         self.setFixedSize(QSize(size, size))
 
-        self._rotation = 0
-        self._loading_pixmap = resources.pixmap(
-            'loading', extension='svg', color=color or self.accent_color()).scaledToWidth(size, Qt.SmoothTransformation)
-        self._loading_anim = QPropertyAnimation()
-        self._loading_anim.setTargetObject(self)
-        self._loading_anim.setDuration(1000 * (1 / speed))
-        self._loading_anim.setPropertyName('rotation')
-        self._loading_anim.setStartValue(0)
-        self._loading_anim.setEndValue(360)
-        self._loading_anim.setLoopCount(-1)
-        self._loading_anim.start()
+        self._size = size
+        self._frame = 0
+        self._duration = 1000 * (1 / speed)
+        self._loading_pixmap = iconcache.pixmap('loading', color=color or self.accent_color(), extension='svg')
+        self._frames = loading_frames(self._loading_pixmap, size)
 
     # ============================================================================================================
     # PROPERTIES
     # ============================================================================================================
 
     def _set_rotation(self, value):
-        self._rotation = value
-        self.update()
+        frame = int(round(value * FRAME_COUNT / 360.0)) % FRAME_COUNT
+        if frame != self._frame:
+            self._frame = frame
+            self.update()
 
     def _get_rotation(self):
-        return self._rotation
+        return int(360 * self._frame / FRAME_COUNT)
 
     rotation = Property(int, _get_rotation, _set_rotation)
 
@@ -52,14 +163,18 @@ class CircleLoading(base.BaseWidget, object):
     # OVERRIDES
     # ============================================================================================================
 
+    def showEvent(self, event):
+        loading_clock().register(self)
+        self.advance(loading_clock().elapsed())
+        super(CircleLoading, self).showEvent(event)
+
+    def hideEvent(self, event):
+        loading_clock().unregister(self)
+        super(CircleLoading, self).hideEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.translate(self._loading_pixmap.width() / 2, self._loading_pixmap.height() / 2)
-        painter.rotate(self._rotation)
-        painter.drawPixmap(
-            -self._loading_pixmap.width() / 2, -self._loading_pixmap.height() / 2, self._loading_pixmap.width(),
-            self._loading_pixmap.height(), self._loading_pixmap)
+        painter.drawPixmap(0, 0, self._frames[self._frame])
         painter.end()
 
         return super(CircleLoading, self).paintEvent(event)
@@ -75,7 +190,21 @@ class CircleLoading(base.BaseWidget, object):
         """
 
         self.setFixedSize(QSize(size, size))
-        self._loading_pixmap = self._loading_pixmap.scaledToWidth(size, Qt.SmoothTransformation)
+        self._size = size
+        self._frames = loading_frames(self._loading_pixmap, size)
+        self.update()
+
+    def advance(self, elapsed):
+        """
+        Updates current frame from the given loading clock time
+        Called by the loading clock while the widget is visible
+        :param elapsed: int, time in milliseconds
+        """
+
+        frame = int(elapsed * FRAME_COUNT / self._duration) % FRAME_COUNT
+        if frame != self._frame:
+            self._frame = frame
+            self.update()
 
     @classmethod
     def tiny(cls, color=None, parent=None):
@@ -15,7 +15,7 @@ from Qt.QtWidgets import QFrame
 from tpDcc import dcc
 from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import base
+from tpDcc.libs.qt.core import base, notifications
 from tpDcc.libs.qt.widgets import layouts, label, avatar, buttons, loading
 
 
@@ -206,44 +206,59 @@ class PopupMessage(base.BaseWidget, object):
 
     DEFAULT_CONFIG = {'duration': 2, 'top': 24}
 
+    # Maximum amount of popup messages visible at once in the same parent
+    NOTIFICATION_MAX_VISIBLE = 5
+
+    # Duration (in milliseconds) of show and hide animations
+    FADE_DURATION = 300
+
+    # Vertical distance (in pixels) between stacked popup messages
+    STACK_SPACING = 50
+
     closed = Signal()
 
-    def __init__(self, text, duration=None, theme_type=None, closable=False, parent=None):
+    def __init__(self, text, duration=None, theme_type=None, closable=False, parent=None, managed=False):
 
         self._text = text
         self._duration = duration
         self._theme_type = theme_type
         self._closable = closable
+        self._managed = managed
+        self._repeat_count = 1
 
         super(PopupMessage, self).__init__(parent=parent)
 
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        close_timer = QTimer(self)
-        close_timer.setSingleShot(True)
-        close_timer.timeout.connect(self.close)
-        close_timer.timeout.connect(self.closed)
-        close_timer.setInterval((duration or self.DEFAULT_CONFIG['duration']) * 1000)
-        anim_timer = QTimer(self)
-        anim_timer.timeout.connect(self._on_fade_out)
-        anim_timer.setInterval((duration or self.DEFAULT_CONFIG['duration']) * 1000 - 300)
-        close_timer.start()
-        anim_timer.start()
-
         self._pos_anim = QPropertyAnimation(self)
         self._pos_anim.setTargetObject(self)
         self._pos_anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._pos_anim.setDuration(300)
+        self._pos_anim.setDuration(self.FADE_DURATION)
         self._pos_anim.setPropertyName(b'pos')
 
         self._opacity_anim = QPropertyAnimation()
         self._opacity_anim.setTargetObject(self)
         self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._opacity_anim.setDuration(300)
+        self._opacity_anim.setDuration(self.FADE_DURATION)
         self._opacity_anim.setPropertyName(b'windowOpacity')
         self._opacity_anim.setStartValue(0.0)
         self._opacity_anim.setEndValue(1.0)
 
+        # Managed messages are expired, positioned and animated by the notification manager
+        if managed:
+            return
+
+        close_timer = QTimer(self)
+        close_timer.setSingleShot(True)
+        close_timer.timeout.connect(self.close)
+        close_timer.timeout.connect(self.closed)
+        close_timer.setInterval((duration or self.DEFAULT_CONFIG['duration']) * 1000)
+        anim_timer = QTimer(self)
+        anim_timer.timeout.connect(self._on_fade_out)
+        anim_timer.setInterval((duration or self.DEFAULT_CONFIG['duration']) * 1000 - self.FADE_DURATION)
+        close_timer.start()
+        anim_timer.start()
+
         self._set_proper_position(parent)
         self._fade_in()
 
@@ -291,7 +306,7 @@ class PopupMessage(base.BaseWidget, object):
         main_frame_layout.addWidget(self._close_btn)
 
     def setup_signals(self):
-        self._close_btn.clicked.connect(self.close)
+        self._close_btn.clicked.connect(self._on_close_button_clicked)
 
     # =================================================================================================================
     # BASE
@@ -305,14 +320,11 @@ class PopupMessage(base.BaseWidget, object):
         :param parent: QWidget
         :param duration: int
         :param closable: bool
-        :return: PopupMessage
+        :return: NotificationHandle, handle of the posted message (messages can be queued or merged)
         """
 
-        popup_message_inst = cls(
-            text, theme_type=MessageTypes.INFO, duration=duration, closable=closable, parent=parent)
-        popup_message_inst.show()
-
-        return popup_message_inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=MessageTypes.INFO, duration=duration, closable=closable)
 
     @classmethod
     def success(cls, text, parent, duration=None, closable=None):
@@ -322,14 +334,11 @@ class PopupMessage(base.BaseWidget, object):
         :param parent: QWidget
         :param duration: int
         :param closable: bool
-        :return: PopupMessage
+        :return: NotificationHandle, handle of the posted message (messages can be queued or merged)
         """
 
-        popup_message_inst = cls(
-            text, theme_type=MessageTypes.SUCCESS, duration=duration, closable=closable, parent=parent)
-        popup_message_inst.show()
-
-        return popup_message_inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=MessageTypes.SUCCESS, duration=duration, closable=closable)
 
     @classmethod
     def warning(cls, text, parent, duration=None, closable=None):
@@ -339,14 +348,11 @@ class PopupMessage(base.BaseWidget, object):
         :param parent: QWidget
         :param duration: int
         :param closable: bool
-        :return: PopupMessage
+        :return: NotificationHandle, handle of the posted message (messages can be queued or merged)
         """
 
-        popup_message_inst = cls(
-            text, theme_type=MessageTypes.WARNING, duration=duration, closable=closable, parent=parent)
-        popup_message_inst.show()
-
-        return popup_message_inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=MessageTypes.WARNING, duration=duration, closable=closable)
 
     @classmethod
     def error(cls, text, parent, duration=None, closable=None):
@@ -356,14 +362,11 @@ class PopupMessage(base.BaseWidget, object):
         :param parent: QWidget
         :param duration: int
         :param closable: bool
-        :return: PopupMessage
+        :return: NotificationHandle, handle of the posted message (messages can be queued or merged)
         """
 
-        popup_message_inst = cls(
-            text, theme_type=MessageTypes.ERROR, duration=duration, closable=closable, parent=parent)
-        popup_message_inst.show()
-
-        return popup_message_inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=MessageTypes.ERROR, duration=duration, closable=closable)
 
     @classmethod
     def loading(cls, text, parent, duration=None, closable=None):
@@ -373,14 +376,11 @@ class PopupMessage(base.BaseWidget, object):
         :param parent: QWidget
         :param duration: int
         :param closable: bool
-        :return: PopupMessage
+        :return: NotificationHandle, handle of the posted message (messages can be queued or merged)
         """
 
-        popup_message_inst = cls(
-            text, theme_type=MessageTypes.LOADING, duration=duration, closable=closable, parent=parent)
-        popup_message_inst.show()
-
-        return popup_message_inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=MessageTypes.LOADING, duration=duration, closable=closable)
 
     @classmethod
     def config(cls, duration=None, top=None):
@@ -395,6 +395,85 @@ class PopupMessage(base.BaseWidget, object):
         if top is not None:
             cls.DEFAULT_CONFIG['top'] = top
 
+    @classmethod
+    def create_notification(cls, text, theme_type, closable, parent):
+        """
+        Creates a new popup message managed by the notification manager
+        :param text: str
+        :param theme_type: str
+        :param closable: bool
+        :param parent: QWidget
+        :return: PopupMessage
+        """
+
+        return cls(text, theme_type=theme_type, closable=closable, parent=parent, managed=True)
+
+    def reset_notification(self, text, closable, parent):
+        """
+        Reconfigures a pooled popup message so it can be shown again
+        :param text: str
+        :param closable: bool
+        :param parent: QWidget
+        """
+
+        self.setParent(parent, self.windowFlags())
+        self._text = text
+        self._closable = closable
+        self._repeat_count = 1
+        self._content_label.setText(self._text)
+        self._close_btn.setVisible(self._closable or False)
+
+    def set_repeat_count(self, count):
+        """
+        Sets the number of times the message was posted
+        :param count: int
+        """
+
+        self._repeat_count = count
+        self._content_label.setText(self._text if count <= 1 else '{} (x{})'.format(self._text, count))
+
+    def place(self, parent, index):
+        """
+        Moves the message to the given slot of the parent messages stack
+        :param parent: QWidget
+        :param index: int
+        """
+
+        pos, parent_geo = self._get_parent_position(parent)
+        target_x = pos.x() + parent_geo.width() / 2 - 100
+        target_y = pos.y() + PopupMessage.DEFAULT_CONFIG.get('top') + index * self.STACK_SPACING
+        self._pos_anim.setStartValue(QPoint(target_x, target_y - 40))
+        self._pos_anim.setEndValue(QPoint(target_x, target_y))
+        if self.isVisible() and self._pos_anim.state() != QAbstractAnimation.Running:
+            self.move(QPoint(target_x, target_y))
+
+    def fade_in(self):
+        """
+        Starts message show animation
+        """
+
+        self._fade_in()
+
+    def fade_out(self):
+        """
+        Starts message hide animation
+        """
+
+        self._fade_out()
+
+    def notification_released(self):
+        """
+        Function that is called by notification manager when the message is hidden
+        Connections to closed are removed so they are not called when the pooled message is shown again
+        """
+
+        self.closed.emit()
+        try:
+            self.closed.disconnect()
+        except (RuntimeError, TypeError):
+            # No slots connected
+            pass
+
     # =================================================================================================================
     # INTERNAL
     # =================================================================================================================
@@ -406,10 +485,12 @@ class PopupMessage(base.BaseWidget, object):
         self._opacity_anim.start()
 
     def _fade_in(self):
+        self._pos_anim.setDirection(QAbstractAnimation.Forward)
         self._pos_anim.start()
+        self._opacity_anim.setDirection(QAbstractAnimation.Forward)
         self._opacity_anim.start()
 
-    def _set_proper_position(self, parent):
+    def _get_parent_position(self, parent):
         parent_parent = parent.parent()
         dcc_win = dcc.get_main_window()
         if dcc_win:
@@ -418,6 +499,11 @@ class PopupMessage(base.BaseWidget, object):
             dcc_window = None
         parent_geo = parent.geometry()
         pos = parent_geo.topLeft() if dcc_window else parent.mapToGlobal(parent_geo.topLeft())
+
+        return pos, parent_geo
+
+    def _set_proper_position(self, parent):
+        pos, parent_geo = self._get_parent_position(parent)
         # pos = parent_geo.topLeft() if parent.parent() is None else parent.mapToGlobal(parent_geo.topLeft())
         offset = 0
         for child in parent.children():
@@ -435,3 +521,9 @@ class PopupMessage(base.BaseWidget, object):
 
     def _on_fade_out(self):
         self._fade_out()
+
+    def _on_close_button_clicked(self):
+        if self._managed:
+            notifications.notification_manager().dismiss(self)
+        else:
+            self.close()
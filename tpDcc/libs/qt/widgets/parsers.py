@@ -5,8 +5,9 @@
 Module that contains implementation for custom PySide/PyQt windows
 """
 
+from Qt.QtCore import QSize
 from Qt.QtWidgets import QLabel
-from Qt.QtGui import QFont
+from Qt.QtGui import QFont, QImageReader
 
 from tpDcc.libs.python import python
 from tpDcc.libs.qt.widgets import gif
@@ -47,7 +48,7 @@ class WidgetsFromTextParser(HTMLParser, object):
                 rem = len(starttag)
                 self._constructed = self._constructed[:-rem]
                 self.add_label_from_constructed()
-                self.add_gif_widget(attrs[0][1])
+                self.add_gif_widget(attrs[0][1], attrs=attrs)
 
     def handle_endtag(self, tag):
         if tag == self._root_tag:
@@ -58,10 +59,49 @@ class WidgetsFromTextParser(HTMLParser, object):
     def handle_data(self, data):
         self._constructed += data
 
-    def add_gif_widget(self, gif_file):
-        gif_widget = gif.GifLabel(gif_file)
+    def add_gif_widget(self, gif_file, attrs=None):
+        gif_widget = gif.GifLabel(gif_file, size=self.get_gif_size(gif_file, attrs=attrs))
         self._widgets.append(gif_widget)
 
+    def get_gif_size(self, gif_file, attrs=None):
+        """
+        Returns the size GIF widget is displayed at, so its frames are decoded at that size
+        Size can be defined in pixels with width and height tag attributes, otherwise GIF natural size is used
+        :param gif_file: str
+        :param attrs: list(tuple(str, str)) or None, tag attributes
+        :return: QSize or None
+        """
+
+        attrs = dict(attrs or list())
+        width = self._get_pixels(attrs.get('width'))
+        height = self._get_pixels(attrs.get('height'))
+        if width and height:
+            return QSize(width, height)
+
+        size = QImageReader(gif_file).size()
+
+        return size if size.isValid() else None
+
+    def _get_pixels(self, value):
+        """
+        Internal function that returns the number of pixels defined by the given HTML size attribute value
+        :param value: str or None, such as "100" or "100px"
+        :return: int or None, None if the value is not defined in pixels (percentages, etc)
+        """
+
+        if not value:
+            return None
+
+        value = value.strip().lower()
+        if value.endswith('px'):
+            value = value[:-2].strip()
+        try:
+            pixels = int(value)
+        except ValueError:
+            return None
+
+        return pixels if pixels > 0 else None
+
     def add_label_from_constructed(self):
         label = QLabel(self._constructed)
         label.setOpenExternalLinks(True)
@@ -17,7 +17,7 @@ from Qt.QtGui import QCursor, QColor, QFont, QPainter, QMouseEvent
 from tpDcc import dcc
 from tpDcc.libs.python import color as core_color
 from tpDcc.libs.resources.core import theme, color
-from tpDcc.libs.qt.core import utils, qtutils, contexts as qt_contexts
+from tpDcc.libs.qt.core import utils, qtutils, timers, contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, label
 
 FLOAT_SLIDER_DRAG_STEPS = [100.0, 10.0, 1.0, 0.1, 0.01, 0.001]
@@ -36,6 +36,7 @@ class BaseSlider(QSlider, object):
 
 class SliderDraggers(QWidget, object):
     increment = Signal(object)
+    released = Signal()
 
     def __init__(self, parent=None, is_float=True, dragger_steps=None, main_color=None):
         super(SliderDraggers, self).__init__(parent)
@@ -96,6 +97,7 @@ class SliderDraggers(QWidget, object):
         if event.type() == QEvent.MouseButtonRelease:
             self.hide()
             self._last_delta_x = 0
+            self.released.emit()
             del(self)
 
         return False
@@ -127,6 +129,7 @@ class Slider(QSlider, object):
     editingFinihsed = Signal()
     valueIncremented = Signal(object)
     floatValueChanged = Signal(object)
+    valueCommitted = Signal(object)
 
     def __init__(self, parent=None, dragger_steps=None, slider_range=None, *args, **kwargs):
         if dragger_steps is None:
@@ -163,6 +166,7 @@ class Slider(QSlider, object):
             if not self._draggers:
                 self._draggers = SliderDraggers(parent=self, is_float=self._is_float, dragger_steps=self._dragger_steps)
                 self._draggers.increment.connect(self.valueIncremented.emit)
+                self._draggers.released.connect(self._on_drag_finished)
             self._draggers.show()
             if self._is_float:
                 self._draggers.move(
@@ -216,6 +220,11 @@ class Slider(QSlider, object):
         else:
             super(Slider, self).mouseMoveEvent(event)
 
+    def mouseReleaseEvent(self, event):
+        super(Slider, self).mouseReleaseEvent(event)
+        if event.button() != Qt.MidButton:
+            self._on_drag_finished()
+
     def keyPressEvent(self, event):
         p = self.mapFromGlobal(QCursor.pos())
         self._start_drag_pos = p
@@ -233,6 +242,29 @@ class Slider(QSlider, object):
     def slider_range(self):
         return self._slider_range
 
+    def is_dragging(self):
+        """
+        Returns whether the user is dragging the slider handle or its draggers
+        :return: bool
+        """
+
+        return self.isSliderDown() or bool(self._draggers and self._draggers.isVisible())
+
+    def committed_value(self):
+        """
+        Returns the value that is emitted through valueCommitted signal
+        :return: int or float
+        """
+
+        return self.value()
+
+    def _on_drag_finished(self):
+        """
+        Internal callback function that is called when the user stops dragging the slider
+        """
+
+        self.valueCommitted.emit(self.committed_value())
+
 
 class DoubleSlider(Slider, object):
     doubleValueChanged = Signal(float)
@@ -258,6 +290,9 @@ class DoubleSlider(Slider, object):
     def mapped_value(self):
         return self._map_value(self.value())
 
+    def committed_value(self):
+        return self.mapped_value()
+
     def set_mapped_value(self, value, block_signals=False):
         internal_value = self._unmap_value(value)
         if block_signals:
@@ -395,6 +430,7 @@ class DraggerSlider(QDoubleSpinBox, object):
     """
 
     valueIncremented = Signal(object)
+    valueCommitted = Signal(object)
 
     def __init__(self, label_text='', slider_type='float', buttons=False, decimals=3, dragger_steps=None,
                  apply_style=True, main_color=None, *args, **kwargs):
@@ -420,9 +456,11 @@ class DraggerSlider(QDoubleSpinBox, object):
             self.setStyleSheet(self._get_style_sheet())
         else:
             self._label_font = self.lineEdit().font()
+        self._committed_value = self.value()
 
         self.lineEdit().installEventFilter(self)
         self.installEventFilter(self)
+        self.editingFinished.connect(self._on_drag_finished)
 
     def wheelEvent(self, event):
         if not self.hasFocus():
@@ -449,6 +487,7 @@ class DraggerSlider(QDoubleSpinBox, object):
                 if not self._draggers:
                     self._draggers = SliderDraggers(self, self._is_float, dragger_steps=self._dragger_steps)
                     self._draggers.increment.connect(self._on_value_incremented)
+                    self._draggers.released.connect(self._on_drag_finished)
                 self._draggers.show()
                 if self._is_float:
                     self._draggers.move(
@@ -459,6 +498,14 @@ class DraggerSlider(QDoubleSpinBox, object):
 
         return False
 
+    def is_dragging(self):
+        """
+        Returns whether the user is dragging the value using the draggers
+        :return: bool
+        """
+
+        return bool(self._draggers and self._draggers.isVisible())
+
     def _get_style_sheet(self):
         return """
         QWidget{
@@ -484,14 +531,29 @@ class DraggerSlider(QDoubleSpinBox, object):
         self.valueIncremented.emit(step)
         self.setValue(self.value() + step)
 
+    def _on_drag_finished(self):
+        """
+        Internal callback function that is called when the user stops dragging or editing the value
+        valueCommitted is only emitted if the value changed since the last commit
+        """
+
+        value = self.value()
+        if value == self._committed_value:
+            return
+        self._committed_value = value
+        self.valueCommitted.emit(value)
+
 
 @theme.mixin
 class HoudiniDoubleSlider(QWidget, object):
     """
     Slider that encapsulates a DoubleSlider and Houdini draggers linked together
+    While the user drags the value, valueChanged signal is rate limited following the value throttle emit policy
+    and valueCommitted signal is emitted once the drag ends
     """
 
     valueChanged = Signal(object)
+    valueCommitted = Signal(object)
 
     def __init__(self, parent, slider_type='float', style=0, name=None, slider_range=None, default_value=0.0,
                  dragger_steps=None, main_color=None, *args):
@@ -508,6 +570,10 @@ class HoudiniDoubleSlider(QWidget, object):
         self._label = None
         self._style_type = style
 
+        self._value_throttle = timers.ValueThrottle(parent=self)
+        self._value_throttle.valueChanged.connect(self.valueChanged.emit)
+        self._value_throttle.valueCommitted.connect(self.valueCommitted.emit)
+
         theme = self.theme()
         if theme:
             theme_color = theme.accent_color
@@ -531,7 +597,6 @@ class HoudiniDoubleSlider(QWidget, object):
         self._input.setMaximumWidth(60 if self._type == 'float' else 40)
         self._input.setMinimumHeight(h)
         self._input.setMaximumHeight(h)
-        self._input.valueIncremented.connect(self._on_increment_value)
 
         if self._type == 'float':
             self._slider = DoubleSlider(parent=self, default_value=default_value, slider_range=slider_range,
@@ -556,7 +621,9 @@ class HoudiniDoubleSlider(QWidget, object):
         self._slider.setStyleSheet(style_sheet)
 
         self._slider.valueChanged.connect(self._on_slider_value_changed)
+        self._slider.valueCommitted.connect(self._on_value_committed)
         self._input.valueChanged.connect(self._on_houdini_slider_value_changed)
+        self._input.valueCommitted.connect(self._on_value_committed)
 
     def update(self):
         style_sheet = self._get_style_sheet(self._style_type)
@@ -568,6 +635,10 @@ class HoudiniDoubleSlider(QWidget, object):
     def minimum(self):
         return self._input.minimum()
 
+    @property
+    def value_throttle(self):
+        return self._value_throttle
+
     @property
     def maximum(self):
         return self._input.maximum()
@@ -622,20 +693,37 @@ class HoudiniDoubleSlider(QWidget, object):
     def set_range(self, minimum_value, maximum_value):
         self._input.setRange(minimum_value, maximum_value)
 
+    def is_dragging(self):
+        """
+        Returns whether the user is dragging the slider or any of its draggers
+        :return: bool
+        """
+
+        return self._slider.is_dragging() or self._input.is_dragging()
+
+    def _emit_value_changed(self, value):
+        """
+        Internal function that emits valueChanged signal. While dragging, the value is rate limited
+        :param value: float
+        """
+
+        if self.is_dragging():
+            self._value_throttle.push(value)
+        else:
+            self.valueChanged.emit(value)
+
     def _on_increment_value(self, step):
         if step == 0.0:
             return
-        old = self._input.value()
-        new = old + step
-        self._input.setValue(new)
-        self.valueChanged.emit(new)
+        # Setting input value already syncs the slider and emits valueChanged signal
+        self._input.setValue(self._input.value() + step)
 
     def _on_slider_value_changed(self, value):
         out_value = utils.map_range_unclamped(
             value, self._slider.minimum(), self._slider.maximum(), self._input.minimum(), self._input.maximum())
         with qt_contexts.block_signals(self._input):
             self._input.setValue(out_value)
-        self.valueChanged.emit(out_value)
+        self._emit_value_changed(out_value)
 
     def _on_houdini_slider_value_changed(self, value):
         in_value = utils.map_range_unclamped(
@@ -643,7 +731,10 @@ class HoudiniDoubleSlider(QWidget, object):
             self._slider.minimum(), self._slider.maximum())
         with qt_contexts.block_signals(self._slider):
             self._slider.setValue(int(in_value))
-        self.valueChanged.emit(value)
+        self._emit_value_changed(value)
+
+    def _on_value_committed(self, value=None):
+        self._value_throttle.commit(self.value())
 
     def _get_style_sheet(self, style_type):
         if style_type == 0:
@@ -12,7 +12,7 @@ from Qt.QtWidgets import QSizePolicy, QFrame, QSpinBox, QDoubleSpinBox
 from Qt.QtGui import QColor, QPainter, QDoubleValidator
 
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import base, contexts as qt_contexts
+from tpDcc.libs.qt.core import base, timers, contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, lineedit, buttons, label
 
 
@@ -308,6 +308,9 @@ class BaseDoubleNumberSpinBox(BaseSpinBoxNumber, object):
 
 
 class DragDoubleSpinBox(BaseNumberWidget, object):
+
+    valueCommitted = Signal(object)
+
     def __init__(self, name='', parent=None):
         super(DragDoubleSpinBox, self).__init__(name=name, parent=parent)
 
@@ -316,14 +319,25 @@ class DragDoubleSpinBox(BaseNumberWidget, object):
         spin_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         return spin_box
 
+    def setup_signals(self):
+        self._number_widget.valueChanged.connect(self._on_value_changed)
+        self._number_widget.valueCommitted.connect(self.valueCommitted.emit)
+
+    @property
+    def value_throttle(self):
+        return self._number_widget.value_throttle
+
 
 class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
     """
     Using middle mouse from left to right will scale the value and a little bar will show the
     percent of the current value
+    While dragging, valueChanged signal is rate limited following the value throttle emit policy and valueCommitted
+    signal is emitted once the drag ends
     """
 
     valueChanged = Signal(float)
+    valueCommitted = Signal(float)
 
     def __init__(self, start=0.0, max=10, min=-10, positive=False, decimals=4, parent=None):
         super(DragDoubleSpinBoxLine, self).__init__(parent=parent)
@@ -335,6 +349,11 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
         self._max = max
         self._decimals = decimals or 3
         self._sup = positive
+
+        self._value_throttle = timers.ValueThrottle(parent=self)
+        self._value_throttle.valueChanged.connect(self.valueChanged.emit)
+        self._value_throttle.valueCommitted.connect(self.valueCommitted.emit)
+
         self.setText(str(start))
 
         self._setup_validator()
@@ -343,6 +362,7 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
         self._color = theme.accent_color_5 or QColor(0, 255, 0)
 
         self.textChanged.connect(self._on_text_changed)
+        self.editingFinished.connect(self._on_editing_finished)
 
     def _on_text_changed(self, text):
 
@@ -364,6 +384,10 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
     def default(self):
         return self._default
 
+    @property
+    def value_throttle(self):
+        return self._value_throttle
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton:
             self._click = True
@@ -372,6 +396,7 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MiddleButton:
             self._click = False
+            self._value_throttle.commit(self.value())
 
     def mouseDoubleClickEvent(self, event):
         self.setText(self._default)
@@ -381,9 +406,8 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
             delta = event.x() - self._mouse_position.x()
             v = float(self.text()) + delta / 100.0
             v = max(self._min, min(self._max, v))
-            self.setText(str(round(v, self._decimals)))
             self._mouse_position = event.pos()
-            self.valueChanged.emit(v)
+            self.setText(str(round(v, self._decimals)))
 
     def paintEvent(self, event):
         super(DragDoubleSpinBoxLine, self).paintEvent(event)
@@ -433,7 +457,10 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
 
     def setText(self, text):
         super(DragDoubleSpinBoxLine, self).setText(text)
-        self.valueChanged.emit(self.value())
+        if self._click:
+            self._value_throttle.push(self.value())
+        else:
+            self.valueChanged.emit(self.value())
 
     def setDecimals(self, value):
         self._decimals = int(value)
@@ -445,6 +472,9 @@ class DragDoubleSpinBoxLine(lineedit.BaseLineEdit, object):
     def _setup_validator(self):
         self.setValidator(self.get_validator())
 
+    def _on_editing_finished(self):
+        self.valueCommitted.emit(self.value())
+
 
 class DoubleSpinBoxAxis(base.BaseWidget, object):
 
@@ -7,14 +7,174 @@ Module that contains custom Qt stack widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Signal, QPoint, QEasingCurve, QPropertyAnimation, QParallelAnimationGroup
-from Qt.QtWidgets import QFrame, QStackedWidget
+from Qt.QtCore import Qt, Signal, Property, QPoint, QEasingCurve, QPropertyAnimation, QElapsedTimer
+from Qt.QtWidgets import QWidget, QFrame, QStackedWidget
+from Qt.QtGui import QPainter
 
 from tpDcc.managers import resources
-from tpDcc.libs.qt.core import consts, qtutils, base, dpi, mixin
+from tpDcc.libs.qt.core import consts, qtutils, base, dpi
 from tpDcc.libs.qt.widgets import layouts, buttons, lineedit
 
 
+class PixmapTransition(QWidget, object):
+    """
+    Lightweight overlay widget that animates two pixmap snapshots of stack pages
+    Pages are grabbed only once, so the cost of each animation frame does not depend on the complexity of the pages
+    """
+
+    finished = Signal()
+
+    def __init__(self, parent):
+        super(PixmapTransition, self).__init__(parent)
+
+        self._from_pixmap = None
+        self._to_pixmap = None
+        self._offset = QPoint(0, 0)
+        self._fade = False
+        self._progress = 0.0
+        self._frame_times = list()
+        self._frame_timer = QElapsedTimer()
+
+        self._animation = QPropertyAnimation(self, b'progress', self)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.finished.connect(self._on_animation_finished)
+
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    def _get_progress(self):
+        return self._progress
+
+    def _set_progress(self, value):
+        if self._frame_timer.isValid():
+            self._frame_times.append(self._frame_timer.restart())
+        self._progress = value
+        self.update()
+
+    progress = Property(float, _get_progress, _set_progress)
+
+    # =================================================================================================================
+    # OVERRIDES
+    # =================================================================================================================
+
+    def paintEvent(self, event):
+        """
+        Overrides base QWidget paintEvent function
+        :param event: QPaintEvent
+        """
+
+        painter = QPainter(self)
+        progress = self._progress
+        if self._from_pixmap is not None:
+            painter.drawPixmap(
+                QPoint(int(-self._offset.x() * progress), int(-self._offset.y() * progress)), self._from_pixmap)
+        if self._to_pixmap is not None:
+            if self._fade:
+                painter.setOpacity(progress)
+            painter.drawPixmap(
+                QPoint(int(self._offset.x() * (1.0 - progress)), int(self._offset.y() * (1.0 - progress))),
+                self._to_pixmap)
+        painter.end()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def is_running(self):
+        """
+        Returns whether a transition is being played
+        :return: bool
+        """
+
+        return self._animation.state() == QPropertyAnimation.Running
+
+    def start(self, from_pixmap, to_pixmap, offset, duration, easing_curve=QEasingCurve.OutCubic, fade=False):
+        """
+        Starts a transition between the given pixmaps
+        :param from_pixmap: QPixmap or None, snapshot of the page that is hidden
+        :param to_pixmap: QPixmap or None, snapshot of the page that is shown
+        :param offset: QPoint, offset the shown page slides from
+        :param duration: int, duration of the transition in milliseconds
+        :param easing_curve: QEasingCurve
+        :param fade: bool, whether shown page fades in
+        """
+
+        self._animation.stop()
+        self._from_pixmap = from_pixmap
+        self._to_pixmap = to_pixmap
+        self._offset = offset
+        self._fade = fade
+        self._progress = 0.0
+        self._frame_times = list()
+
+        self.setGeometry(self.parentWidget().rect())
+        self.raise_()
+        self.show()
+
+        self._frame_timer.start()
+        self._animation.setDuration(duration)
+        self._animation.setEasingCurve(easing_curve)
+        self._animation.start()
+
+    def stop(self):
+        """
+        Stops current transition without emitting finished signal
+        """
+
+        self._animation.stop()
+        self._clear()
+
+    def frame_stats(self):
+        """
+        Returns frame time statistics of the last transition
+        :return: dict
+        """
+
+        frame_count = len(self._frame_times)
+        if not frame_count:
+            return {'frames': 0, 'average_frame_ms': 0.0, 'max_frame_ms': 0.0, 'fps': 0.0}
+
+        average = sum(self._frame_times) / float(frame_count)
+
+        return {
+            'frames': frame_count,
+            'average_frame_ms': average,
+            'max_frame_ms': float(max(self._frame_times)),
+            'fps': 1000.0 / average if average else 0.0
+        }
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _clear(self):
+        """
+        Internal function that hides the overlay and releases the snapshots
+        """
+
+        self.hide()
+        self._from_pixmap = None
+        self._to_pixmap = None
+        self._frame_timer.invalidate()
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_animation_finished(self):
+        """
+        Internal callback function that is called when transition animation finishes
+        """
+
+        self._clear()
+        self.finished.emit()
+
+
 class SlidingStackedWidget(QStackedWidget, object):
     """
     QStackedWidget width sliding functionality
@@ -36,6 +196,9 @@ class SlidingStackedWidget(QStackedWidget, object):
         self._now = 0
         self._next = 1
 
+        self._transition = PixmapTransition(self)
+        self._transition.finished.connect(self._animation_done_slot)
+
     @property
     def current_widget(self):
         return self._current_widget
@@ -72,6 +235,14 @@ class SlidingStackedWidget(QStackedWidget, object):
 
         self._wrap = wrap
 
+    def transition_stats(self):
+        """
+        Returns frame time statistics of the last sliding animation
+        :return: dict
+        """
+
+        return self._transition.frame_stats()
+
     def slide_in_next(self):
         """
         Slides into the next widget
@@ -93,6 +264,7 @@ class SlidingStackedWidget(QStackedWidget, object):
     def slide_in_index(self, next, force=False):
         """
         Slides to the given widget index
+        Both pages are grabbed into pixmaps and only the snapshots are animated. Real widget is shown at the end
         :param next: int, index of the widget to slide
         """
 
@@ -113,57 +285,95 @@ class SlidingStackedWidget(QStackedWidget, object):
                 offset_x, offset_y = 0, -height
             else:
                 offset_x, offset_y = -width, 0
-        self.widget(next).setGeometry(0, 0, width, height)
-        pnow, pnext = self.widget(now).pos(), self.widget(next).pos()
-        self._point_now = pnow
-
-        self.widget(next).move(pnext.x() + offset_x, pnext.y() + offset_y)
-        self.widget(next).show()
-        self.widget(next).raise_()
-        self._current_widget = self.widget(next)
-
-        anim_now = QPropertyAnimation(self.widget(now), b'pos')
-        anim_now.setDuration(self._speed)
-        anim_now.setStartValue(pnow)
-        anim_now.setEndValue(QPoint(pnow.x() - offset_x, pnow.y() - offset_y))
-        anim_now.setEasingCurve(self._animation_type)
-
-        anim_next = QPropertyAnimation(self.widget(next), b'pos')
-        anim_next.setDuration(self._speed)
-        anim_next.setStartValue(QPoint(offset_x + pnext.x(), offset_y + pnext.y()))
-        anim_next.setEndValue(pnext)
-        anim_next.setEasingCurve(self._animation_type)
-
-        self._anim_group = QParallelAnimationGroup()
-        self._anim_group.addAnimation(anim_now)
-        self._anim_group.addAnimation(anim_next)
-        self._anim_group.finished.connect(self._animation_done_slot)
-        self._anim_group.start()
 
+        now_widget = self.widget(now)
+        next_widget = self.widget(next)
+        next_widget.setGeometry(0, 0, width, height)
+        self._current_widget = next_widget
         self._next = next
         self._now = now
 
+        if not self.isVisible():
+            self._animation_done_slot()
+            return
+
+        from_pixmap = now_widget.grab()
+        to_pixmap = next_widget.grab()
+        now_widget.hide()
+        self._transition.start(
+            from_pixmap, to_pixmap, QPoint(offset_x, offset_y), self._speed, easing_curve=self._animation_type)
+
     def _animation_done_slot(self):
         self.setCurrentIndex(self._next)
-        self.widget(self._now).hide()
-        self.widget(self._now).move(self._point_now)
-        try:
-            self.widget(self._now).update()
-        except Exception:
-            pass
+        if self._now != self._next:
+            self.widget(self._now).hide()
+        self.widget(self._next).show()
         self._active_state = False
         self.animFinished.emit(self._next)
 
 
-@mixin.stacked_opacity_animation_mixin
 class SlidingOpacityStackedWidget(QStackedWidget, object):
     """
     Custom stack widget that activates opacity animation when current stack index changes
+    New page is grabbed into a pixmap that slides and fades in. Real page is shown when the animation finishes
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, speed=400):
         super(SlidingOpacityStackedWidget, self).__init__(parent)
 
+        self._prev_index = 0
+        self._speed = speed
+
+        self._transition = PixmapTransition(self)
+        self._transition.finished.connect(self._on_transition_finished)
+        self.currentChanged.connect(self._on_play_anim)
+
+    def set_speed(self, speed):
+        """
+        Sets the animation speed
+        :param speed: int
+        """
+
+        self._speed = speed
+
+    def transition_stats(self):
+        """
+        Returns frame time statistics of the last page transition
+        :return: dict
+        """
+
+        return self._transition.frame_stats()
+
+    def _on_play_anim(self, index):
+        """
+        Internal callback function that is called each time current stack index changes
+        :param index: int
+        """
+
+        current_widget = self.widget(index)
+        prev_index = self._prev_index
+        self._prev_index = index
+        if current_widget is None or not self.isVisible():
+            return
+
+        if prev_index < index:
+            offset = QPoint(self.width(), 0)
+        else:
+            offset = QPoint(-self.width(), 0)
+        to_pixmap = current_widget.grab()
+        current_widget.hide()
+        self._transition.start(
+            None, to_pixmap, offset, self._speed, easing_curve=QEasingCurve.OutCubic, fade=True)
+
+    def _on_transition_finished(self):
+        """
+        Internal callback function that is called when page transition finishes
+        """
+
+        current_widget = self.currentWidget()
+        if current_widget is not None:
+            current_widget.show()
+
 
 class StackItem(QFrame, object):
 
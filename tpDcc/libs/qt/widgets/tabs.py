@@ -214,10 +214,23 @@ class TearOffTabWidget(BaseTabWidget, object):
         self.tabBar().tabMoved.connect(self._on_move_tab)
         self.currentChanged.connect(self._on_tab_changed_tab)
 
-    def addTab(self, *args, **kwargs):
-        added_tab_index = super(TearOffTabWidget, self).addTab(*args, **kwargs)
+    def addTab(self, widget, *args, **kwargs):
+        """
+        Overrides base QTabWidget addTab function
+        If a callable factory is given instead of a widget, tab page is built the first time the tab is shown
+        :param widget: QWidget or callable
+        :param unload_timeout: int or None, time (in milliseconds) a factory built page can stay hidden before it is
+            destroyed. It will be built again the next time the tab is shown
+        :return: int
+        """
+
+        unload_timeout = kwargs.pop('unload_timeout', None)
+        widget = base.lazy_widget(widget, unload_timeout=unload_timeout)
+        added_tab_index = super(TearOffTabWidget, self).addTab(widget, *args, **kwargs)
         self.tab_inserted(added_tab_index)
 
+        return added_tab_index
+
     def removeTab(self, index):
         super(TearOffTabWidget, self).removeTab(index)
         self.tab_idx.pop(index)
@@ -250,7 +263,16 @@ class TearOffTabWidget(BaseTabWidget, object):
                     index = self._tab_widget_index(i.widget)
                     self.removeTab(index)
 
-    def add_panel(self, widget, label):
+    def add_panel(self, widget, label, unload_timeout=None):
+        """
+        Adds a new panel into the tab widget
+        :param widget: QWidget or callable, panel widget or factory function that builds it when the tab is shown
+        :param label: str
+        :param unload_timeout: int or None, time (in milliseconds) a factory built panel can stay hidden before it is
+            destroyed
+        """
+
+        widget = base.lazy_widget(widget, unload_timeout=unload_timeout)
 
         # TODO: We should not storing the detach config here
         # sg_group = window.DetachedWindow.SettingGroup(label)
@@ -365,6 +387,16 @@ class TearOffTabWidget(BaseTabWidget, object):
 
         return panel
 
+    def _unload_lazy_widget(self, widget):
+        """
+        Internal function that destroys the contents of factory built pages before moving them to another window
+        Its factory builds them again once they are shown in the new window, so live widgets are never re-parented
+        :param widget: QWidget
+        """
+
+        if isinstance(widget, base.LazyWidget):
+            widget.unload()
+
     def _on_attach_tab(self, detach_window):
         detach_window.windowClosed.disconnect(self._on_attach_tab)
         detach_window.save_settings(False)
@@ -374,6 +406,7 @@ class TearOffTabWidget(BaseTabWidget, object):
             panel.widgetVisible.disconnect(detach_window.set_widget_visible)
         except Exception:
             pass
+        self._unload_lazy_widget(tear_off_widget)
         tear_off_widget.setParent(self)
         panel.widgetVisible.connect(self.set_widget_visible)
 
@@ -414,6 +447,7 @@ class TearOffTabWidget(BaseTabWidget, object):
         # panel = detach_window.centralWidget()
         # panel.widgetVisible.disconnect(self.set_widget_visible)
         # panel.widgetVisible.connect(detach_window.set_widget_visible)
+        self._unload_lazy_widget(tear_off_widget)
         tear_off_widget.setParent(detach_window)
 
         if self.count() < 0:
@@ -14,10 +14,23 @@ from Qt.QtGui import QFontMetricsF
 from tpDcc import dcc
 from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import base, animation
+from tpDcc.libs.qt.core import base, animation, notifications
 from tpDcc.libs.qt.widgets import layouts, label, avatar, loading
 
 
+class ToastNotification(notifications.NotificationHandle, object):
+    """
+    Handle returned by BaseToast helper functions
+    Emits toastClosed together with closed, so it can be used as a BaseToast when connecting to its close signal
+    """
+
+    toastClosed = Signal()
+
+    def notification_closed(self):
+        super(ToastNotification, self).notification_closed()
+        self.toastClosed.emit()
+
+
 @theme.mixin
 class BaseToast(base.BaseWidget, object):
 
@@ -30,13 +43,23 @@ class BaseToast(base.BaseWidget, object):
 
     DEFAULT_CONFIG = {'duration': 2}
 
+    # Toasts are shown in the center of their parent, so only one is visible at once in the same parent
+    NOTIFICATION_MAX_VISIBLE = 1
+
+    # Duration (in milliseconds) of show and hide animations
+    FADE_DURATION = 300
+
+    # Handle returned by info, success, warning, error and loading functions
+    NOTIFICATION_HANDLE_CLASS = ToastNotification
+
     toastClosed = Signal()
 
-    def __init__(self, text, duration=None, toast_type=None, parent=None):
+    def __init__(self, text, duration=None, toast_type=None, parent=None, managed=False):
         self._text = text
         self._duration = duration
         self._toast_type = toast_type
         self._parent = parent
+        self._managed = managed
         super(BaseToast, self).__init__(parent=parent)
 
     def get_main_layout(self):
@@ -66,16 +89,28 @@ class BaseToast(base.BaseWidget, object):
             icon_layout.addWidget(icon_label)
         icon_layout.addStretch()
 
-        content_label = label.BaseLabel()
-        content_label.setText(self._text or '')
-        content_label.setAlignment(Qt.AlignCenter)
+        self._content_label = label.BaseLabel()
+        self._content_label.setText(self._text or '')
+        self._content_label.setAlignment(Qt.AlignCenter)
 
         self.main_layout.addStretch()
         self.main_layout.addLayout(icon_layout)
         self.main_layout.addSpacing(10)
-        self.main_layout.addWidget(content_label)
+        self.main_layout.addWidget(self._content_label)
         self.main_layout.addStretch()
 
+        self._opacity_anim = QPropertyAnimation()
+        self._opacity_anim.setTargetObject(self)
+        self._opacity_anim.setDuration(self.FADE_DURATION)
+        self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._opacity_anim.setPropertyName('windowOpacity')
+        self._opacity_anim.setStartValue(0.0)
+        self._opacity_anim.setEndValue(0.9)
+
+        # Managed toasts are expired, positioned and animated by the notification manager
+        if self._managed:
+            return
+
         close_timer = QTimer(self)
         close_timer.setSingleShot(True)
         close_timer.timeout.connect(self.close)
@@ -84,15 +119,8 @@ class BaseToast(base.BaseWidget, object):
 
         anim_timer = QTimer(self)
         anim_timer.timeout.connect(self._fade_out)
-        anim_timer.setInterval((self._duration or self.DEFAULT_CONFIG.get('duration', 2)) * 1000 - 300)
-
-        self._opacity_anim = QPropertyAnimation()
-        self._opacity_anim.setTargetObject(self)
-        self._opacity_anim.setDuration(300)
-        self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
-        self._opacity_anim.setPropertyName('windowOpacity')
-        self._opacity_anim.setStartValue(0.0)
-        self._opacity_anim.setEndValue(0.9)
+        anim_timer.setInterval(
+            (self._duration or self.DEFAULT_CONFIG.get('duration', 2)) * 1000 - self.FADE_DURATION)
 
         close_timer.start()
         anim_timer.start()
@@ -102,49 +130,151 @@ class BaseToast(base.BaseWidget, object):
 
     @classmethod
     def info(cls, text, parent, duration=None):
-        inst = cls(text, duration=duration, toast_type=cls.ToastTypes.INFO, parent=parent)
-        inst.show()
+        """
+        Shows a info toast
+        :param text: str
+        :param parent: QWidget
+        :param duration: int
+        :return: ToastNotification, handle of the posted toast (toasts can be queued or merged)
+        """
 
-        return inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=cls.ToastTypes.INFO, duration=duration)
 
     @classmethod
     def success(cls, text, parent, duration=None):
-        inst = cls(text, duration=duration, toast_type=cls.ToastTypes.SUCCESS, parent=parent)
-        inst.show()
+        """
+        Shows a success toast
+        :param text: str
+        :param parent: QWidget
+        :param duration: int
+        :return: ToastNotification, handle of the posted toast (toasts can be queued or merged)
+        """
 
-        return inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=cls.ToastTypes.SUCCESS, duration=duration)
 
     @classmethod
     def warning(cls, text, parent, duration=None):
-        inst = cls(text, duration=duration, toast_type=cls.ToastTypes.WARNING, parent=parent)
-        inst.show()
+        """
+        Shows a warning toast
+        :param text: str
+        :param parent: QWidget
+        :param duration: int
+        :return: ToastNotification, handle of the posted toast (toasts can be queued or merged)
+        """
 
-        return inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=cls.ToastTypes.WARNING, duration=duration)
 
     @classmethod
     def error(cls, text, parent, duration=None):
-        inst = cls(text, duration=duration, toast_type=cls.ToastTypes.ERROR, parent=parent)
-        inst.show()
+        """
+        Shows a error toast
+        :param text: str
+        :param parent: QWidget
+        :param duration: int
+        :return: ToastNotification, handle of the posted toast (toasts can be queued or merged)
+        """
 
-        return inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=cls.ToastTypes.ERROR, duration=duration)
 
     @classmethod
     def loading(cls, text, parent, duration=None):
-        inst = cls(text, duration=duration, toast_type=cls.ToastTypes.LOADING, parent=parent)
-        inst.show()
+        """
+        Shows a loading toast
+        :param text: str
+        :param parent: QWidget
+        :param duration: int
+        :return: ToastNotification, handle of the posted toast (toasts can be queued or merged)
+        """
 
-        return inst
+        return notifications.notification_manager().post(
+            cls, text, parent, theme_type=cls.ToastTypes.LOADING, duration=duration)
 
     @classmethod
     def config(cls, duration):
         if duration is not None:
             cls.DEFAULT_CONFIG['duration'] = duration
 
+    @classmethod
+    def create_notification(cls, text, theme_type, closable, parent):
+        """
+        Creates a new toast managed by the notification manager
+        :param text: str
+        :param theme_type: str
+        :param closable: bool, toasts cannot be closed by the user
+        :param parent: QWidget
+        :return: BaseToast
+        """
+
+        return cls(text, toast_type=theme_type, parent=parent, managed=True)
+
+    def reset_notification(self, text, closable, parent):
+        """
+        Reconfigures a pooled toast so it can be shown again
+        :param text: str
+        :param closable: bool
+        :param parent: QWidget
+        """
+
+        self.setParent(parent, self.windowFlags())
+        self._text = text
+        self._parent = parent
+        self._content_label.setText(self._text or '')
+
+    def set_repeat_count(self, count):
+        """
+        Sets the number of times the toast was posted
+        :param count: int
+        """
+
+        text = self._text or ''
+        self._content_label.setText(text if count <= 1 else '{} (x{})'.format(text, count))
+
+    def place(self, parent, index):
+        """
+        Moves the toast to the center of the given parent
+        :param parent: QWidget
+        :param index: int
+        """
+
+        self._get_center_position(parent)
+
+    def fade_in(self):
+        """
+        Starts toast show animation
+        """
+
+        self._fade_in()
+
+    def fade_out(self):
+        """
+        Starts toast hide animation
+        """
+
+        self._fade_out()
+
+    def notification_released(self):
+        """
+        Function that is called by notification manager when the toast is hidden
+        Connections to toastClosed are removed so they are not called when the pooled toast is shown again
+        """
+
+        self.toastClosed.emit()
+        try:
+            self.toastClosed.disconnect()
+        except (RuntimeError, TypeError):
+            # No slots connected
+            pass
+
     def _fade_out(self):
         self._opacity_anim.setDirection(QAbstractAnimation.Backward)
         self._opacity_anim.start()
 
     def _fade_in(self):
+        self._opacity_anim.setDirection(QAbstractAnimation.Forward)
         self._opacity_anim.start()
 
     def _get_center_position(self, parent):
@@ -7,6 +7,8 @@ Module that contains classes that extend QToolBar functionality
 
 from __future__ import print_function, division, absolute_import
 
+import bisect
+
 from Qt.QtCore import Qt, Property, QSize
 from Qt.QtWidgets import QWidget, QToolBar, QAction, QFrame
 
@@ -261,6 +263,7 @@ class FlowToolBar(QFrame, object):
         self._overflow_icon = resources.icon('sort_down')
         self._overflow_menu = False
         self._overflow_menu_button = None
+        self._overflow_widths_cache = None
 
         self.ui()
 
@@ -397,35 +400,28 @@ class FlowToolBar(QFrame, object):
         overflow_button_width = self._overflow_menu_button.sizeHint().width()
         width = size.width() - overflow_button_width - spacing_x
         height = size.height()
-        hidden = list()
+
+        widgets = tuple(item.widget() for item in self.items_list())
+        cut_index = self._get_overflow_cut_index(widgets, width, height, spacing_y)
+        hidden = list(widgets[cut_index:])
 
         self.setUpdatesEnabled(False)
 
-        next_x = 0
-        next_y = self.items_list()[0].widget().height()
-
-        for item in self.items_list():
-            item_widget = item.widget()
-            widget_width = item_widget.sizeHint().width() + spacing_x
-            next_x += widget_width
-            if next_x > width:
-                next_y += item_widget.height() + (spacing_y * 2)
-                next_x = 0
-            if next_y > height:
-                item_widget.hide()
-                hidden.append(item_widget)
-            else:
-                item_widget.show()
+        for i, item_widget in enumerate(widgets):
+            should_hide = i >= cut_index
+            if item_widget.isHidden() != should_hide:
+                item_widget.setVisible(not should_hide)
 
         menu = self._overflow_menu_button.menu(mouse_menu=Qt.LeftButton)
+        hidden_names = set(hidden_widget.property('name') for hidden_widget in hidden)
+        overflow_actions = dict()
         for a in menu.actions():
-            a.setVisible(False)
-
-        for hidden_widget in hidden:
-            for a in menu.actions():
-                if a.text() == hidden_widget.property('name'):
-                    a.setVisible(True)
-                    break
+            if a.text() in hidden_names and a.text() not in overflow_actions:
+                overflow_actions[a.text()] = a
+        for a in menu.actions():
+            visible = overflow_actions.get(a.text()) is a
+            if a.isVisible() != visible:
+                a.setVisible(visible)
 
         self._overflow_menu_button.setVisible(len(hidden) > 0)
         self.setUpdatesEnabled(True)
@@ -446,6 +442,59 @@ class FlowToolBar(QFrame, object):
         self._overflow_menu = flag
         self._overflow_menu_button.setVisible(flag)
 
+    def _get_overflow_widths(self, widgets):
+        """
+        Internal function that returns the cumulative widths of the given widgets
+        Widths are cached until flow layout cached data changes
+        :param widgets: tuple(QWidget)
+        :return: list(int), list where the item with index i is the width of the first i widgets
+        """
+
+        generation = self._flow_layout.cache_generation
+        cache = self._overflow_widths_cache
+        if cache and cache[0] == generation and cache[1] == widgets:
+            return cache[2]
+
+        spacing_x = self._flow_layout.spacing_x
+        cumulative_widths = [0]
+        for widget in widgets:
+            cumulative_widths.append(cumulative_widths[-1] + widget.sizeHint().width() + spacing_x)
+        self._overflow_widths_cache = (generation, widgets, cumulative_widths)
+
+        return cumulative_widths
+
+    def _get_overflow_cut_index(self, widgets, width, height, spacing_y):
+        """
+        Internal function that returns the index of the first widget that does not fit in the toolbar
+        Widgets are placed in rows and the widget that does not fit in a row is found using a binary search over
+        the cumulative widths of the widgets
+        :param widgets: tuple(QWidget)
+        :param width: int
+        :param height: int
+        :param spacing_y: int
+        :return: int
+        """
+
+        count = len(widgets)
+        cumulative_widths = self._get_overflow_widths(widgets)
+
+        next_y = widgets[0].height()
+        if next_y > height:
+            return 0
+
+        start = 0
+        while start < count:
+            end = bisect.bisect_right(cumulative_widths, cumulative_widths[start] + width, start + 1)
+            if end > count:
+                break
+            wrap_index = end - 1
+            next_y += widgets[wrap_index].height() + (spacing_y * 2)
+            if next_y > height:
+                return wrap_index
+            start = wrap_index + 1
+
+        return count
+
     def _setup_overflow_menu_button(self, btn=None):
         """
         Internal function that setup overflow menu and connects it to given button.
@@ -22,7 +22,7 @@ from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
 from tpDcc.managers import resources, configs
 from tpDcc.libs.python import python, osplatform, process, color, win32
-from tpDcc.libs.qt.core import qtutils, base, preferences
+from tpDcc.libs.qt.core import qtutils, base, preferences, iconcache
 from tpDcc.libs.qt.widgets import layouts, label, stack, buttons, switch, gif, dividers, theme
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
@@ -591,35 +591,8 @@ class ToolsetWidget(stack.StackItem, object):
         stylesheet = theme.stylesheet()
         self.setStyleSheet(stylesheet)
 
-        # cached_icons_keys = icon.IconCache._resources_keys_cache.copy()
-        # keys_names_mapping = icon.IconCache._resources_names_keys_mapping
-        #
-        # print('gogogog')
-        #
-        # # Update icons taking into account the new theme
-        # new_icons_to_apply = dict()
-        # for icon_key, icon_object in cached_icons_keys.items():
-        #     icon_full_name = keys_names_mapping.get(icon_key, None)
-        #     if not icon_full_name:
-        #         continue
-        #     icon_name, icon_ext = os.path.splitext(icon_full_name)
-        #     new_icon = resources.icon(icon_name, extension=icon_ext, theme=theme.name())
-        #     if not new_icon or new_icon.isNull():
-        #         continue
-        #     new_icons_to_apply[icon_key] = new_icon
-        #
-        # # TODO: This can by quite hard to process. Find a better approach for this
-        # all_widgets = self.findChildren(QWidget)
-        # for w in all_widgets:
-        #     if hasattr(w, 'setIcon'):
-        #         try:
-        #             curr_icon = w.icon()
-        #             curr_icon_key = curr_icon.cacheKey()
-        #             if curr_icon_key not in new_icons_to_apply:
-        #                 continue
-        #             w.setIcon(new_icons_to_apply[curr_icon_key])
-        #         except Exception:
-        #             pass
+        # Update icons taking into account the new theme
+        iconcache.icon_cache().reload_theme(theme.name(), root_widget=self)
 
     # =================================================================================================================
     # INTERNAL
@@ -836,8 +809,8 @@ class DisplayModeButton(buttons.BaseMenuButton, object):
 
         menu_icon_double_names = ['menu_double_empty', 'menu_double_one', 'menu_double_full']
         menu_icon_triple_names = ['menu_triple_empty', 'menu_triple_one', 'menu_triple_two', 'menu_triple_full']
-        self._menu_icon_double = [resources.icon(menu_icon) for menu_icon in menu_icon_double_names]
-        self._menu_icon_triple = [resources.icon(menu_icon) for menu_icon in menu_icon_triple_names]
+        self._menu_icon_double = iconcache.prefetch(menu_icon_double_names)
+        self._menu_icon_triple = iconcache.prefetch(menu_icon_triple_names)
 
         self._current_icon = None
         self._icons = None
@@ -932,8 +905,7 @@ class ToolsetHelpWidget(base.BaseFrame, object):
         # self._description_text.setFrameShape(QFrame.NoFrame)
         self._description_text.setMinimumWidth(200)
         self._description_text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self._gif_label = gif.GifLabel(parent=self)
-        self._gif_label.set_size(256, 256)
+        self._gif_label = gif.GifLabel(parent=self, size=QSize(256, 256))
 
         self.main_layout.addWidget(self._title_label)
         self.main_layout.addWidget(dividers.Divider())
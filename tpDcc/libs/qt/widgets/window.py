@@ -9,8 +9,10 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import uuid
+import inspect
 import logging
-from collections import defaultdict
+import contextlib
+from collections import defaultdict, OrderedDict
 
 from Qt.QtCore import Qt, Signal, QByteArray, QSettings
 from Qt.QtWidgets import QApplication, QSizePolicy, QToolBar, QScrollArea, QMenuBar, QAction, QDockWidget
@@ -21,13 +23,30 @@ from tpDcc.core import dcc as core_dcc
 from tpDcc.managers import resources
 from tpDcc.libs.python import python, path, folder
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import qtutils, animation, statusbar, dragger, resizers
+from tpDcc.libs.qt.core import qtutils, animation, statusbar, dragger, resizers, dispatcher, scheduler
 from tpDcc.libs.qt.core import settings as qt_settings
 from tpDcc.libs.qt.widgets import layouts
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
 
 
+def _get_max_args(fn):
+    """
+    Internal function that returns the maximum number of positional arguments given function accepts
+    :param fn: callable
+    :return: int or None, None if function accepts any number of arguments or if it cannot be inspected
+    """
+
+    try:
+        spec = inspect.getfullargspec(fn) if hasattr(inspect, 'getfullargspec') else inspect.getargspec(fn)
+    except TypeError:
+        return None
+    if spec.varargs:
+        return None
+
+    return len(spec.args) - 1 if inspect.ismethod(fn) else len(spec.args)
+
+
 class WindowContents(QFrame, object):
     """
     Widget that defines the core contents of frameless window
@@ -68,7 +87,9 @@ class BaseWindow(QMainWindow, object):
         self._enable_save_position = True
         self._initial_pos_override = None
         self._signals = defaultdict(list)
+        self._paused_signals = dict()
         self._force_disable_saving = False
+        self._has_stable_id = True
         win_settings = kwargs.pop('settings', None)
         auto_load = kwargs.get('auto_load', True)
 
@@ -79,6 +100,7 @@ class BaseWindow(QMainWindow, object):
                 self.WindowId = window_id
             else:
                 self._force_disable_saving = True
+                self._has_stable_id = False
                 self.WindowId = str(uuid.uuid4())
 
         self.setObjectName(str(self.WindowId))
@@ -347,13 +369,27 @@ class BaseWindow(QMainWindow, object):
     def signal_connect(self, signal, fn, group=None):
         """
         Adds a new signal for the given group
+        Function is connected through a slot that skips (or queues) the call while the group is paused, so pausing
+        a group does not need to disconnect and reconnect its signals
         :param signal:
         :param fn:
         :param group:
         """
 
-        self._signals[group].append((signal, fn))
-        signal.connect(fn)
+        max_args = _get_max_args(fn)
+
+        def _slot(*args):
+            if max_args is not None:
+                args = args[:max_args]
+            paused = self._paused_signals.get(group)
+            if paused is None:
+                return fn(*args)
+            if paused['replay']:
+                paused['payloads'].pop(_slot, None)
+                paused['payloads'][_slot] = (fn, args)
+
+        self._signals[group].append((signal, fn, _slot))
+        signal.connect(_slot)
 
         return fn
 
@@ -365,34 +401,81 @@ class BaseWindow(QMainWindow, object):
         """
 
         signals = list()
-        for (signal, fn) in self._signals.pop(group, list()):
+        for (signal, fn, slot) in self._signals.pop(group, list()):
             try:
-                signal.disconnect(fn)
+                signal.disconnect(slot)
             except RuntimeError:
                 pass
             else:
                 signals.append((signal, fn))
+        paused = self._paused_signals.get(group)
+        if paused:
+            paused['payloads'].clear()
 
         return signals
 
-    def signal_pause(self, *groups):
+    def is_signal_group_paused(self, group):
         """
-        Pauses a certain set of signals during execution
-        :param groups: list
+        Returns whether given signal group is paused
+        :param group:
+        :return: bool
         """
 
-        if not groups:
-            groups = self._signals
+        return group in self._paused_signals
 
-        signal_cache = dict()
+    def pause_signal_groups(self, *groups, **kwargs):
+        """
+        Pauses the given signal groups. While paused, group functions are not called
+        Pauses can be nested: a group is resumed once it has been resumed as many times as it was paused
+        :param groups: list, if not given, all groups are paused
+        :param replay: bool, if True, the last call of each function is stored and executed when the group is resumed
+        :return: list, paused groups
+        """
+
+        replay = kwargs.get('replay', False)
+        groups = groups or tuple(self._signals)
         for group in groups:
-            signal_cache[group] = self.signal_disconnect(group)
+            paused = self._paused_signals.get(group)
+            if paused is None:
+                paused = self._paused_signals[group] = {'count': 0, 'replay': False, 'payloads': OrderedDict()}
+            paused['count'] += 1
+            paused['replay'] = paused['replay'] or replay
+
+        return groups
 
-        yield
+    def resume_signal_groups(self, *groups):
+        """
+        Resumes the given signal groups, executing queued calls if replay was enabled when they were paused
+        :param groups: list, if not given, all paused groups are resumed
+        """
 
+        groups = groups or tuple(self._paused_signals)
         for group in groups:
-            for signal, fn in signal_cache[group]:
-                self.signal_connect(signal, fn, group=group)
+            paused = self._paused_signals.get(group)
+            if paused is None:
+                continue
+            paused['count'] -= 1
+            if paused['count'] > 0:
+                continue
+            self._paused_signals.pop(group)
+            for fn, args in paused['payloads'].values():
+                fn(*args)
+
+    @contextlib.contextmanager
+    def signal_pause(self, *groups, **kwargs):
+        """
+        Context manager that pauses a certain set of signals during execution
+        Connections are kept, so signals are not reordered and no reconnection cost is paid
+        :param groups: list
+        :param replay: bool, if True, the last call of each function is executed when signals are resumed
+        """
+
+        groups = self.pause_signal_groups(*groups, **kwargs)
+        try:
+            yield
+        finally:
+            if groups:
+                self.resume_signal_groups(*groups)
 
     # ============================================================================================================
     # SETTINGS
@@ -718,8 +801,17 @@ class MainWindow(BaseWindow, object):
 
     STATUS_BAR_WIDGET = statusbar.StatusWidget
     DRAGGER_CLASS = dragger.WindowDragger
+    CALLBACK_DISPATCH_MODE = dispatcher.DispatchMode.DIRECT
+    CALLBACK_COALESCE_INTERVAL = dispatcher.DEFAULT_COALESCE_INTERVAL
+
+    # If enabled, closed windows are hidden and kept alive in the window pool so they can be reopened instantly
+    WINDOW_POOL_ENABLED = False
+    # Maximum number of windows and maximum estimated memory (in bytes) kept in the window pool
+    WINDOW_POOL_MAX_COUNT = 5
+    WINDOW_POOL_MAX_COST = 256 * 1024 * 1024
 
     _WINDOW_INSTANCES = dict()
+    _WINDOW_POOL = OrderedDict()
 
     def __init__(self, parent=None, **kwargs):
 
@@ -733,6 +825,11 @@ class MainWindow(BaseWindow, object):
         self._window_loaded = False
         self._window_closed = False
         self._current_docked = None
+        self._callback_dispatch_mode = kwargs.get('callback_dispatch_mode', self.CALLBACK_DISPATCH_MODE)
+        self._callback_coalesce_interval = kwargs.get('callback_coalesce_interval', self.CALLBACK_COALESCE_INTERVAL)
+        self._callback_dispatcher = None
+        self._registered_callbacks = list()
+        self._destroy_on_close = False
 
         super(MainWindow, self).__init__(parent=parent, **kwargs)
 
@@ -760,6 +857,8 @@ class MainWindow(BaseWindow, object):
         }
 
         self.windowReady.connect(lambda: setattr(self, '_window_loaded', True))
+        if self.is_tickable():
+            self.windowReady.connect(lambda: scheduler.frame_scheduler().register(self))
 
         app = QApplication.instance()
         if app:
@@ -783,7 +882,82 @@ class MainWindow(BaseWindow, object):
 
     @classmethod
     def instance(cls, parent=None, **kwargs):
-        pass
+        """
+        Returns the opened window of this class. If the window is in the window pool, it is reused; otherwise a new
+        window is created
+        :param parent: QWidget
+        :return: MainWindow
+        """
+
+        window_id = kwargs.get('id', None) or getattr(cls, 'WindowId', None)
+        if window_id:
+            inst = cls._WINDOW_INSTANCES.get(window_id)
+            if inst is not None:
+                return inst['window']
+            pooled_window = cls.reuse_pooled_window(window_id)
+            if pooled_window is not None:
+                return pooled_window
+
+        return cls(parent=parent, **kwargs)
+
+    @classmethod
+    def reuse_pooled_window(cls, window_id):
+        """
+        Removes the window with given ID from the window pool and reattaches it
+        :param window_id: str
+        :return: MainWindow or None
+        """
+
+        window = MainWindow._WINDOW_POOL.pop(window_id, None)
+        if window is None:
+            return None
+
+        try:
+            window.reattach()
+        except RuntimeError as exc:
+            LOGGER.error('Error while reusing pooled window: {} | {}'.format(window_id, exc))
+            return None
+
+        return window
+
+    @classmethod
+    def pooled_window_ids(cls):
+        """
+        Returns the IDs of the windows in the window pool, from the least to the most recently used
+        :return: list(str)
+        """
+
+        return list(MainWindow._WINDOW_POOL.keys())
+
+    @classmethod
+    def clear_window_pool(cls):
+        """
+        Destroys all windows in the window pool
+        """
+
+        while MainWindow._WINDOW_POOL:
+            _, window = MainWindow._WINDOW_POOL.popitem(last=False)
+            window.destroy_pooled()
+
+    @classmethod
+    def _add_to_window_pool(cls, window):
+        """
+        Internal function that adds given window to the window pool evicting least recently used windows if pool
+        limits are exceeded
+        :param window: MainWindow
+        """
+
+        MainWindow._WINDOW_POOL.pop(window.WindowId, None)
+        MainWindow._WINDOW_POOL[window.WindowId] = window
+
+        total_cost = sum(pooled_window.pool_cost() for pooled_window in MainWindow._WINDOW_POOL.values())
+        while MainWindow._WINDOW_POOL:
+            too_many = len(MainWindow._WINDOW_POOL) > MainWindow.WINDOW_POOL_MAX_COUNT
+            if not too_many and total_cost <= MainWindow.WINDOW_POOL_MAX_COST:
+                break
+            _, evicted_window = MainWindow._WINDOW_POOL.popitem(last=False)
+            total_cost -= evicted_window.pool_cost()
+            evicted_window.destroy_pooled()
 
     @classmethod
     def clear_window_instance(cls, window_id):
@@ -824,8 +998,18 @@ class MainWindow(BaseWindow, object):
 
         super(MainWindow, self).showEvent(event)
 
+        # Callbacks received while the window was hidden are delivered now
+        if self._callback_dispatcher:
+            self._callback_dispatcher.flush()
+
     def closeEvent(self, event):
+        if self.can_be_pooled() and not self._destroy_on_close:
+            event.ignore()
+            self.release_to_pool()
+            return
+
         self._window_closed = True
+        scheduler.frame_scheduler().unregister(self)
         self.unregister_callbacks()
         self.clear_window_instance(self.WindowId)
         super(MainWindow, self).closeEvent(event)
@@ -916,6 +1100,8 @@ class MainWindow(BaseWindow, object):
     def register_callback(self, callback_type, fn):
         """
         Registers the given callback with the given function
+        Function is called through the window callback dispatcher. In coalesce dispatch mode, callbacks of the same
+        type are merged within the coalesce interval and they are not delivered while the window is hidden
         :param callback_type: tpDcc.DccCallbacks
         :param fn: Python function to be called when callback is emitted
         """
@@ -928,15 +1114,92 @@ class MainWindow(BaseWindow, object):
             return
 
         from tpDcc.managers import callbacks
-        return callbacks.CallbacksManager().register(callback_type=callback_type, fn=fn, owner=self)
+        self._registered_callbacks.append((callback_type, fn))
+        dispatch_fn = self.callback_dispatcher().wrap(callback_type, fn)
+        return callbacks.CallbacksManager().register(callback_type=callback_type, fn=dispatch_fn, owner=self)
+
+    def unregister_callback(self, callback_type, fn):
+        """
+        Unregisters the given callback function
+        :param callback_type: tpDcc.DccCallbacks
+        :param fn: Python function given when the callback was registered
+        """
+
+        if type(callback_type) in [list, tuple]:
+            callback_type = callback_type[0]
+
+        self._registered_callbacks = [
+            registered for registered in self._registered_callbacks if registered != (callback_type, fn)]
+        if not self._callback_dispatcher:
+            return
+        dispatch_fn = self._callback_dispatcher.unwrap(callback_type, fn)
+        if dispatch_fn is None:
+            return
+
+        from tpDcc.managers import callbacks
+        callbacks.CallbacksManager().unregister(callback_type=callback_type, fn=dispatch_fn)
 
     def unregister_callbacks(self):
         """
         Unregisters all callbacks registered by this window
         """
 
+        self._detach_callbacks()
+        self._registered_callbacks = list()
+
+    def _detach_callbacks(self):
+        """
+        Internal function that disconnects registered callbacks from DCC without forgetting them
+        """
+
         from tpDcc.managers import callbacks
         callbacks.CallbacksManager().unregister_owner_callbacks(owner=self)
+        if self._callback_dispatcher:
+            self._callback_dispatcher.clear()
+
+    def _attach_callbacks(self):
+        """
+        Internal function that connects again the callbacks that were registered before detaching them
+        """
+
+        registered_callbacks = self._registered_callbacks
+        self._registered_callbacks = list()
+        for callback_type, fn in registered_callbacks:
+            self.register_callback(callback_type, fn)
+
+    def callback_dispatcher(self):
+        """
+        Returns dispatcher used to deliver registered DCC callbacks
+        :return: CallbackDispatcher
+        """
+
+        if self._callback_dispatcher is None:
+            self._callback_dispatcher = dispatcher.CallbackDispatcher(
+                widget=self, mode=self._callback_dispatch_mode, interval=self._callback_coalesce_interval, parent=self)
+
+        return self._callback_dispatcher
+
+    def set_callback_dispatch_mode(self, mode, interval=None):
+        """
+        Sets how registered DCC callbacks are delivered
+        :param mode: str, dispatcher.DispatchMode
+        :param interval: int or None, coalesce interval in milliseconds
+        """
+
+        self._callback_dispatch_mode = mode
+        if interval is not None:
+            self._callback_coalesce_interval = interval
+        callback_dispatcher = self.callback_dispatcher()
+        callback_dispatcher.interval = self._callback_coalesce_interval
+        callback_dispatcher.mode = mode
+
+    def callback_stats(self):
+        """
+        Returns delivery statistics of registered callbacks sorted by total delivery time
+        :return: list(dict)
+        """
+
+        return self._callback_dispatcher.stats() if self._callback_dispatcher else list()
 
     # ============================================================================================================
     # BASE
@@ -945,18 +1208,107 @@ class MainWindow(BaseWindow, object):
     def tick(self, delta_seconds, *args, **kwargs):
         """
         Function that is called taking into account DCC delta seconds
+        If overridden, window is ticked by the global frame scheduler while it is visible
         NOTE: This function MUST be override if necessary in each DCC, by default it does nothing
-        :param delta_seconds: float
+        :param delta_seconds: float, seconds elapsed since the previous tick
         :param args:
         :param kwargs:
         :return:
         """
 
-        # TODO: We can use QTimers to setup a tick and use QApplication event loop
-        # TODO: I do not want to force the creation of a QTimer, so for now we implement this for each DCC
+        pass
+
+    def can_be_pooled(self):
+        """
+        Returns whether the window can be kept in the window pool when it is closed
+        Only windows with a stable WindowId can be pooled, because windows are found in the pool by their ID
+        :return: bool
+        """
+
+        return self.WINDOW_POOL_ENABLED and self._has_stable_id
+
+    def release_to_pool(self):
+        """
+        Hides the window and keeps it alive in the window pool instead of destroying it
+        Window is detached from DCC callbacks and frame scheduler until it is reused. Windows that cannot be pooled
+        are closed and destroyed instead
+        """
+
+        if not self._has_stable_id:
+            LOGGER.debug('Window "{}" has no WindowId and cannot be pooled. Closing it ...'.format(self.WindowId))
+            self._destroy_on_close = True
+            self.close()
+            return
+
+        self._window_closed = True
+        scheduler.frame_scheduler().unregister(self)
+        self._detach_callbacks()
+        self.save_settings()
+        self.clear_window_instance(self.WindowId)
+        self.hide()
+        self.closed.emit()
+        self.pool_released()
+        MainWindow._add_to_window_pool(self)
+
+    def reattach(self):
+        """
+        Reattaches a pooled window so it can be shown again
+        Frame scheduler ticking is restored once the window is shown
+        """
+
+        self._window_closed = False
+        MainWindow._WINDOW_INSTANCES[self.WindowId] = {
+            'window': self
+        }
+        self._attach_callbacks()
+        self.pool_reused()
+
+    def destroy_pooled(self):
+        """
+        Destroys a window that is not needed anymore by the window pool
+        """
+
+        try:
+            self._destroy_on_close = True
+            self.unregister_callbacks()
+            self.setParent(None)
+            self.deleteLater()
+        except RuntimeError:
+            pass
+
+    def pool_cost(self):
+        """
+        Returns an estimation of the memory (in bytes) used by this window while it is kept in the window pool
+        Override in derived classes that hold big resources (images, caches, etc)
+        :return: int
+        """
+
+        return self.width() * self.height() * 4 + len(self.findChildren(QWidget)) * 1024
+
+    def pool_released(self):
+        """
+        Function that is called when the window is closed and kept in the window pool
+        Override in derived classes to release resources that should not be kept while the window is hidden
+        """
+
+        pass
+
+    def pool_reused(self):
+        """
+        Function that is called when a pooled window is reused
+        Override in derived classes to refresh window state before it is shown again
+        """
 
         pass
 
+    def is_tickable(self):
+        """
+        Returns whether this window overrides tick function and should be ticked by the frame scheduler
+        :return: bool
+        """
+
+        return getattr(type(self).tick, '__code__', None) is not getattr(MainWindow.tick, '__code__', None)
+
     def exists(self):
         """
         Returns whether or not this window exists